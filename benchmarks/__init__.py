@@ -0,0 +1 @@
+"""Benchmarks for the daily_schedule component."""
@@ -0,0 +1,83 @@
+"""Global fixtures for the benchmarks."""
+
+from __future__ import annotations
+
+import json
+import platform
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from homeassistant.const import __version__ as HA_VERSION  # noqa: N812
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+RESULTS: dict[str, dict[str, Any]] = {}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the option of writing the results to a JSON file."""
+    parser.addoption(
+        "--benchmark-json",
+        metavar="PATH",
+        help="write the benchmark results to a JSON file",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _auto_enable_custom_integrations(enable_custom_integrations: bool) -> None:  # noqa: ARG001, FBT001
+    """Enable loading custom components."""
+    return
+
+
+@pytest.fixture(autouse=True)
+async def _auto_set_location_and_time_zone(hass: HomeAssistant) -> None:
+    """Use the same location and time zone as the tests."""
+    hass.config.latitude = 32.072
+    hass.config.longitude = 34.879
+    await hass.config.async_set_time_zone("Asia/Jerusalem")
+
+
+@pytest.fixture
+def report(request: pytest.FixtureRequest) -> Any:
+    """Return a function recording the results of the current benchmark."""
+
+    def _report(**results: Any) -> None:
+        RESULTS.setdefault(request.node.name, {}).update(results)
+
+    return _report
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    """Print the benchmark results."""
+    if not RESULTS:
+        return
+    terminalreporter.section("benchmark results")
+    for name, results in RESULTS.items():
+        terminalreporter.write_line(
+            f"{name}: "
+            + ", ".join(f"{key}={value:.3g}" for key, value in results.items())
+        )
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Write the benchmark results to a JSON file (if requested)."""
+    if not (path := session.config.getoption("--benchmark-json")):
+        return
+    Path(path).write_text(
+        json.dumps(
+            {
+                "environment": {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "homeassistant": HA_VERSION,
+                },
+                "results": RESULTS,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
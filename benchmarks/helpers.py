@@ -0,0 +1,65 @@
+"""Shared helpers for the benchmarks."""
+
+from __future__ import annotations
+
+import datetime
+import timeit
+from typing import TYPE_CHECKING, Any
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.daily_schedule.const import (
+    CONF_FROM,
+    CONF_SCHEDULE,
+    CONF_TO,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+DAY_SECONDS = 86400
+
+
+def measure(func: Callable[[], Any], number: int = 100, repeat: int = 5) -> float:
+    """Return the best average duration (in seconds) of a single call."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def make_schedule(count: int) -> list[dict[str, Any]]:
+    """Create a schedule of non-overlapping ranges spread across the day."""
+    step = DAY_SECONDS // count
+    midnight = datetime.datetime(2000, 1, 1)  # noqa: DTZ001
+    return [
+        {
+            CONF_FROM: (midnight + datetime.timedelta(seconds=index * step))
+            .time()
+            .isoformat(),
+            CONF_TO: (midnight + datetime.timedelta(seconds=index * step + step // 2))
+            .time()
+            .isoformat(),
+        }
+        for index in range(count)
+    ]
+
+
+async def setup_entities(
+    hass: HomeAssistant, count: int, schedule: list[dict[str, Any]]
+) -> None:
+    """Create entities by adding config entries with the same schedule."""
+    for index in range(count):
+        config_entry = MockConfigEntry(
+            options={CONF_SCHEDULE: schedule}, domain=DOMAIN, title=f"test {index}"
+        )
+        config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def async_cleanup(hass: HomeAssistant) -> None:
+    """Delete all config entries."""
+    for config_entry in hass.config_entries.async_entries(DOMAIN):
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
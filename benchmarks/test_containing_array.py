@@ -0,0 +1,41 @@
+"""Benchmark of evaluating a schedule over a year of minutes."""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Any
+
+import homeassistant.util.dt as dt_util
+import numpy as np
+import pytest
+
+from custom_components.daily_schedule.schedule import Schedule
+
+from .helpers import make_schedule, measure
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+@pytest.mark.parametrize("count", [1, 10, 100])
+def test_containing_array(hass: HomeAssistant, report: Any, count: int) -> None:
+    """Compare the vectorized evaluation with calling containing per minute."""
+    schedule = Schedule(hass, make_schedule(count), skip_reversed=False)
+    start = int(datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC).timestamp())
+    seconds = np.arange(start, start + 365 * 86400, 60, dtype=np.int64)
+    time_zone = dt_util.get_default_time_zone()
+    sample = seconds[::97].tolist()
+
+    def loop() -> list[bool]:
+        return [
+            schedule.containing(
+                datetime.datetime.fromtimestamp(value, time_zone).time()
+            )
+            for value in sample
+        ]
+
+    assert schedule.containing_array(sample).tolist() == loop()
+
+    array_time = measure(lambda: schedule.containing_array(seconds), number=3)
+    loop_time = measure(loop, number=3) * len(seconds) / len(sample)
+    report(minutes=len(seconds), array_ms=array_time * 1e3, loop_ms=loop_time * 1e3)
@@ -0,0 +1,96 @@
+"""Benchmark and differential test of the DST handling around transitions."""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Any
+
+import homeassistant.util.dt as dt_util
+import pytest
+
+from custom_components.daily_schedule.dst import dst_transitions
+from custom_components.daily_schedule.schedule import Schedule
+
+from .helpers import make_schedule, measure
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+MINUTE = datetime.timedelta(minutes=1)
+
+
+class SteppingSchedule(Schedule):
+    """The previous implementation: stepping one minute at a time."""
+
+    def _handle_dst(
+        self, date: datetime.datetime, result: datetime.datetime
+    ) -> datetime.datetime:
+        """Handle DST transitions."""
+        if result.tzinfo is not None and result != result.astimezone(
+            datetime.UTC
+        ).astimezone(result.tzinfo):
+            result = result.replace(second=0, microsecond=0)
+            while result != result.astimezone(datetime.UTC).astimezone(result.tzinfo):
+                result += MINUTE
+            return result
+        return super()._handle_dst(date, result)
+
+    def _fold1_start(
+        self, date: datetime.datetime, upper_bound: datetime.datetime
+    ) -> datetime.datetime | None:
+        """Get the beginning of "fold=1" time range for the given date."""
+        transition = date.replace(second=0, microsecond=0)
+        old_offset = date.utcoffset()
+        while (new_offset := transition.utcoffset()) == old_offset:
+            transition += MINUTE
+            if transition > upper_bound:
+                return None
+        assert old_offset is not None
+        assert new_offset is not None
+        return (transition + new_offset - old_offset).replace(fold=1)
+
+
+def starts(time_zone: str) -> list[datetime.datetime]:
+    """Return local times around each of the 2025 transitions of the zone."""
+    tzinfo = dt_util.get_time_zone(time_zone)
+    assert tzinfo is not None
+    return [
+        (
+            transition.instant.replace(tzinfo=datetime.UTC)
+            + datetime.timedelta(minutes=minutes)
+        ).astimezone(tzinfo)
+        for transition in dst_transitions(tzinfo, 2025)
+        for minutes in range(-12 * 60, 3 * 60, 7)
+    ]
+
+
+@pytest.mark.parametrize(
+    "time_zone",
+    [
+        "America/New_York",
+        "Europe/London",
+        "Asia/Jerusalem",
+        "Australia/Sydney",
+        "Australia/Lord_Howe",
+        "America/Santiago",
+    ],
+)
+def test_dst(hass: HomeAssistant, report: Any, time_zone: str) -> None:
+    """Compare next_updates across the DST transitions with the previous code."""
+    config = make_schedule(72)
+    schedule = Schedule(hass, config, skip_reversed=False)
+    stepping = SteppingSchedule(hass, config, skip_reversed=False)
+    dates = starts(time_zone)
+    for date in dates:
+        assert schedule.next_updates(date, 10) == stepping.next_updates(date, 10)
+
+    def run(schedule: Schedule) -> None:
+        for date in dates:
+            schedule.next_updates(date, 10)
+
+    table_time = measure(lambda: run(schedule), number=1, repeat=3)
+    stepping_time = measure(lambda: run(stepping), number=1, repeat=3)
+    report(
+        table_us=table_time / len(dates) * 1e6,
+        stepping_us=stepping_time / len(dates) * 1e6,
+    )
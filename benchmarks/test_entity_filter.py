@@ -0,0 +1,68 @@
+"""Benchmark of the entity filtering of the triggers and conditions."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.daily_schedule.const import DOMAIN
+from custom_components.daily_schedule.entity_filter import DailyScheduleEntityFilter
+
+from .helpers import measure
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+ENTITIES = 10000
+
+
+class RegistryFilter:
+    """The previous implementation: a registry lookup of each entity."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the object."""
+        self._hass = hass
+
+    def entity_filter(self, entities: set[str]) -> set[str]:
+        """Filter entities to those created by this integration."""
+        registry = er.async_get(self._hass)
+        return {
+            entity_id
+            for entity_id in entities
+            if (entry := registry.async_get(entity_id)) is not None
+            and entry.platform == DOMAIN
+            and entry.domain == BINARY_SENSOR_DOMAIN
+        }
+
+
+class IndexFilter(DailyScheduleEntityFilter):
+    """The current implementation."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the object."""
+        self._hass = hass
+
+
+async def test_entity_filter(hass: HomeAssistant, report: Any) -> None:
+    """Filter a target which expands to many entities (e.g. an area or a label)."""
+    registry = er.async_get(hass)
+    # A tenth of the targeted entities are daily schedules.
+    entities = {
+        registry.async_get_or_create(
+            BINARY_SENSOR_DOMAIN,
+            DOMAIN if index % 10 == 0 else "other",
+            str(index),
+        ).entity_id
+        for index in range(ENTITIES)
+    }
+    registry_filter = RegistryFilter(hass)
+    index_filter = IndexFilter(hass)
+    assert index_filter.entity_filter(entities) == registry_filter.entity_filter(
+        entities
+    )
+
+    registry_time = measure(lambda: registry_filter.entity_filter(entities), number=10)
+    index_time = measure(lambda: index_filter.entity_filter(entities), number=10)
+    report(registry_ms=registry_time * 1e3, index_ms=index_time * 1e3)
@@ -0,0 +1,68 @@
+"""Benchmark of the schedule construction and of the dynamic rebuild."""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from custom_components.daily_schedule.const import CONF_FROM, CONF_TO
+from custom_components.daily_schedule.schedule import Schedule
+
+from .helpers import make_schedule, measure
+from .test_schedule_normalize import random_schedule
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+COUNTS = [1, 10, 100, 1000, 10000]
+
+
+@pytest.mark.parametrize("count", COUNTS)
+def test_construction(hass: HomeAssistant, report: Any, count: int) -> None:
+    """Measure the construction of disjoint and of overlapping schedules."""
+    disjoint = make_schedule(count)
+    overlapping = random_schedule(random.Random(count), count, 3600)  # noqa: S311
+    number = max(1, 1000 // count)
+    report(
+        disjoint_us=measure(
+            lambda: Schedule(hass, disjoint, skip_reversed=False), number=number
+        )
+        * 1e6,
+        overlapping_us=measure(
+            lambda: Schedule(hass, overlapping, skip_reversed=False), number=number
+        )
+        * 1e6,
+    )
+
+
+@pytest.mark.parametrize("count", COUNTS[:-1])
+def test_dynamic_rebuild(hass: HomeAssistant, report: Any, count: int) -> None:
+    """Compare re-resolving the sunrise/sunset ranges with a full rebuild."""
+    config = [
+        *make_schedule(count),
+        {CONF_FROM: "↑-30", CONF_TO: "↑+30"},
+        {CONF_FROM: "↓-30", CONF_TO: "↓+30"},
+    ]
+    schedule = Schedule(hass, config, skip_reversed=False)
+    serialized = schedule.to_list()
+    number = max(1, 1000 // count)
+    # The first resolution plans the following days, which are then reused.
+    plan_time = measure(
+        lambda: Schedule(hass, serialized, skip_reversed=False).resolve(hass),
+        number=number,
+    )
+    resolve_time = measure(lambda: schedule.resolve(hass), number=number)
+    rebuild_time = measure(
+        lambda: Schedule(hass, serialized, skip_reversed=False), number=number
+    )
+    assert (
+        schedule.to_list_absolute()
+        == Schedule(hass, serialized, skip_reversed=False).to_list_absolute()
+    )
+    report(
+        resolve_us=resolve_time * 1e6,
+        rebuild_us=rebuild_time * 1e6,
+        plan_us=plan_time * 1e6,
+    )
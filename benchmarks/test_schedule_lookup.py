@@ -0,0 +1,102 @@
+"""Benchmark of the schedule lookups (containing and next_update)."""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from custom_components.daily_schedule.const import CONF_FROM, CONF_TO
+from custom_components.daily_schedule.schedule import MIDNIGHT, Schedule, TimeRange
+
+from .helpers import DAY_SECONDS, make_schedule, measure
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+class LinearLookup:
+    """The previous implementation: a linear scan over datetime.time objects."""
+
+    def __init__(self, schedule: Schedule) -> None:
+        """Build the lookup tables from the effective schedule."""
+        self._schedule = [
+            TimeRange(
+                datetime.time.fromisoformat(time_range[CONF_FROM]),
+                datetime.time.fromisoformat(time_range[CONF_TO]),
+            )
+            for time_range in schedule.to_list_absolute()
+        ]
+        self._to_on = [time_range.from_ for time_range in self._schedule]
+        self._to_off = [time_range.to for time_range in self._schedule]
+        if self._schedule and self._to_on[0] == self._to_off[-1]:
+            self._to_on.pop(0)
+            self._to_off.pop(-1)
+        self._to_on.sort()
+        self._to_off.sort()
+
+    def containing(self, time: datetime.time) -> bool:
+        """Check if the time is inside the range."""
+        return any(time_range.containing(time) for time_range in self._schedule)
+
+    def next_update(self, date: datetime.datetime) -> datetime.datetime | None:
+        """Calculate the next toggle (no DST handling)."""
+        if not self._schedule:
+            return None
+        if not (
+            timestamps := self._to_off if self.containing(date.time()) else self._to_on
+        ):
+            return None
+        time = date.time()
+        prev = MIDNIGHT
+        for current in timestamps:
+            if prev <= time < current:
+                return datetime.datetime.combine(date.date(), current)
+            prev = current
+        return datetime.datetime.combine(
+            date.date() + datetime.timedelta(days=1), timestamps[0]
+        )
+
+
+@pytest.mark.parametrize("count", [1, 10, 100, 500, 1000])
+def test_lookup(hass: HomeAssistant, report: Any, count: int) -> None:
+    """Compare the binary search lookups with the linear scan."""
+    schedule = Schedule(hass, make_schedule(count), skip_reversed=False)
+    linear = LinearLookup(schedule)
+    midnight = datetime.datetime(2000, 1, 1)  # noqa: DTZ001
+    dates = [
+        midnight + datetime.timedelta(seconds=second)
+        for second in range(0, DAY_SECONDS, 97)
+    ]
+
+    for date in dates:
+        assert schedule.containing(date.time()) == linear.containing(date.time())
+        assert schedule.next_update(date) == linear.next_update(date)
+
+    def bisect_containing() -> None:
+        for date in dates:
+            schedule.containing(date.time())
+
+    def linear_containing() -> None:
+        for date in dates:
+            linear.containing(date.time())
+
+    def bisect_lookup() -> None:
+        for date in dates:
+            schedule.next_update(date)
+
+    def linear_lookup() -> None:
+        for date in dates:
+            linear.next_update(date)
+
+    bisect_containing_time = measure(bisect_containing, number=5) / len(dates)
+    linear_containing_time = measure(linear_containing, number=5) / len(dates)
+    bisect_time = measure(bisect_lookup, number=5) / len(dates)
+    linear_time = measure(linear_lookup, number=5) / len(dates)
+    report(
+        containing_bisect_us=bisect_containing_time * 1e6,
+        containing_linear_us=linear_containing_time * 1e6,
+        bisect_us=bisect_time * 1e6,
+        linear_us=linear_time * 1e6,
+    )
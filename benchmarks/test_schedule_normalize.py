@@ -0,0 +1,37 @@
+"""Benchmark of the schedule normalization (merge)."""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from custom_components.daily_schedule.schedule import Schedule
+from tests.test_schedule import random_schedule, reference_normalize
+
+from .helpers import DAY_SECONDS, measure
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+@pytest.mark.parametrize("max_length", [60, 3600, DAY_SECONDS])
+def test_normalize(hass: HomeAssistant, report: Any, max_length: int) -> None:
+    """Compare the construction time of 10k-range schedules."""
+    generator = random.Random(max_length)  # noqa: S311
+    schedule = random_schedule(generator, 10000, max_length)
+    assert Schedule(hass, schedule, skip_reversed=False).to_list_absolute() == [
+        time_range.to_dict()
+        for time_range in reference_normalize(hass, schedule, skip_reversed=False)
+    ]
+
+    sweep_time = measure(
+        lambda: Schedule(hass, schedule, skip_reversed=False), number=1, repeat=3
+    )
+    quadratic_time = measure(
+        lambda: reference_normalize(hass, schedule, skip_reversed=False),
+        number=1,
+        repeat=3,
+    )
+    report(sweep_ms=sweep_time * 1e3, quadratic_ms=quadratic_time * 1e3)
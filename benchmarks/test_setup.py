@@ -0,0 +1,37 @@
+"""Benchmark of the end-to-end setup of many config entries."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from custom_components.daily_schedule.const import CONF_FROM, CONF_TO
+
+from .helpers import async_cleanup, setup_entities
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+@pytest.mark.parametrize("count", [10, 100, 1000])
+async def test_setup(hass: HomeAssistant, report: Any, count: int) -> None:
+    """Measure the setup and the unload of the config entries."""
+    schedule = [
+        {CONF_FROM: "07:00", CONF_TO: "09:00"},
+        {CONF_FROM: "↓-30", CONF_TO: "23:00"},
+    ]
+    start = time.perf_counter()
+    await setup_entities(hass, count, schedule)
+    setup = time.perf_counter() - start
+    assert len(hass.states.async_entity_ids("binary_sensor")) == count
+
+    start = time.perf_counter()
+    await async_cleanup(hass)
+    unload = time.perf_counter() - start
+    report(
+        setup_ms=setup * 1e3,
+        per_entry_ms=setup / count * 1e3,
+        unload_ms=unload * 1e3,
+    )
@@ -0,0 +1,109 @@
+"""Benchmark of the entity state reads (e.g. by state writes and the recorder)."""
+
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING, Any
+
+import homeassistant.util.dt as dt_util
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import callback
+from homeassistant.helpers.json import json_bytes
+
+from custom_components.daily_schedule.const import DOMAIN
+from custom_components.daily_schedule.schedule import Schedule
+
+from .helpers import async_cleanup, make_schedule, measure, setup_entities
+
+if TYPE_CHECKING:
+    from homeassistant.core import Event, EventStateChangedData, HomeAssistant
+
+ENTITIES = 1000
+RANGES = 100
+# Other entities whose states are written between the reads.
+LOAD_ENTITIES = 100
+
+
+async def test_state_reads(hass: HomeAssistant, report: Any) -> None:
+    """Compare the cached state with calculating it on each read."""
+    await setup_entities(hass, ENTITIES, make_schedule(RANGES))
+    entities = [
+        config_entry.runtime_data.entity
+        for config_entry in hass.config_entries.async_entries(DOMAIN)
+    ]
+    schedule = Schedule(hass, make_schedule(RANGES), skip_reversed=False)
+
+    def read_cached() -> None:
+        for entity in entities:
+            _ = entity.state
+
+    def read_calculated() -> None:
+        # The previous implementation of "is_on".
+        for _ in entities:
+            schedule.containing(dt_util.now().time())
+
+    def write() -> None:
+        for entity in entities:
+            entity.async_write_ha_state()
+
+    cached_time = measure(read_cached, number=10)
+    calculated_time = measure(read_calculated, number=10)
+    write_time = measure(write, number=1)
+    report(
+        cached_read_us=cached_time / ENTITIES * 1e6,
+        calculated_read_us=calculated_time / ENTITIES * 1e6,
+        write_us=write_time / ENTITIES * 1e6,
+    )
+    await async_cleanup(hass)
+
+
+async def test_state_reads_busy_recorder(hass: HomeAssistant, report: Any) -> None:
+    """Measure the state reads between state writes which are recorded."""
+    await setup_entities(hass, ENTITIES, make_schedule(RANGES))
+    entities = [
+        config_entry.runtime_data.entity
+        for config_entry in hass.config_entries.async_entries(DOMAIN)
+    ]
+    schedule = Schedule(hass, make_schedule(RANGES), skip_reversed=False)
+    recorded = 0
+
+    @callback
+    def record(event: Event[EventStateChangedData]) -> None:
+        # Like the recorder, serialize each new state.
+        nonlocal recorded
+        if (state := event.data["new_state"]) is not None:
+            json_bytes(state.as_dict())
+            recorded += 1
+
+    unsubscribe = hass.bus.async_listen(EVENT_STATE_CHANGED, record)
+    values = itertools.count()
+
+    def write_load() -> None:
+        # A state write (of another entity) for each read.
+        for index in range(ENTITIES):
+            hass.states.async_set(f"sensor.load_{index % LOAD_ENTITIES}", next(values))
+
+    def read_cached() -> None:
+        for index, entity in enumerate(entities):
+            hass.states.async_set(f"sensor.load_{index % LOAD_ENTITIES}", next(values))
+            _ = entity.state
+
+    def read_calculated() -> None:
+        # The previous implementation of "is_on".
+        for index in range(ENTITIES):
+            hass.states.async_set(f"sensor.load_{index % LOAD_ENTITIES}", next(values))
+            schedule.containing(dt_util.now().time())
+
+    load_time = measure(write_load, number=1)
+    cached_time = measure(read_cached, number=1)
+    calculated_time = measure(read_calculated, number=1)
+    await hass.async_block_till_done()
+    unsubscribe()
+    # Each write was recorded (3 measurements of 5 repeats each).
+    assert recorded == 3 * 5 * ENTITIES
+    report(
+        load_write_us=load_time / ENTITIES * 1e6,
+        cached_read_us=(cached_time - load_time) / ENTITIES * 1e6,
+        calculated_read_us=(calculated_time - load_time) / ENTITIES * 1e6,
+    )
+    await async_cleanup(hass)
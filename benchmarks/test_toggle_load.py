@@ -0,0 +1,69 @@
+"""Load test of many entities toggling at the same time."""
+
+from __future__ import annotations
+
+import datetime
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_ON
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.daily_schedule.const import CONF_FROM, CONF_TO
+from custom_components.daily_schedule.scheduler import (
+    ToggleScheduler,
+    async_get_scheduler,
+)
+
+from .helpers import async_cleanup, setup_entities
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import Event, HomeAssistant
+
+ENTITIES = 5000
+
+
+@pytest.mark.parametrize("batch_writes", [True, False], ids=["batched", "unbatched"])
+async def test_toggle_load(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    report: Any,
+    batch_writes: bool,  # noqa: FBT001
+) -> None:
+    """Measure the event loop occupancy of a 07:00 toggle of many entities."""
+    freezer.move_to("2025-03-12T06:59:00+02:00")
+    await setup_entities(hass, ENTITIES, [{CONF_FROM: "07:00", CONF_TO: "22:00"}])
+
+    changes: list[Event] = []
+    hass.bus.async_listen(EVENT_STATE_CHANGED, changes.append)
+
+    # The CPU time of the event loop thread (wall clock is frozen by the freezer).
+    freezer.tick(datetime.timedelta(minutes=1))
+    with (
+        nullcontext()
+        if batch_writes
+        # Each entity writes its state right away.
+        else patch.object(ToggleScheduler, "async_write", lambda _, write: write())
+    ):
+        start = time.thread_time()
+        async_fire_time_changed(hass)  # Runs the due timer callbacks synchronously.
+        dispatch = time.thread_time() - start
+        await hass.async_block_till_done()
+        total = time.thread_time() - start
+
+    assert len(changes) == ENTITIES
+    assert all(event.data["new_state"].state == STATE_ON for event in changes)
+    scheduler = async_get_scheduler(hass).as_dict()
+    assert scheduler["wakeups"] == 1
+    report(
+        dispatch_ms=dispatch * 1e3,
+        total_ms=total * 1e3,
+        per_entity_us=total / ENTITIES * 1e6,
+        wakeups=scheduler["wakeups"],
+        handles_saved=scheduler["handles_saved"],
+    )
+    await async_cleanup(hass)
@@ -7,8 +7,10 @@ from typing import TYPE_CHECKING, Final
 import homeassistant.helpers.config_validation as cv
 from homeassistant.const import Platform
 
-from .const import DOMAIN
+from .const import CONF_SCHEDULE, DOMAIN
 from .custom_card import publish_card
+from .schedule_store import async_get_schedule_store
+from .services import async_setup_services
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -22,6 +24,23 @@ CONFIG_SCHEMA: Final = cv.config_entry_only_config_schema(DOMAIN)
 async def async_setup(hass: HomeAssistant, _: ConfigType) -> bool:
     """Set up custom actions."""
     await publish_card(hass)
+    async_setup_services(hass)
+    return True
+
+
+async def async_migrate_entry(
+    hass: HomeAssistant, entry: DailyScheduleConfigEntry
+) -> bool:
+    """Migrate an old config entry."""
+    if entry.version == 1:
+        # Version 2 moved the schedule from the options to the schedules store.
+        options = dict(entry.options)
+        store = await async_get_schedule_store(hass)
+        # The schedule must be saved before it's removed from the options.
+        await store.async_set(
+            entry.entry_id, options.pop(CONF_SCHEDULE, []), delay=False
+        )
+        hass.config_entries.async_update_entry(entry, options=options, version=2)
     return True
 
 
@@ -52,3 +71,10 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(
         entry, (Platform.BINARY_SENSOR,)
     )
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: DailyScheduleConfigEntry
+) -> None:
+    """Remove the schedule of a removed config entry."""
+    (await async_get_schedule_store(hass)).async_remove(entry.entry_id)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import datetime
+import math
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -10,33 +12,47 @@ import homeassistant.helpers.config_validation as cv
 import homeassistant.util.dt as dt_util
 import voluptuous as vol
 from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_platform
-from homeassistant.helpers import event as event_helper
+from homeassistant.helpers.dispatcher import async_dispatcher_send_internal
 
 from .const import (
     ATTR_EFFECTIVE_SCHEDULE,
     ATTR_NEXT_TOGGLE,
     ATTR_NEXT_TOGGLES,
+    CONF_DELAYED_SAVE,
     CONF_DISABLED,
     CONF_FROM,
+    CONF_REFRESH_WINDOW,
     CONF_SCHEDULE,
     CONF_SKIP_REVERSED,
     CONF_TO,
     CONF_UTC,
     NEXT_TOGGLES_COUNT,
     SERVICE_SET,
+    SIGNAL_TOGGLE,
+    SIGNAL_UPDATE,
     SUNRISE_SYMBOL,
     SUNSET_SYMBOL,
 )
+from .daily_refresh import async_get_daily_refresh
 from .schedule import Schedule
+from .schedule_registry import async_get_schedule_registry
+from .schedule_store import async_get_schedule_store
+from .scheduler import async_get_scheduler
+from .stats import EntityStats
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator, Sequence
 
+    import numpy as np
+    import numpy.typing as npt
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .schedule_store import ScheduleStore
+
 
 @dataclass
 class DailyScheduleRuntimeData:
@@ -96,7 +112,7 @@ async def async_setup_entry(
 ) -> None:
     """Initialize config entry."""
     config_entry.runtime_data = DailyScheduleRuntimeData(
-        DailyScheduleSensor(hass, config_entry)
+        DailyScheduleSensor(hass, config_entry, await async_get_schedule_store(hass))
     )
     async_add_entities([config_entry.runtime_data.entity])
     platform = entity_platform.async_get_current_platform()
@@ -113,23 +129,43 @@ class DailyScheduleSensor(BinarySensorEntity):
         {ATTR_NEXT_TOGGLE, ATTR_NEXT_TOGGLES, ATTR_EFFECTIVE_SCHEDULE, CONF_SCHEDULE}
     )
 
-    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    def __init__(
+        self, hass: HomeAssistant, config_entry: ConfigEntry, store: ScheduleStore
+    ) -> None:
         """Initialize object with defaults."""
         self._hass = hass
         self._config_entry = config_entry
+        self._store = store
         self._attr_unique_id = config_entry.entry_id
         self._unsub_update: Callable[[], None] | None = None
-        self._read_config()
-
-    def _read_config(self) -> None:
-        """Get relevant data from the config entry."""
+        self._next_update: datetime.datetime | None = None
+        # The current state, and until when (a timestamp) it's valid.
+        self._is_on: bool | None = None
+        self._is_on_until = -math.inf
+        self._unsub_refresh: Callable[[], None] | None = None
+        self._toggle: datetime.datetime | None = None
+        # The state, name and attributes which were last written.
+        self._written: tuple[bool, Any, dict[str, Any]] | None = None
+        self.stats = EntityStats()
+        # The schedule is acquired when the entity is added (see "_read_config").
+        self._attr_name = config_entry.title
+        self._added = False
+
+    def _read_config(self, schedule: Schedule | None = None) -> None:
+        """Get relevant data from the config entry and the store."""
         self._attr_name = self._config_entry.title
         self._skip_reversed = self._config_entry.options.get(CONF_SKIP_REVERSED, False)
-        self._schedule: Schedule = Schedule(
-            self._hass,
-            self._config_entry.options.get(CONF_SCHEDULE, []),
+        start = time.perf_counter()
+        self._schedule: Schedule
+        self._schedule, compiled = async_get_schedule_registry(self._hass).acquire(
+            schedule
+            if schedule is not None
+            else self._store.get(self._config_entry.entry_id),
             self._skip_reversed,
         )
+        # An identical schedule (or the one compiled by "async_set") is reused.
+        if compiled:
+            self.stats.add_compilation(time.perf_counter() - start)
         self._attr_extra_state_attributes = {
             CONF_SCHEDULE: self._schedule.to_list(),
             ATTR_EFFECTIVE_SCHEDULE: self._schedule.to_list_absolute(),
@@ -137,10 +173,20 @@ class DailyScheduleSensor(BinarySensorEntity):
         self._is_dynamic = self._schedule.is_dynamic()
         self._utc = self._config_entry.options.get(CONF_UTC, False)
 
-    def config_update(self) -> None:
-        """Handle config entry update."""
-        self._read_config()
-        self._clean_up_listener()
+    @property
+    def is_added(self) -> bool:
+        """Return whether the entity is added (so its schedule was read)."""
+        return self._added
+
+    def config_update(self, schedule: Schedule | None = None) -> None:
+        """Handle config entry (or schedule) update."""
+        if not self._added:
+            return  # E.g. a disabled entity. The config is read when it's added.
+        previous = self._schedule
+        self._read_config(schedule)
+        async_get_schedule_registry(self._hass).release(previous)
+        self._register_refresh()
+        # The timer and the state are kept if nothing changed.
         self._update_state()
 
     def _now(self) -> datetime.datetime:
@@ -150,7 +196,74 @@ class DailyScheduleSensor(BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return True is sensor is on."""
-        return self._schedule.containing(self._now().time())
+        if self._is_on is None or time.time() >= self._is_on_until:
+            # The next update is due (or the state was invalidated).
+            self._cache_is_on(self._next_update)
+        return bool(self._is_on)
+
+    def _cache_is_on(self, next_update: datetime.datetime | None) -> None:
+        """Calculate the state, which is valid until the next update (or midnight)."""
+        now = self._now()
+        if next_update is None or next_update <= now:
+            # The update is due (before its timer fired), so find the one after it.
+            next_update = self._schedule.next_update(now)
+        # The plan of the day is used, even if it's not resolved yet (see the
+        # refresh window), and the next day may have a different plan.
+        self._is_on = self._schedule.containing_at(now)
+        midnight = datetime.datetime.combine(
+            now.date() + datetime.timedelta(days=1), datetime.time(), now.tzinfo
+        )
+        self._is_on_until = min(
+            math.inf if next_update is None else next_update.timestamp(),
+            midnight.timestamp(),
+        )
+
+    def iter_toggles(
+        self, start: datetime.datetime
+    ) -> Iterator[tuple[datetime.datetime, bool]]:
+        """Iterate over the toggles after the start, and the states they switch to."""
+        start = dt_util.as_utc(start) if self._utc else dt_util.as_local(start)
+        for update in self._schedule.iter_updates(start):
+            yield update, self._schedule.containing_at(update)
+
+    def is_on_at(self, date: datetime.datetime) -> bool:
+        """Check if the schedule is on at the (past or future) date and time."""
+        date = dt_util.as_utc(date) if self._utc else dt_util.as_local(date)
+        return self._schedule.planned(self._hass, (date.date(),)).containing_at(date)
+
+    def is_on_array(self, timestamps: Sequence[float]) -> npt.NDArray[np.bool_]:
+        """Check if the schedule is on at each of the timestamps (requires NumPy)."""
+        return self._schedule.containing_array(
+            timestamps, utc=self._utc, hass=self._hass
+        )
+
+    def on_intervals(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> list[tuple[datetime.datetime, datetime.datetime]]:
+        """Return the intervals when the schedule is on, between the start and end."""
+        convert = dt_util.as_utc if self._utc else dt_util.as_local
+        start, end = convert(start), convert(end)
+        # The sunrise and sunset times are of each day (also past ones).
+        schedule = self._schedule.planned(
+            self._hass,
+            (
+                start.date() + datetime.timedelta(days=day)
+                for day in range((end.date() - start.date()).days + 1)
+            ),
+        )
+        intervals = []
+        since = start if schedule.containing_at(start) else None
+        for update in schedule.iter_updates(start):
+            if update >= end:
+                break
+            if schedule.containing_at(update):
+                since = update
+            elif since is not None:
+                intervals.append((since, update))
+                since = None
+        if since is not None:
+            intervals.append((since, end))
+        return intervals
 
     @callback
     def _clean_up_listener(self) -> None:
@@ -159,58 +272,130 @@ class DailyScheduleSensor(BinarySensorEntity):
             self._unsub_update()
             self._unsub_update = None
 
+    @callback
+    def _register_refresh(self) -> None:
+        """Refresh a dynamic schedule daily (to re-resolve sunrise and sunset)."""
+        self._unregister_refresh()
+        if self._is_dynamic:
+            self._unsub_refresh = async_get_daily_refresh(self.hass).async_register(
+                self._config_entry.entry_id,
+                self._config_entry.options.get(CONF_REFRESH_WINDOW, 0),
+                self._update_state,
+                lambda: self._next_update,
+            )
+
+    @callback
+    def _unregister_refresh(self) -> None:
+        """Stop the daily refresh."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    @callback
+    def _release_schedule(self) -> None:
+        """Stop sharing the compiled schedule."""
+        self._added = False
+        async_get_schedule_registry(self._hass).release(self._schedule)
+
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
+        self._read_config()
+        self._added = True
         self.async_on_remove(self._clean_up_listener)
+        self.async_on_remove(self._release_schedule)
+        self.async_on_remove(self._unregister_refresh)
+        self._register_refresh()
         self._update_state()
 
     async def async_set(self, schedule: list[dict[str, Any]]) -> None:
-        """Update the config entry with the new list (non-admin support)."""
-        self.hass.config_entries.async_update_entry(
-            self._config_entry,
-            options={
-                **self._config_entry.options,
-                CONF_SCHEDULE: Schedule(
-                    self._hass, schedule, self._skip_reversed
-                ).to_list(),
-            },
+        """Save the new list (non-admin support) and apply it."""
+        start = time.perf_counter()
+        compiled = Schedule(self._hass, schedule, self._skip_reversed)
+        self.stats.add_compilation(time.perf_counter() - start)
+        normalized = compiled.to_list()
+        if normalized == self._schedule.to_list():
+            return
+        await self._store.async_set(
+            self._config_entry.entry_id,
+            normalized,
+            delay=self._config_entry.options.get(CONF_DELAYED_SAVE, True),
         )
+        self.config_update(compiled)
 
     @callback
-    def _update_state(self, _: datetime.datetime | None = None) -> None:
+    def _update_state(self, now: datetime.datetime | None = None) -> None:
         """Update the state & attributes and schedule next update."""
-        self._unsub_update = None
+        start = time.perf_counter()
+        if now is not None:
+            # Called by the timer.
+            self._unsub_update = None
+        # The toggle which is handled (if called by the timer).
+        self._toggle = self._next_update if now is not None else None
 
         if self._is_dynamic:
             # Re-resolve sunrise/sunset times.
-            self._schedule = Schedule(
-                self._hass,
-                self._attr_extra_state_attributes[CONF_SCHEDULE],
-                self._skip_reversed,
-            )
+            self._schedule.resolve(self._hass)
+            self.stats.sun_resolutions += 1
+            self.stats.add_compilation(time.perf_counter() - start)
             self._attr_extra_state_attributes[ATTR_EFFECTIVE_SCHEDULE] = (
                 self._schedule.to_list_absolute()
             )
 
         next_toggles = self._schedule.next_updates(self._now(), NEXT_TOGGLES_COUNT)
         next_update = next_toggles[0] if next_toggles else None
+        self._cache_is_on(next_update)
         self._attr_extra_state_attributes[ATTR_NEXT_TOGGLE] = next_update
         self._attr_extra_state_attributes[ATTR_NEXT_TOGGLES] = next_toggles
 
-        self.async_write_ha_state()
-
-        tomorrow = (
-            dt_util.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            + datetime.timedelta(days=1)
-            if self._is_dynamic
-            else None
+        scheduler = async_get_scheduler(self.hass)
+        written = (
+            self.is_on,
+            self._attr_name,
+            dict(self._attr_extra_state_attributes),
         )
+        if (
+            self._toggle is not None
+            and self._written is not None
+            and written[0] != self._written[0]
+        ):
+            # Triggers in the schedule mode run now, not on the state change event.
+            async_dispatcher_send_internal(
+                self.hass,
+                SIGNAL_TOGGLE.format(self.entity_id),
+                STATE_ON if written[0] else STATE_OFF,
+                self._toggle,
+            )
+        if written != self._written:
+            self._written = written
+            scheduler.async_write(self._write_state)
+        else:
+            self._toggle = None
+
+        # Dynamic schedules are also refreshed daily (see "_register_refresh").
+        if self._unsub_update is None or next_update != self._next_update:
+            self._clean_up_listener()
+            self._next_update = next_update
+            if next_update:
+                self._unsub_update = scheduler.async_schedule(
+                    next_update, self._update_state
+                )
+                self.stats.timer_reschedules += 1
+
+        if now is None:
+            # The following toggles might have been changed.
+            async_dispatcher_send_internal(
+                self.hass, SIGNAL_UPDATE.format(self.entity_id)
+            )
 
-        if not next_update or (tomorrow and tomorrow < next_update):
-            next_update = tomorrow
+        self.stats.add_update(time.perf_counter() - start)
 
-        if next_update:
-            self._unsub_update = event_helper.async_track_point_in_time(
-                self.hass, self._update_state, next_update
-            )
+    @callback
+    def _write_state(self) -> None:
+        """Write the state, and the latency of the toggle (if it's the reason)."""
+        if self._toggle is not None:
+            self.stats.last_toggle_latency = (
+                dt_util.utcnow() - dt_util.as_utc(self._toggle)
+            ).total_seconds()
+            self._toggle = None
+        self.async_write_ha_state()
@@ -2,17 +2,60 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import datetime
+import weakref
+from typing import TYPE_CHECKING, cast
 
+import homeassistant.helpers.config_validation as cv
+import homeassistant.util.dt as dt_util
+import voluptuous as vol
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.const import (
+    CONF_AT,
+    CONF_OFFSET,
+    CONF_OPTIONS,
+    CONF_TARGET,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import callback
 from homeassistant.helpers.automation import DomainSpec
-from homeassistant.helpers.condition import Condition, EntityStateConditionBase
+from homeassistant.helpers.condition import (
+    ATTR_BEHAVIOR,
+    BEHAVIOR_ALL,
+    BEHAVIOR_ANY,
+    Condition,
+    ConditionChecker,
+    ConditionCheckParams,
+    ConditionConfig,
+    EntityStateConditionBase,
+)
+from homeassistant.helpers.target import TargetEntityChangeTracker, TargetSelection
 
 from .entity_filter import DailyScheduleEntityFilter
+from .entity_index import async_get_entity_index
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Unpack
+
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
+
+SCHEDULE_CONDITION_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TARGET): cv.TARGET_FIELDS,
+        vol.Optional(CONF_OPTIONS, default={}): {
+            vol.Optional(ATTR_BEHAVIOR, default=BEHAVIOR_ANY): vol.In(
+                [BEHAVIOR_ANY, BEHAVIOR_ALL]
+            ),
+            # A time of today (local), otherwise now.
+            vol.Optional(CONF_AT): cv.time,
+            # Negative offsets are in the past.
+            vol.Optional(CONF_OFFSET): cv.time_period,
+        },
+    }
+)
 
 
 def _make_condition(state: str) -> type[EntityStateConditionBase]:
@@ -27,9 +70,91 @@ def _make_condition(state: str) -> type[EntityStateConditionBase]:
     return DailyScheduleCondition
 
 
+class _TargetTracker(TargetEntityChangeTracker):
+    """Keep the targeted daily schedules, updated by the registry events."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        target_selection: TargetSelection,
+        entity_filter: Callable[[set[str]], set[str]],
+    ) -> None:
+        """Initialize the object."""
+        super().__init__(hass, target_selection, entity_filter)
+        self.entity_ids: set[str] = set()
+
+    @callback
+    def _handle_entities_update(self, tracked_entities: set[str]) -> None:
+        """Keep the tracked entities."""
+        self.entity_ids = tracked_entities
+
+
+def _make_schedule_condition(state: str) -> type[Condition]:
+    """Create a condition evaluating the schedule itself at a shifted time."""
+
+    class DailyScheduleTimeCondition(DailyScheduleEntityFilter, Condition):
+        """Condition for a daily schedule being in a state at a shifted time."""
+
+        @classmethod
+        async def async_validate_config(
+            cls, _hass: HomeAssistant, config: ConfigType
+        ) -> ConfigType:
+            """Validate config."""
+            return cast("ConfigType", SCHEDULE_CONDITION_SCHEMA(config))
+
+        def __init__(self, hass: HomeAssistant, config: ConditionConfig) -> None:
+            """Initialize the condition."""
+            super().__init__(hass, config)
+            options = config.options or {}
+            self._target_selection = TargetSelection(config.target or {})
+            self._behavior = options.get(ATTR_BEHAVIOR, BEHAVIOR_ANY)
+            self._at: datetime.time | None = options.get(CONF_AT)
+            self._offset: datetime.timedelta = options.get(
+                CONF_OFFSET, datetime.timedelta()
+            )
+
+        def _date(self) -> datetime.datetime:
+            """Return the (shifted) date and time to check."""
+            date = dt_util.now()
+            if self._at is not None:
+                date = datetime.datetime.combine(date.date(), self._at, date.tzinfo)
+            return dt_util.as_utc(date) + self._offset
+
+        async def async_get_checker(self) -> ConditionChecker:
+            """Get the condition checker."""
+            matcher = all if self._behavior == BEHAVIOR_ALL else any
+            # The index is created first, so it handles the registry events before
+            # the tracker (which filters by it).
+            index = async_get_entity_index(self._hass)
+            tracker = _TargetTracker(
+                self._hass, self._target_selection, self.entity_filter
+            )
+            unsubscribe = tracker.async_setup()
+
+            def test_schedule(**_: Unpack[ConditionCheckParams]) -> bool:
+                """Check the schedules of the targeted entities (not their states)."""
+                date = self._date()
+                matches = [
+                    (STATE_ON if entity.is_on_at(date) else STATE_OFF) == state
+                    for entity_id in tracker.entity_ids
+                    if (entity := index.entity(entity_id)) is not None
+                ]
+                # Nothing to evaluate never passes (even with "all").
+                return bool(matches) and matcher(matches)
+
+            # Conditions are not detached, so the tracking stops once the checker
+            # is dropped (e.g. when the automation is reloaded).
+            weakref.finalize(test_schedule, unsubscribe)
+            return test_schedule
+
+    return DailyScheduleTimeCondition
+
+
 CONDITIONS: dict[str, type[Condition]] = {
     "is_off": _make_condition(STATE_OFF),
     "is_on": _make_condition(STATE_ON),
+    "scheduled_off": _make_schedule_condition(STATE_OFF),
+    "scheduled_on": _make_schedule_condition(STATE_ON),
 }
 
 
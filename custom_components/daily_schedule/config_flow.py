@@ -14,7 +14,14 @@ from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
 from homeassistant.helpers import selector
 
-from .const import CONF_SCHEDULE, CONF_SKIP_REVERSED, CONF_UTC, DOMAIN
+from .const import (
+    CONF_DELAYED_SAVE,
+    CONF_REFRESH_WINDOW,
+    CONF_SKIP_REVERSED,
+    CONF_UTC,
+    DOMAIN,
+    MAX_REFRESH_WINDOW,
+)
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigFlowResult
@@ -29,6 +36,8 @@ CONFIG_SCHEMA = vol.Schema(
 class DailyScheduleConfigFlow(ConfigFlow, domain=DOMAIN):
     """Config flow."""
 
+    VERSION = 2
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -48,7 +57,7 @@ class DailyScheduleConfigFlow(ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(
                     title=user_input[CONF_NAME],
                     data={},
-                    options={CONF_SCHEDULE: []},
+                    options={},
                 )
 
         return self.async_show_form(
@@ -76,9 +85,10 @@ class OptionsFlowHandler(OptionsFlow):
             return self.async_create_entry(
                 title="",
                 data={
-                    CONF_SCHEDULE: self.config_entry.options.get(CONF_SCHEDULE, []),
                     CONF_UTC: user_input[CONF_UTC],
                     CONF_SKIP_REVERSED: user_input[CONF_SKIP_REVERSED],
+                    CONF_DELAYED_SAVE: user_input[CONF_DELAYED_SAVE],
+                    CONF_REFRESH_WINDOW: user_input[CONF_REFRESH_WINDOW],
                 },
             )
 
@@ -95,6 +105,24 @@ class OptionsFlowHandler(OptionsFlow):
                             CONF_SKIP_REVERSED, False
                         ),
                     ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_DELAYED_SAVE,
+                        default=self.config_entry.options.get(CONF_DELAYED_SAVE, True),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_REFRESH_WINDOW,
+                        default=self.config_entry.options.get(CONF_REFRESH_WINDOW, 0),
+                    ): vol.All(
+                        selector.NumberSelector(
+                            selector.NumberSelectorConfig(
+                                min=0,
+                                max=MAX_REFRESH_WINDOW,
+                                unit_of_measurement="s",
+                                mode=selector.NumberSelectorMode.BOX,
+                            )
+                        ),
+                        vol.Coerce(int),
+                    ),
                 }
             ),
         )
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import datetime
 import logging
 from typing import Final
 
+from homeassistant.util.signal_type import SignalTypeFormat
+
 DOMAIN: Final = "daily_schedule"
 LOGGER = logging.getLogger(__package__)
 
@@ -14,13 +17,52 @@ CONF_TO: Final = "to"
 CONF_SCHEDULE: Final = "schedule"
 CONF_UTC: Final = "utc"
 CONF_SKIP_REVERSED: Final = "skip_reversed"
+CONF_SCHEDULES: Final = "schedules"
+CONF_DELAYED_SAVE: Final = "delayed_save"
+CONF_REFRESH_WINDOW: Final = "refresh_window"
+
+# Seconds between a change of the schedule and saving it (delayed save option).
+SAVE_DELAY: Final = 10
+
+# Days of the precomputed plan of dynamic schedules (sunrise and sunset).
+PLAN_DAYS: Final = 7
+
+# The maximal window (in seconds) of the daily refresh of dynamic schedules.
+MAX_REFRESH_WINDOW: Final = 3600
 
 ATTR_EFFECTIVE_SCHEDULE: Final = "effective_schedule"
 ATTR_NEXT_TOGGLE: Final = "next_toggle"
 ATTR_NEXT_TOGGLES: Final = "next_toggles"
 NEXT_TOGGLES_COUNT: Final = 4
+ATTR_TOGGLE: Final = "toggle"
+ATTR_OFFSET: Final = "offset"
+
+# Sent by an entity when its schedule toggles it: the new state and the instant.
+SIGNAL_TOGGLE: SignalTypeFormat[str, datetime.datetime] = SignalTypeFormat(
+    f"{DOMAIN}_toggle_{{}}"
+)
+# Sent by an entity when its schedule is changed or refreshed.
+SIGNAL_UPDATE: SignalTypeFormat[()] = SignalTypeFormat(f"{DOMAIN}_update_{{}}")
+
+# The maximal offset (before or after) of the schedule-driven triggers.
+MAX_TRIGGER_OFFSET: Final = datetime.timedelta(days=1)
+
+ATTR_RESULTS: Final = "results"
+ATTR_SUCCESS: Final = "success"
+ATTR_ERROR: Final = "error"
+ATTR_STATES: Final = "states"
+ATTR_INTERVALS: Final = "intervals"
+
+CONF_TIMES: Final = "times"
+CONF_START: Final = "start"
+CONF_END: Final = "end"
+
+# The maximal window of the query action.
+MAX_QUERY_WINDOW: Final = datetime.timedelta(days=366)
 
 SERVICE_SET: Final = "set"
+SERVICE_SET_MANY: Final = "set_many"
+SERVICE_QUERY: Final = "query"
 
 SUNRISE_SYMBOL: Final = "↑"
 SUNSET_SYMBOL: Final = "↓"
@@ -0,0 +1,139 @@
+"""Daily refresh of the dynamic schedules (sunrise and sunset are re-resolved)."""
+
+from __future__ import annotations
+
+import datetime
+import zlib
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import homeassistant.util.dt as dt_util
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .scheduler import async_get_scheduler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DATA_DAILY_REFRESH: HassKey[DailyRefresh] = HassKey(f"{DOMAIN}_daily_refresh")
+
+
+class _Registration:
+    """A refreshed schedule."""
+
+    __slots__ = ("next_update", "offset", "refresh", "unsub_staggered", "window")
+
+    def __init__(
+        self,
+        key: str,
+        window: float,
+        refresh: Callable[[], None],
+        next_update: Callable[[], datetime.datetime | None],
+    ) -> None:
+        """Initialize the object."""
+        self.window = window
+        # A stable offset inside the window, so the refreshes are spread evenly.
+        self.offset = window * zlib.crc32(key.encode()) / 2**32
+        self.refresh = refresh
+        self.next_update = next_update
+        self.unsub_staggered: CALLBACK_TYPE | None = None
+
+
+class DailyRefresh:
+    """Refresh all the dynamic schedules at midnight, in a single batch."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the object."""
+        self._hass = hass
+        self._registrations: dict[int, _Registration] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._runs = 0
+        self._refreshes = 0
+        self._staggered = 0
+
+    @callback
+    def async_register(
+        self,
+        key: str,
+        window: float,
+        refresh: Callable[[], None],
+        next_update: Callable[[], datetime.datetime | None],
+    ) -> CALLBACK_TYPE:
+        """Refresh daily (in the window after midnight). Return an unregister."""
+        registration = _Registration(key, window, refresh, next_update)
+        self._registrations[id(registration)] = registration
+        if self._unsub_timer is None:
+            self._arm()
+
+        @callback
+        def unregister() -> None:
+            """Stop refreshing."""
+            if self._registrations.pop(id(registration), None) is None:
+                return
+            if registration.unsub_staggered is not None:
+                registration.unsub_staggered()
+            if not self._registrations and self._unsub_timer is not None:
+                self._unsub_timer()
+                self._unsub_timer = None
+
+        return unregister
+
+    @callback
+    def _arm(self) -> None:
+        """Set the timer to the next midnight."""
+        midnight = dt_util.start_of_local_day(
+            dt_util.now().date() + datetime.timedelta(days=1)
+        )
+        self._unsub_timer = async_get_scheduler(self._hass).async_schedule(
+            midnight, self._async_refresh
+        )
+
+    @callback
+    def _async_refresh(self, now: datetime.datetime) -> None:
+        """Refresh the schedules now, or later in their window."""
+        self._unsub_timer = None
+        self._runs += 1
+        scheduler = async_get_scheduler(self._hass)
+        for registration in list(self._registrations.values()):
+            next_update = registration.next_update()
+            if registration.offset and (
+                next_update is None
+                or next_update > now + datetime.timedelta(seconds=registration.window)
+            ):
+                # No toggle is due in the window.
+                registration.unsub_staggered = scheduler.async_schedule(
+                    now + datetime.timedelta(seconds=registration.offset),
+                    partial(self._refresh, registration),
+                )
+                self._staggered += 1
+            else:
+                self._refresh(registration)
+        self._arm()
+
+    @callback
+    def _refresh(
+        self, registration: _Registration, _: datetime.datetime | None = None
+    ) -> None:
+        """Refresh a single schedule."""
+        registration.unsub_staggered = None
+        self._refreshes += 1
+        registration.refresh()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters."""
+        return {
+            "registered": len(self._registrations),
+            "runs": self._runs,
+            "refreshes": self._refreshes,
+            "staggered": self._staggered,
+        }
+
+
+@callback
+@singleton(DATA_DAILY_REFRESH)
+def async_get_daily_refresh(hass: HomeAssistant) -> DailyRefresh:
+    """Get the daily refresh job shared by all the entities."""
+    return DailyRefresh(hass)
@@ -4,13 +4,52 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.config_entries import ConfigEntryState
+
+from .const import DOMAIN
+from .daily_refresh import async_get_daily_refresh
+from .entity_index import async_get_entity_index
+from .schedule_registry import async_get_schedule_registry
+from .schedule_store import async_get_schedule_store
+from .scheduler import async_get_scheduler
+from .stats import aggregate
+from .sun_cache import async_get_sun_cache
+
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
+    from .binary_sensor import DailyScheduleConfigEntry, DailyScheduleSensor
+
+
+def _entity(entry: DailyScheduleConfigEntry) -> DailyScheduleSensor | None:
+    """Return the entity of the config entry (if it's loaded)."""
+    if entry.state is not ConfigEntryState.LOADED or not entry.runtime_data:
+        return None
+    return entry.runtime_data.entity
+
 
 async def async_get_config_entry_diagnostics(
-    _: HomeAssistant, entry: ConfigEntry
+    hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    return dict(entry.options)
+    entities = [
+        entity
+        for config_entry in hass.config_entries.async_entries(DOMAIN)
+        if (entity := _entity(config_entry)) is not None
+    ]
+    store = await async_get_schedule_store(hass)
+    return {
+        "options": dict(entry.options),
+        "schedule": store.get(entry.entry_id),
+        "entity": None
+        if (entity := _entity(entry)) is None
+        else entity.stats.as_dict(),
+        "entities": aggregate(entity.stats for entity in entities),
+        "scheduler": async_get_scheduler(hass).as_dict(),
+        "daily_refresh": async_get_daily_refresh(hass).as_dict(),
+        "entity_index": async_get_entity_index(hass).as_dict(),
+        "schedule_registry": async_get_schedule_registry(hass).as_dict(),
+        "schedule_store": store.as_dict(),
+        "sun_cache": async_get_sun_cache(hass).as_dict(),
+    }
@@ -0,0 +1,82 @@
+"""Daylight saving time transitions, precomputed per time zone and year."""
+
+from __future__ import annotations
+
+import datetime
+from dataclasses import dataclass
+from functools import lru_cache
+
+DAY = datetime.timedelta(days=1)
+# Margin around the year, so the wall times of the whole year are covered.
+MARGIN = datetime.timedelta(days=2)
+
+
+@dataclass(frozen=True, slots=True)
+class DstTransition:
+    """Change of the UTC offset."""
+
+    instant: datetime.datetime  # Naive UTC.
+    old_offset: datetime.timedelta
+    new_offset: datetime.timedelta
+
+
+@lru_cache(maxsize=64)
+def dst_transitions(tzinfo: datetime.tzinfo, year: int) -> tuple[DstTransition, ...]:
+    """Return the transitions (sorted) around the year."""
+
+    def utcoffset(instant: datetime.datetime) -> datetime.timedelta:
+        return instant.astimezone(tzinfo).utcoffset() or datetime.timedelta()
+
+    transitions: list[DstTransition] = []
+    end = datetime.datetime(year + 1, 1, 1, tzinfo=datetime.UTC) + MARGIN
+    day = datetime.datetime(year, 1, 1, tzinfo=datetime.UTC) - MARGIN
+    offset = utcoffset(day)
+    while day < end:
+        if (next_offset := utcoffset(day + DAY)) != offset:
+            # Binary search the first second of the new offset.
+            low, high = 0, int(DAY.total_seconds())
+            while high - low > 1:
+                middle = (low + high) // 2
+                if utcoffset(day + datetime.timedelta(seconds=middle)) == offset:
+                    low = middle
+                else:
+                    high = middle
+            transitions.append(
+                DstTransition(
+                    (day + datetime.timedelta(seconds=high)).replace(tzinfo=None),
+                    offset,
+                    next_offset,
+                )
+            )
+        day += DAY
+        offset = next_offset
+    return tuple(transitions)
+
+
+def gap_end(date: datetime.datetime) -> datetime.datetime | None:
+    """Return the end of the forward jump (gap) containing the date (if any)."""
+    if date.tzinfo is None:
+        return None  # pragma: no cover
+    wall_time = date.replace(tzinfo=None)
+    for transition in dst_transitions(date.tzinfo, date.year):
+        if (
+            transition.instant + transition.old_offset
+            <= wall_time
+            < transition.instant + transition.new_offset
+        ):
+            return (transition.instant + transition.new_offset).replace(
+                tzinfo=date.tzinfo, fold=date.fold
+            )
+    return None
+
+
+def next_transition(date: datetime.datetime) -> DstTransition | None:
+    """Return the first transition after the date (if any)."""
+    if date.tzinfo is None or (offset := date.utcoffset()) is None:
+        return None  # pragma: no cover
+    instant = date.replace(tzinfo=None) - offset
+    for year in (date.year, date.year + 1):
+        for transition in dst_transitions(date.tzinfo, year):
+            if transition.instant > instant:
+                return transition
+    return None
@@ -0,0 +1,91 @@
+"""Index of the daily schedule entities, kept up to date by entity registry events."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.entity_registry import EventEntityRegistryUpdatedData
+
+    from .binary_sensor import (
+        DailyScheduleConfigEntry,
+        DailyScheduleRuntimeData,
+        DailyScheduleSensor,
+    )
+
+DATA_ENTITY_INDEX: HassKey[EntityIndex] = HassKey(f"{DOMAIN}_entity_index")
+
+
+class EntityIndex:
+    """The binary sensor entities owned by this integration (and their entries)."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the object."""
+        self._hass = hass
+        self._registry = er.async_get(hass)
+        # The config entry ID of each entity.
+        self._entries: dict[str, str | None] = {
+            entry.entity_id: entry.config_entry_id
+            for entry in self._registry.entities.values()
+            if self._owned(entry)
+        }
+        self._updates = 0
+        hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_update)
+
+    @staticmethod
+    def _owned(entry: er.RegistryEntry) -> bool:
+        """Return whether the registry entry is a daily schedule binary sensor."""
+        return entry.platform == DOMAIN and entry.domain == BINARY_SENSOR_DOMAIN
+
+    @callback
+    def _async_update(self, event: Event[EventEntityRegistryUpdatedData]) -> None:
+        """Add, remove or rename the entity of the registry event."""
+        self._updates += 1
+        entity_id = event.data["entity_id"]
+        if event.data["action"] == "remove":
+            self._entries.pop(entity_id, None)
+            return
+        if event.data["action"] == "update" and "old_entity_id" in event.data:
+            self._entries.pop(event.data["old_entity_id"], None)
+        entry = self._registry.async_get(entity_id)
+        if entry is not None and self._owned(entry):
+            self._entries[entity_id] = entry.config_entry_id
+
+    def filter(self, entity_ids: set[str]) -> set[str]:
+        """Return the entities of this integration out of the given ones."""
+        return entity_ids & self._entries.keys()
+
+    def entity(self, entity_id: str) -> DailyScheduleSensor | None:
+        """Return the entity object (if it's added, also while its entry is set up)."""
+        if (config_entry_id := self._entries.get(entity_id)) is None:
+            return None
+        config_entry: DailyScheduleConfigEntry | None = (
+            self._hass.config_entries.async_get_entry(config_entry_id)
+        )
+        # The runtime data is set while the entry is set up, and deleted once it's
+        # unloaded.
+        runtime_data: DailyScheduleRuntimeData | None = getattr(
+            config_entry, "runtime_data", None
+        )
+        if runtime_data is None or not runtime_data.entity.is_added:
+            return None
+        return runtime_data.entity
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters."""
+        return {"size": len(self._entries), "updates": self._updates}
+
+
+@callback
+@singleton(DATA_ENTITY_INDEX)
+def async_get_entity_index(hass: HomeAssistant) -> EntityIndex:
+    """Get the index of the daily schedule entities."""
+    return EntityIndex(hass)
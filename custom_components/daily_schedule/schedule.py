@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import copy
 import datetime
+import heapq
+from bisect import bisect_right
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import (
@@ -10,16 +14,45 @@ from homeassistant.const import (
     SUN_EVENT_SUNSET,
 )
 from homeassistant.exceptions import IntegrationError
-from homeassistant.helpers import sun
-from homeassistant.util.dt import as_local, now
+from homeassistant.util.dt import (
+    as_local,
+    as_timestamp,
+    get_default_time_zone,
+    now,
+)
 
-from .const import CONF_DISABLED, CONF_FROM, CONF_TO, SUNRISE_SYMBOL, SUNSET_SYMBOL
+from .const import (
+    CONF_DISABLED,
+    CONF_FROM,
+    CONF_TO,
+    PLAN_DAYS,
+    SUNRISE_SYMBOL,
+    SUNSET_SYMBOL,
+)
+from .dst import dst_transitions, gap_end, next_transition
+from .sun_cache import async_get_sun_cache
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    import numpy as np
+    import numpy.typing as npt
     from homeassistant.core import HomeAssistant
+    from numpy.typing import ArrayLike
 
 MIDNIGHT = datetime.time()
-MINUTE = datetime.timedelta(minutes=1)
+DAY_SECONDS = 86400
+EPOCH_DATE = datetime.date(1970, 1, 1)
+
+
+def time_offset(time: datetime.time) -> int:
+    """Return the number of seconds since midnight (microseconds are ignored)."""
+    return time.hour * 3600 + time.minute * 60 + time.second
+
+
+def range_order(time_range: TimeRange) -> tuple[datetime.time, int]:
+    """Return the sort key of the range (same order as TimeRange comparison)."""
+    return time_range.from_, time_range.seconds
 
 
 class TimeRange:
@@ -28,14 +61,14 @@ class TimeRange:
     def __init__(self, from_: datetime.time, to: datetime.time) -> None:
         """Initialize the object."""
         self.from_: datetime.time = from_
-        self._from_offset = from_.hour * 3600 + from_.minute * 60 + from_.second
+        self.from_offset = time_offset(from_)
         self.to: datetime.time = to
-        self._to_offset = to.hour * 3600 + to.minute * 60 + to.second
+        self.to_offset = time_offset(to)
         self.reversed = self.to <= self.from_
         self.seconds = (
-            self._to_offset - self._from_offset
+            self.to_offset - self.from_offset
             if not self.reversed
-            else 86400 - self._from_offset + self._to_offset
+            else DAY_SECONDS - self.from_offset + self.to_offset
         )
 
     def __eq__(self, other: object) -> bool:
@@ -54,7 +87,7 @@ class TimeRange:
 
     def __hash__(self) -> int:
         """Return a number unique to this range."""
-        return hash((self._from_offset, self._to_offset))
+        return hash((self.from_offset, self.to_offset))
 
     def containing(self, time: datetime.time) -> bool:
         """Check if the time is inside the range."""
@@ -80,24 +113,26 @@ class TimeRangeConfig(TimeRange):
         from_: str,
         to: str,
         disabled: bool,  # noqa: FBT001
+        date: datetime.date | None = None,
     ) -> None:
-        """Initialize the object."""
-        self._dynamic_from, from_time = self.resolve_dynamic(hass, from_)
-        self._dynamic_to, to_time = self.resolve_dynamic(hass, to)
+        """Initialize the object (sunrise/sunset are of the date, today by default)."""
+        date = date or now().date()
+        self._dynamic_from, from_time = self.resolve_dynamic(hass, from_, date)
+        self._dynamic_to, to_time = self.resolve_dynamic(hass, to, date)
         super().__init__(from_time, to_time)
         self.disabled = disabled
 
     def resolve_dynamic(
-        self, hass: HomeAssistant, value: str
+        self, hass: HomeAssistant, value: str, date: datetime.date
     ) -> tuple[str | None, datetime.time]:
         """Resolve dynamic time range."""
         if not value.startswith((SUNRISE_SYMBOL, SUNSET_SYMBOL)):
             return None, datetime.time.fromisoformat(value)
 
         if (
-            event := sun.get_astral_event_date(
-                hass,
+            event := async_get_sun_cache(hass).get_event(
                 SUN_EVENT_SUNRISE if value[0] == SUNRISE_SYMBOL else SUN_EVENT_SUNSET,
+                date,
             )
         ) is None:
             # Should never happen, but the above call can return None.
@@ -110,8 +145,7 @@ class TimeRangeConfig(TimeRange):
             return value[:1], time
 
         time = (
-            datetime.datetime.combine(now().date(), time)
-            + datetime.timedelta(minutes=offset)
+            datetime.datetime.combine(date, time) + datetime.timedelta(minutes=offset)
         ).time()
         return f"{value[0]}{offset:+}", time
 
@@ -119,6 +153,20 @@ class TimeRangeConfig(TimeRange):
         """Check if the time range is dynamic."""
         return self._dynamic_from is not None or self._dynamic_to is not None
 
+    def resolve(
+        self, hass: HomeAssistant, date: datetime.date | None = None
+    ) -> TimeRangeConfig:
+        """Return a copy with the sunrise/sunset times resolved again."""
+        return TimeRangeConfig(
+            hass,
+            self.from_.isoformat()
+            if self._dynamic_from is None
+            else self._dynamic_from,
+            self.to.isoformat() if self._dynamic_to is None else self._dynamic_to,
+            self.disabled,
+            date,
+        )
+
     def containing(self, time: datetime.time) -> bool:
         """Check if the time is inside the range."""
         return not self.disabled and super().containing(time)
@@ -140,6 +188,69 @@ class TimeRangeConfig(TimeRange):
         return super().to_dict()
 
 
+class DayPlan:
+    """The schedule of a day, and its transitions."""
+
+    __slots__ = (
+        "base",
+        "boundaries",
+        "dynamic_config",
+        "initial_on",
+        "schedule",
+        "transitions",
+    )
+
+    def __init__(
+        self, dynamic_config: list[TimeRangeConfig], schedule: list[TimeRange]
+    ) -> None:
+        """Calculate the on and off transitions of the (merged) schedule."""
+        self.dynamic_config = dynamic_config
+        self.schedule = schedule
+        # The plan before continuing the previous day (see "continued").
+        self.base = self
+        to_on = [time_range.from_ for time_range in schedule]
+        to_off = [time_range.to for time_range in schedule]
+        if schedule and to_on[0] == to_off[-1]:
+            to_on.pop(0)
+            to_off.pop(-1)
+        to_on.sort()
+        to_off.sort()
+
+        # All the transitions in the order of the day, and their offsets (seconds
+        # since midnight) for binary search.
+        self.transitions = sorted(to_on + to_off)
+        self.boundaries = [time_offset(time) for time in self.transitions]
+        # The state before the first boundary. Each boundary flips it (ranges are
+        # merged, so "on" and "off" transitions alternate).
+        self.initial_on = to_off[0] < to_on[0] if self.boundaries else bool(schedule)
+
+    def containing(self, offset: int) -> bool:
+        """Check if the offset (seconds since midnight) is inside the schedule."""
+        return self.initial_on ^ (bisect_right(self.boundaries, offset) & 1 == 1)
+
+    @property
+    def final_on(self) -> bool:
+        """Return the state at the end of the day."""
+        return self.initial_on ^ (len(self.boundaries) & 1 == 1)
+
+    def continued(self, previous: DayPlan) -> DayPlan:
+        """
+        Return the plan, continuing the state at the end of the previous day.
+
+        A sunrise/sunset time with an offset can move across midnight between days
+        (e.g. "↓+300"), so the plans of the days disagree about midnight. The first
+        boundary of the day is then dropped, instead of toggling at midnight and
+        back at the boundary.
+        """
+        if not self.boundaries or previous.final_on == self.initial_on:
+            return self
+        plan = copy.copy(self)
+        plan.initial_on = previous.final_on
+        plan.transitions = self.transitions[1:]
+        plan.boundaries = self.boundaries[1:]
+        return plan
+
+
 class Schedule:
     """List of TimeRange."""
 
@@ -150,7 +261,7 @@ class Schedule:
         skip_reversed: bool,  # noqa: FBT001
     ) -> None:
         """Create a list of TimeRanges representing the schedule."""
-        self._config = sorted(
+        config = sorted(
             [
                 TimeRangeConfig(
                     hass,
@@ -159,83 +270,321 @@ class Schedule:
                     time_range.get(CONF_DISABLED, False),
                 )
                 for time_range in schedule
-            ]
+            ],
+            key=range_order,
         )
         self._skip_reversed = skip_reversed
-        self._calculate_schedule()
-
-    def _calculate_schedule(self) -> None:
-        """Calculate the schedule."""
-        self._schedule = []
+        # Static time ranges are merged once. Only the dynamic ones are resolved
+        # again, and then merged into the static ones.
+        self._static_config = [
+            time_range for time_range in config if not time_range.is_dynamic()
+        ]
+        self._dynamic_config = [
+            time_range for time_range in config if time_range.is_dynamic()
+        ]
+        self._static_schedule = self._merge(self._active(self._static_config))
+        # Plans of the following days (dynamic schedules), see "resolve".
+        self._plans: dict[datetime.date, DayPlan] = {}
+        self._location: tuple[Any, ...] | None = None
+        self._use(self._day_plan(self._dynamic_config))
+
+    def resolve(self, hass: HomeAssistant, days: int = PLAN_DAYS) -> None:
+        """
+        Resolve the sunrise/sunset times of today and the following days.
+
+        Days which were already resolved are reused (unless the location changed).
+        """
+        if not self.is_dynamic():
+            return
+        location = (
+            hass.config.latitude,
+            hass.config.longitude,
+            hass.config.elevation,
+            hass.config.time_zone,
+        )
+        if location != self._location:
+            self._plans = {}
+            self._location = location
+        today = now().date()
+        plans: dict[datetime.date, DayPlan] = {}
+        for day in (today + datetime.timedelta(days=day) for day in range(days)):
+            if (plan := self._plans.get(day)) is None:
+                previous = day - datetime.timedelta(days=1)
+                plan = self._continued_plan(
+                    hass, day, plans.get(previous) or self._plans.get(previous)
+                )
+            plans[day] = plan
+        self._plans = plans
+        self._use(plans[today])
+
+    def planned(self, hass: HomeAssistant, days: Iterable[datetime.date]) -> Schedule:
+        """
+        Return the schedule with the plans of the days (e.g. past days).
+
+        The schedule itself is not changed. The days which aren't planned are
+        resolved on a copy (if there are any).
+        """
+        if (plans := self._plans_with(hass, days)) is self._plans:
+            return self
+        schedule = copy.copy(self)
+        schedule._plans = plans  # noqa: SLF001
+        return schedule
+
+    def _plans_with(
+        self, hass: HomeAssistant, days: Iterable[datetime.date]
+    ) -> dict[datetime.date, DayPlan]:
+        """Return the plans, including the days which aren't planned yet."""
+        plans = self._plans
+        if not self.is_dynamic():
+            return plans
+        for day in sorted(set(days)):
+            if day not in plans:
+                if plans is self._plans:
+                    plans = dict(self._plans)
+                plans[day] = self._continued_plan(
+                    hass, day, plans.get(day - datetime.timedelta(days=1))
+                )
+        return plans
+
+    def _continued_plan(
+        self, hass: HomeAssistant, day: datetime.date, previous: DayPlan | None
+    ) -> DayPlan:
+        """Calculate the plan of the day, continuing the previous day's plan."""
+        if previous is None:
+            previous = self._resolve_day(hass, day - datetime.timedelta(days=1))
+        return self._resolve_day(hass, day).continued(previous)
+
+    def _resolve_day(self, hass: HomeAssistant, day: datetime.date) -> DayPlan:
+        """Calculate the plan of the day (with the sunrise/sunset times of the day)."""
+        return self._day_plan(
+            sorted(
+                (time_range.resolve(hass, day) for time_range in self._dynamic_config),
+                key=range_order,
+            )
+        )
 
-        # There is nothing to do for a single time range.
-        if len(self._config) == 1:
-            if not self._config[0].disabled and (
+    def _active(self, config: list[TimeRangeConfig]) -> list[TimeRangeConfig]:
+        """Filter out the disabled (and skipped reversed) time ranges."""
+        return [
+            time_range
+            for time_range in config
+            if not time_range.disabled
+            and (
                 not self._skip_reversed
-                or not self._config[0].reversed
-                or not self._config[0].is_dynamic()
-            ):
-                self._schedule.append(
-                    TimeRange(self._config[0].from_, self._config[0].to)
-                )
+                or not time_range.reversed
+                or not time_range.is_dynamic()
+            )
+        ]
+
+    def _day_plan(self, dynamic_config: list[TimeRangeConfig]) -> DayPlan:
+        """Calculate the schedule with the (resolved) dynamic time ranges."""
+        # There is nothing to merge for a single time range.
+        if len(self._static_config) + len(dynamic_config) == 1:
+            schedule = [
+                TimeRange(time_range.from_, time_range.to)
+                for time_range in self._active(self._static_config + dynamic_config)
+            ]
         else:
-            # Break reversed time ranges into two separate time ranges.
-            schedule = []
-            for time_range in self._config:
-                if time_range.disabled or (
-                    self._skip_reversed
-                    and time_range.reversed
-                    and time_range.is_dynamic()
-                ):
-                    continue
-                if not time_range.reversed or time_range.to == MIDNIGHT:
-                    schedule.append(TimeRange(time_range.from_, time_range.to))
-                else:
-                    schedule.append(TimeRange(time_range.from_, MIDNIGHT))
-                    schedule.append(TimeRange(MIDNIGHT, time_range.to))
-            schedule.sort()
-
-            # Merge overlapping time ranges.
-            while schedule:
-                from_range = schedule.pop(0)
-                to_range = from_range
-                while schedule and (
-                    schedule[0].from_ <= to_range.to or to_range.to == MIDNIGHT
-                ):
-                    if (
-                        schedule[0].to > to_range.to or schedule[0].to == MIDNIGHT
-                    ) and to_range.to != MIDNIGHT:
-                        to_range = schedule[0]
-                    schedule.pop(0)
-                self._schedule.append(TimeRange(from_range.from_, to_range.to))
-
-            # Merge the first and last time ranges if they are adjusting.
+            schedule = self._merge(
+                list(
+                    heapq.merge(
+                        self._static_schedule,
+                        self._active(dynamic_config),
+                        key=range_order,
+                    )
+                )
+            )
+        return DayPlan(dynamic_config, schedule)
+
+    def _use(self, plan: DayPlan) -> None:
+        """Use the plan as the current one (e.g. for "containing")."""
+        self._plan = plan
+        self._dynamic_config = plan.dynamic_config
+        self._config = list(
+            heapq.merge(self._static_config, self._dynamic_config, key=range_order)
+        )
+        self._schedule = plan.schedule
+        self._transitions = plan.transitions
+
+    def _plan_of(self, day: datetime.date) -> DayPlan:
+        """Return the plan of the day (the current one if it's not planned)."""
+        plan = self._plans.get(day)
+        # The days after the planned ones repeat the current plan, so they
+        # continue each other.
+        return plan if plan is not None else self._plan.base
+
+    @staticmethod
+    def _merge(active: Sequence[TimeRange]) -> list[TimeRange]:
+        """Merge sorted time ranges into non-overlapping and non-adjusting ones."""
+        if not active:
+            return []
+
+        # Reversed time ranges are broken into 2 parts: "from" to midnight, and
+        # midnight to "to". All the second parts start at midnight, so they are
+        # merged upfront into a single range, which is the first to be swept.
+        head: TimeRange | None = None
+        for time_range in active:
             if (
-                len(self._schedule) > 1
-                and self._schedule[0].from_ == MIDNIGHT
-                and self._schedule[-1].to == MIDNIGHT
+                time_range.reversed
+                and time_range.to != MIDNIGHT
+                and (head is None or time_range.to_offset > head.to_offset)
             ):
-                self._schedule[-1] = TimeRange(
-                    self._schedule[-1].from_, self._schedule[0].to
-                )
-                self._schedule.pop(0)
+                head = time_range
+
+        # Sweep once over (from offset, to offset, from, to). End of day is 86400.
+        parts = (
+            (
+                time_range.from_offset,
+                DAY_SECONDS if time_range.reversed else time_range.to_offset,
+                time_range.from_,
+                MIDNIGHT if time_range.reversed else time_range.to,
+            )
+            for time_range in active
+        )
+        _, to_offset, from_, to = (
+            next(parts) if head is None else (0, head.to_offset, MIDNIGHT, head.to)
+        )
+        merged: list[TimeRange] = []
+        for part_from_offset, part_to_offset, part_from, part_to in parts:
+            if part_from_offset > to_offset:
+                merged.append(TimeRange(from_, to))
+                to_offset, from_, to = part_to_offset, part_from, part_to
+            elif part_to_offset > to_offset:
+                to_offset, to = part_to_offset, part_to
+        merged.append(TimeRange(from_, to))
+
+        # Merge the first and last time ranges if they are adjusting.
+        if (
+            len(merged) > 1
+            and merged[0].from_ == MIDNIGHT
+            and merged[-1].to == MIDNIGHT
+        ):
+            merged[-1] = TimeRange(merged[-1].from_, merged[0].to)
+            merged.pop(0)
 
-        # Calculate on and off transitions.
-        self._to_on = [time_range.from_ for time_range in self._schedule]
-        self._to_off = [time_range.to for time_range in self._schedule]
-        if self._schedule and self._to_on[0] == self._to_off[-1]:
-            self._to_on.pop(0)
-            self._to_off.pop(-1)
-        self._to_on.sort()
-        self._to_off.sort()
+        return merged
 
     def is_dynamic(self) -> bool:
         """Check if the schedule contains at least one dynamic time."""
-        return any(time_range_config.is_dynamic() for time_range_config in self._config)
+        return bool(self._dynamic_config)
 
     def containing(self, time: datetime.time) -> bool:
         """Check if the time is inside the range."""
-        return any(time_range.containing(time) for time_range in self._schedule)
+        return self._offset_containing(time_offset(time))
+
+    def containing_at(self, date: datetime.datetime) -> bool:
+        """Check if the date and time is inside the range (of that day's plan)."""
+        return self._plan_of(date.date()).containing(time_offset(date.time()))
+
+    def _offset_containing(self, offset: int) -> bool:
+        """Check if the offset (seconds since midnight) is inside the range."""
+        return self._plan.containing(offset)
+
+    def containing_array(
+        self,
+        times: ArrayLike | Sequence[datetime.datetime],
+        *,
+        utc: bool = False,
+        hass: HomeAssistant | None = None,
+    ) -> npt.NDArray[np.bool_]:
+        """
+        Check if each of the times is inside the schedule (requires NumPy).
+
+        Times are epoch seconds, datetimes (naive ones are local) or numpy
+        datetime64 (UTC). The schedule is evaluated in the local time zone, or in
+        UTC if "utc" is set (same as the entity), with the plan of each day. The
+        days which aren't planned use the current plan, unless "hass" is provided
+        to plan them (see "planned").
+        """
+        try:
+            import numpy as np  # noqa: PLC0415
+        except ImportError as err:
+            error_message = "NumPy is required for evaluating arrays."
+            raise IntegrationError(error_message) from err
+
+        values = np.asarray(times)
+        if np.issubdtype(values.dtype, np.datetime64):
+            epoch = values.astype("datetime64[s]").astype(np.int64).astype(np.float64)
+        elif values.dtype == object:
+            epoch = np.array(
+                [as_timestamp(as_local(value)) for value in values.ravel()],
+                dtype=np.float64,
+            ).reshape(values.shape)
+        else:
+            epoch = values.astype(np.float64)
+        seconds = np.floor(epoch).astype(np.int64)
+        if not utc and seconds.size:
+            instants, utc_offsets = self._utc_offsets(
+                int(seconds.min()), int(seconds.max())
+            )
+            seconds = (
+                seconds
+                + np.asarray(utc_offsets, dtype=np.int64)[
+                    np.searchsorted(
+                        np.asarray(instants, dtype=np.int64), seconds, side="right"
+                    )
+                ]
+            )
+
+        offsets = np.mod(seconds, DAY_SECONDS)
+        days = np.floor_divide(seconds, DAY_SECONDS)
+        plans = (
+            self._plans
+            if hass is None
+            else self._plans_with(
+                hass,
+                (
+                    EPOCH_DATE + datetime.timedelta(days=int(day))
+                    for day in np.unique(days)
+                ),
+            )
+        )
+        fallback = self._plan.base
+        result = self._plan_containing_array(fallback, offsets)
+        # Times of the planned days are evaluated with their own plans.
+        for day, plan in plans.items():
+            if plan is not fallback:
+                mask = days == (day - EPOCH_DATE).days
+                result[mask] = self._plan_containing_array(plan, offsets[mask])
+        return result
+
+    @staticmethod
+    def _plan_containing_array(
+        plan: DayPlan, offsets: npt.NDArray[np.int64]
+    ) -> npt.NDArray[np.bool_]:
+        """Check if each of the offsets (seconds since midnight) is in the plan."""
+        import numpy as np  # noqa: PLC0415
+
+        flips = np.searchsorted(
+            np.asarray(plan.boundaries, dtype=np.int64), offsets, side="right"
+        )
+        return (flips & 1).astype(np.bool_) ^ plan.initial_on
+
+    @staticmethod
+    def _utc_offsets(first: int, last: int) -> tuple[list[int], list[int]]:
+        """
+        Return the local UTC offset changes between the epoch seconds.
+
+        The offset of index "i" applies before instant "i" (and the last offset
+        after the last instant).
+        """
+        time_zone = get_default_time_zone()
+        first_date = datetime.datetime.fromtimestamp(first, datetime.UTC)
+        last_date = datetime.datetime.fromtimestamp(last, datetime.UTC)
+        # Tables of adjacent years overlap, so transitions are keyed by instant.
+        transitions = {
+            int(transition.instant.replace(tzinfo=datetime.UTC).timestamp()): int(
+                transition.new_offset.total_seconds()
+            )
+            for year in range(first_date.year, last_date.year + 1)
+            for transition in dst_transitions(time_zone, year)
+        }
+        instants = sorted(instant for instant in transitions if instant > first)
+        initial = first_date.astimezone(time_zone).utcoffset() or datetime.timedelta()
+        return instants, [
+            int(initial.total_seconds()),
+            *(transitions[instant] for instant in instants),
+        ]
 
     def to_list(self) -> list[dict[str, Any]]:
         """Serialize the object as a list."""
@@ -247,34 +596,47 @@ class Schedule:
 
     def next_update(self, date: datetime.datetime) -> datetime.datetime | None:
         """Calculate the next date and time when the state is going to change."""
-        if not self._schedule:
-            return None
-
-        if not (
-            timestamps := self._to_off if self.containing(date.time()) else self._to_on
-        ):
-            return None
-
-        time = date.time()
-        prev = MIDNIGHT
-        today = date.date()
-
-        # Find the smallest timestamp which is bigger than time.
-        for current in timestamps:
-            if prev <= time < current:
-                result = datetime.datetime.combine(today, current, tzinfo=date.tzinfo)
-                break
-            prev = current
-
-        # Time is bigger than all timestamps. Use tomorrow's 1st timestamp.
-        else:
-            result = datetime.datetime.combine(
-                today + datetime.timedelta(days=1),
-                timestamps[0],
-                tzinfo=date.tzinfo,
+        return next(self.iter_updates(date), None)
+
+    def iter_updates(
+        self, date: datetime.datetime, until: datetime.datetime | None = None
+    ) -> Iterator[datetime.datetime]:
+        """Iterate over the future updates (up to "until" if provided)."""
+        day = date.date()
+        plan = self._plan_of(day)
+        index = bisect_right(plan.boundaries, time_offset(date.time()))
+        while True:
+            if index < len(plan.boundaries):
+                time = plan.transitions[index]
+            else:
+                # Time is bigger than all timestamps. Use tomorrow's plan.
+                final_on = plan.final_on
+                day += datetime.timedelta(days=1)
+                plan = self._plan_of(day)
+                index = 0
+                if final_on == plan.initial_on:
+                    if not plan.boundaries and day not in self._plans:
+                        return  # The following days have no updates.
+                    continue
+                # The planned days continue each other (see "DayPlan.continued"),
+                # so it's the first day which isn't planned.
+                time = MIDNIGHT
+            update = self._handle_dst(
+                date, datetime.datetime.combine(day, time, tzinfo=date.tzinfo)
             )
+            if until is not None and (
+                update.timestamp() > until.timestamp()
+                if update.tzinfo is not None
+                else update > until
+            ):
+                return
+            yield update
 
-        return self._handle_dst(date, result)
+            # The next transition (the DST handling might have moved the update).
+            day = update.date()
+            plan = self._plan_of(day)
+            index = bisect_right(plan.boundaries, time_offset(update.time()))
+            date = update
 
     def _handle_dst(
         self, date: datetime.datetime, result: datetime.datetime
@@ -284,13 +646,9 @@ class Schedule:
             return result
 
         # Handle non-existent (imaginary) time due to forward jump, e.g. 2am => 3am.
-        # We check if the time exists by converting it to UTC and back.
-        if result != result.astimezone(datetime.UTC).astimezone(result.tzinfo):
-            # Find the next valid minute (DST uses minute bounds).
-            result = result.replace(second=0, microsecond=0)
-            while result != result.astimezone(datetime.UTC).astimezone(result.tzinfo):
-                result += MINUTE
-            return result
+        # The next valid time is the end of the gap (DST uses minute bounds).
+        if (end := gap_end(result)) is not None:
+            return end
 
         # Handle ambiguous time (fall back) due to backward jump, e.g. 2am => 1am.
         if (
@@ -302,7 +660,10 @@ class Schedule:
             and (fold1_start := self._fold1_start(date, result)) is not None
         ):
             # If the beginning of "fold=1" is an update, use it.
-            if self.containing(date.time()) != self.containing(fold1_start.time()):
+            plan = self._plan_of(fold1_start.date())
+            if plan.containing(time_offset(date.time())) != plan.containing(
+                time_offset(fold1_start.time())
+            ):
                 return fold1_start
 
             # Find the 1st update from the beginning of "fold=1".
@@ -321,27 +682,20 @@ class Schedule:
     ) -> datetime.datetime | None:
         """Get the beginning of "fold=1" time range for the given date."""
         # Get the transition from "fold=0" to "fold=1".
-        transition = date.replace(second=0, microsecond=0)
-        if (old_offset := date.utcoffset()) is None:
+        if (transition := next_transition(date)) is None:
             return None  # pragma: no cover
-
-        while (new_offset := transition.utcoffset()) == old_offset:
-            transition += MINUTE
-            if transition > upper_bound:  # For safety, should never happen.
-                return None  # pragma: no cover
-        if new_offset is None:
+        if transition.instant + transition.old_offset > upper_bound.replace(
+            tzinfo=None
+        ):  # For safety, should never happen.
             return None  # pragma: no cover
 
         # Return the "fold=1" start.
-        return (transition + new_offset - old_offset).replace(fold=1)
+        return (transition.instant + transition.new_offset).replace(
+            tzinfo=date.tzinfo, fold=1
+        )
 
     def next_updates(
         self, date: datetime.datetime, count: int
     ) -> list[datetime.datetime]:
         """Get list of future updates."""
-        updates: list[datetime.datetime] = []
-        update = self.next_update(date)
-        while len(updates) < count and update is not None:
-            updates.append(update)
-            update = self.next_update(update)
-        return updates
+        return list(islice(self.iter_updates(date), count))
@@ -0,0 +1,153 @@
+"""Registry of compiled schedules, shared by the entities with the same config."""
+
+from __future__ import annotations
+
+import datetime
+import sys
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    CONF_DISABLED,
+    CONF_FROM,
+    CONF_TO,
+    DOMAIN,
+    SUNRISE_SYMBOL,
+    SUNSET_SYMBOL,
+)
+from .schedule import Schedule
+
+DATA_SCHEDULE_REGISTRY: HassKey[ScheduleRegistry] = HassKey(
+    f"{DOMAIN}_schedule_registry"
+)
+
+type ScheduleKey = tuple[tuple[tuple[str, str, bool], ...], bool]
+
+
+def normalize_time(value: Any) -> str:
+    """Return the time in the format of "Schedule.to_list" (e.g. "09:00:00")."""
+    time = str(value)
+    if time.startswith((SUNRISE_SYMBOL, SUNSET_SYMBOL)):
+        return time
+    return datetime.time.fromisoformat(time).isoformat()
+
+
+def deep_size(obj: Any, seen: set[int] | None = None) -> int:
+    """Return the approximate memory size (in bytes) of the object and its members."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(
+            deep_size(key, seen) + deep_size(value, seen) for key, value in obj.items()
+        )
+    elif isinstance(obj, list | tuple | set | frozenset):
+        size += sum(deep_size(item, seen) for item in obj)
+    if hasattr(obj, "__dict__"):
+        size += deep_size(vars(obj), seen)
+    return size
+
+
+class ScheduleRegistry:
+    """Intern the compiled static schedules (dynamic ones are resolved per entity)."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the object."""
+        self._hass = hass
+        self._schedules: dict[ScheduleKey, Schedule] = {}
+        self._users: dict[ScheduleKey, int] = {}
+        # Interned schedules are alive while they are registered, so ids are unique.
+        self._keys: dict[int, ScheduleKey] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @callback
+    def acquire(
+        self,
+        schedule: list[dict[str, Any]] | Schedule,
+        skip_reversed: bool,  # noqa: FBT001
+    ) -> tuple[Schedule, bool]:
+        """
+        Return the compiled schedule, and whether it was compiled by the call.
+
+        Call "release" when the schedule is no longer used.
+        """
+        # The schedule is compiled only if there is no identical one.
+        key = self._key(
+            schedule.to_list() if isinstance(schedule, Schedule) else schedule,
+            skip_reversed,
+        )
+        if (interned := self._schedules.get(key)) is not None:
+            self._users[key] += 1
+            self._hits += 1
+            return interned, False
+        if isinstance(schedule, Schedule):
+            compiled, is_compiled = schedule, False
+        else:
+            compiled, is_compiled = Schedule(self._hass, schedule, skip_reversed), True
+        if compiled.is_dynamic():
+            return compiled, is_compiled
+        self._schedules[key] = compiled
+        self._users[key] = 1
+        self._keys[id(compiled)] = key
+        self._misses += 1
+        return compiled, is_compiled
+
+    @staticmethod
+    def _key(
+        schedule: list[dict[str, Any]],
+        skip_reversed: bool,  # noqa: FBT001
+    ) -> ScheduleKey:
+        """Return the key of the (normalized) schedule config."""
+        return (
+            tuple(
+                sorted(
+                    (
+                        normalize_time(time_range[CONF_FROM]),
+                        normalize_time(time_range[CONF_TO]),
+                        bool(time_range.get(CONF_DISABLED, False)),
+                    )
+                    for time_range in schedule
+                )
+            ),
+            skip_reversed,
+        )
+
+    @callback
+    def release(self, schedule: Schedule) -> None:
+        """Drop a user of the schedule."""
+        if (key := self._keys.get(id(schedule))) is None:
+            return
+        self._users[key] -= 1
+        if not self._users[key]:
+            del self._schedules[key]
+            del self._users[key]
+            del self._keys[id(schedule)]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters."""
+        return {
+            "schedules": len(self._schedules),
+            "users": sum(self._users.values()),
+            "hits": self._hits,
+            "misses": self._misses,
+            "memory_saved": sum(
+                # Measured now, as the size of the objects can change after creation.
+                (users - 1) * deep_size(self._schedules[key])
+                for key, users in self._users.items()
+                if users > 1
+            ),
+        }
+
+
+@callback
+@singleton(DATA_SCHEDULE_REGISTRY)
+def async_get_schedule_registry(hass: HomeAssistant) -> ScheduleRegistry:
+    """Get the compiled schedules registry."""
+    return ScheduleRegistry(hass)
@@ -0,0 +1,90 @@
+"""Storage of the schedules (the config entries keep only the flags)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, SAVE_DELAY
+
+DATA_SCHEDULE_STORE: HassKey[ScheduleStore] = HassKey(f"{DOMAIN}_schedule_store")
+
+STORAGE_KEY = DOMAIN
+STORAGE_VERSION = 1
+
+type StoredSchedules = dict[str, list[dict[str, Any]]]
+
+
+class ScheduleStore:
+    """The schedules of the config entries, keyed by the entry ID."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the object."""
+        self._store: Store[dict[str, StoredSchedules]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._schedules: StoredSchedules = {}
+        self._saves = 0
+
+    async def async_load(self) -> None:
+        """Load the schedules from the storage."""
+        if (data := await self._store.async_load()) is not None:
+            self._schedules = data["schedules"]
+
+    def get(self, entry_id: str) -> list[dict[str, Any]]:
+        """Return the schedule of the config entry."""
+        return self._schedules.get(entry_id, [])
+
+    async def async_set(
+        self,
+        entry_id: str,
+        schedule: list[dict[str, Any]],
+        *,
+        delay: bool = True,
+    ) -> None:
+        """Set the schedule of the config entry and save it (a bit later or now)."""
+        self._schedules[entry_id] = schedule
+        if delay:
+            # Changes in the next few seconds are saved together.
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        else:
+            await self.async_save()
+
+    @callback
+    def async_set_many(self, schedules: StoredSchedules) -> None:
+        """Set the schedules of many config entries, and save them a bit later."""
+        if schedules:
+            self._schedules.update(schedules)
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Save the schedules now (including the pending changes)."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Remove the schedule of the config entry."""
+        if self._schedules.pop(entry_id, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, StoredSchedules]:
+        """Return the data to store."""
+        self._saves += 1
+        return {"schedules": self._schedules}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters."""
+        return {"schedules": len(self._schedules), "saves": self._saves}
+
+
+@singleton(DATA_SCHEDULE_STORE, async_=True)
+async def async_get_schedule_store(hass: HomeAssistant) -> ScheduleStore:
+    """Get the (loaded) schedules store."""
+    store = ScheduleStore(hass)
+    await store.async_load()
+    return store
@@ -0,0 +1,165 @@
+"""Shared timer for all the daily schedule entities."""
+
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from typing import TYPE_CHECKING, Any
+
+import homeassistant.util.dt as dt_util
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import event as event_helper
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Callable
+
+DATA_SCHEDULER: HassKey[ToggleScheduler] = HassKey(f"{DOMAIN}_scheduler")
+
+
+class ToggleScheduler:
+    """Wake up once per distinct instant and dispatch all the due actions."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the object."""
+        self._hass = hass
+        # Heap of instants (UTC timestamps). Removed instants are skipped lazily.
+        self._instants: list[float] = []
+        self._actions: dict[float, dict[int, Callable[[datetime.datetime], None]]] = {}
+        self._ids = count()
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._timer_instant: float | None = None
+        self._dispatching = False
+        # Writes of the entities which are due at the same tick are flushed
+        # together, after all of them are computed. An entity which is updated
+        # more than once in the tick writes only its final state.
+        self._writes: dict[Callable[[], None], None] = {}
+        self._pending = 0
+        self._scheduled = 0
+        self._timers = 0
+        self._wakeups = 0
+        self._dispatched = 0
+        self._batched_writes = 0
+        self._coalesced_writes = 0
+
+    @callback
+    def async_schedule(
+        self,
+        point_in_time: datetime.datetime,
+        action: Callable[[datetime.datetime], None],
+    ) -> CALLBACK_TYPE:
+        """Call the action at the point in time. Return a function to cancel it."""
+        instant = dt_util.as_utc(point_in_time).timestamp()
+        if (actions := self._actions.get(instant)) is None:
+            actions = self._actions[instant] = {}
+            heapq.heappush(self._instants, instant)
+        action_id = next(self._ids)
+        actions[action_id] = action
+        self._pending += 1
+        self._scheduled += 1
+        if not self._dispatching and (
+            self._timer_instant is None or instant < self._timer_instant
+        ):
+            self._arm()
+
+        @callback
+        def cancel() -> None:
+            """Remove the action."""
+            if (actions := self._actions.get(instant)) is None or actions.pop(
+                action_id, None
+            ) is None:
+                return
+            self._pending -= 1
+            if not actions:
+                del self._actions[instant]
+                if instant == self._timer_instant:
+                    self._arm()
+
+        return cancel
+
+    @callback
+    def _arm(self) -> None:
+        """Set the timer to the earliest instant (if any)."""
+        while self._instants and self._instants[0] not in self._actions:
+            heapq.heappop(self._instants)
+        instant = self._instants[0] if self._instants else None
+        if instant == self._timer_instant:
+            return
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._timer_instant = instant
+        if instant is not None:
+            self._unsub_timer = event_helper.async_track_point_in_utc_time(
+                self._hass,
+                self._async_fire,
+                dt_util.utc_from_timestamp(instant),
+            )
+            self._timers += 1
+
+    @callback
+    def _async_fire(self, now: datetime.datetime) -> None:
+        """Dispatch all the actions which are due."""
+        self._unsub_timer = None
+        self._timer_instant = None
+        self._wakeups += 1
+        # Collect the due actions upfront, so actions scheduled while dispatching
+        # (e.g. the next toggle) are left for the next wake-up.
+        deadline = max(now, dt_util.utcnow()).timestamp()
+        due: list[Callable[[datetime.datetime], None]] = []
+        while self._instants and self._instants[0] <= deadline:
+            if actions := self._actions.pop(heapq.heappop(self._instants), None):
+                due.extend(actions.values())
+        self._pending -= len(due)
+        self._dispatched += len(due)
+        self._dispatching = True
+        try:
+            for action in due:
+                try:
+                    action(now)
+                # Any failure of an entity mustn't stop the others (and the timer).
+                except Exception:  # noqa: BLE001
+                    LOGGER.exception("Error while dispatching a daily schedule toggle")
+        finally:
+            self._dispatching = False
+            self._arm()
+            writes, self._writes = self._writes, {}
+            self._batched_writes += len(writes)
+            for write in writes:
+                write()
+
+    @callback
+    def async_write(self, write: Callable[[], None]) -> None:
+        """Write the state now, or once with the other writes of the current tick."""
+        if not self._dispatching:
+            write()
+        elif write in self._writes:
+            self._coalesced_writes += 1
+        else:
+            self._writes[write] = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters."""
+        return {
+            "pending": self._pending,
+            "pending_instants": len(self._actions),
+            "scheduled": self._scheduled,
+            "timers": self._timers,
+            "wakeups": self._wakeups,
+            "dispatched": self._dispatched,
+            "batched_writes": self._batched_writes,
+            "coalesced_writes": self._coalesced_writes,
+            # Each scheduled action would have been a timer handle of its own.
+            "handles_saved": self._scheduled - self._timers,
+        }
+
+
+@callback
+@singleton(DATA_SCHEDULER)
+def async_get_scheduler(hass: HomeAssistant) -> ToggleScheduler:
+    """Get the scheduler shared by all the entities."""
+    return ToggleScheduler(hass)
@@ -0,0 +1,202 @@
+"""Integration-wide services."""
+
+from __future__ import annotations
+
+import datetime
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
+
+import homeassistant.helpers.config_validation as cv
+import homeassistant.util.dt as dt_util
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import IntegrationError
+from homeassistant.helpers import entity_registry as er
+
+from .binary_sensor import ENTRY_SCHEMA
+from .const import (
+    ATTR_ERROR,
+    ATTR_INTERVALS,
+    ATTR_RESULTS,
+    ATTR_STATES,
+    ATTR_SUCCESS,
+    CONF_DELAYED_SAVE,
+    CONF_END,
+    CONF_FROM,
+    CONF_SCHEDULES,
+    CONF_SKIP_REVERSED,
+    CONF_START,
+    CONF_TIMES,
+    CONF_TO,
+    DOMAIN,
+    MAX_QUERY_WINDOW,
+    SERVICE_QUERY,
+    SERVICE_SET_MANY,
+)
+from .entity_index import async_get_entity_index
+from .schedule import Schedule
+from .schedule_store import async_get_schedule_store
+
+if TYPE_CHECKING:
+    from .binary_sensor import DailyScheduleConfigEntry, DailyScheduleSensor
+    from .entity_index import EntityIndex
+
+SCHEDULE_SCHEMA = vol.All(cv.ensure_list, [ENTRY_SCHEMA])
+SERVICE_SET_MANY_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SCHEDULES): vol.Schema({cv.entity_id: vol.Any(list, dict)}),
+    }
+)
+
+
+def _valid_window(data: dict[str, Any]) -> dict[str, Any]:
+    """Validate the window (if any) is not empty and not too long."""
+    if CONF_START in data and not (
+        datetime.timedelta() < data[CONF_END] - data[CONF_START] <= MAX_QUERY_WINDOW
+    ):
+        error_message = "The window must end after its start, and be up to a year."
+        raise vol.Invalid(error_message)
+    return data
+
+
+# Naive dates and times are local.
+QUERY_DATETIME = vol.All(cv.datetime, dt_util.as_local)
+SERVICE_QUERY_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+            vol.Optional(CONF_TIMES): vol.All(cv.ensure_list, [QUERY_DATETIME]),
+            vol.Inclusive(CONF_START, "window"): QUERY_DATETIME,
+            vol.Inclusive(CONF_END, "window"): QUERY_DATETIME,
+        }
+    ),
+    cv.has_at_least_one_key(CONF_TIMES, CONF_START),
+    cv.has_at_most_one_key(CONF_TIMES, CONF_START),
+    _valid_window,
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration-wide services."""
+
+    async def async_set_many(call: ServiceCall) -> ServiceResponse:
+        """Set the schedules of many entities at once."""
+        registry = er.async_get(hass)
+        store = await async_get_schedule_store(hass)
+        results: dict[str, Any] = {}
+        updates: dict[str, tuple[DailyScheduleConfigEntry, Schedule]] = {}
+        # Validate and compile everything first.
+        for entity_id, schedule in call.data[CONF_SCHEDULES].items():
+            try:
+                config_entry = _config_entry(hass, registry, entity_id)
+                compiled = Schedule(
+                    hass,
+                    SCHEDULE_SCHEMA(schedule),
+                    config_entry.options.get(CONF_SKIP_REVERSED, False),
+                )
+            except (vol.Invalid, IntegrationError) as err:
+                results[entity_id] = {ATTR_SUCCESS: False, ATTR_ERROR: str(err)}
+                continue
+            results[entity_id] = {ATTR_SUCCESS: True}
+            if compiled.to_list() != store.get(config_entry.entry_id):
+                updates[config_entry.entry_id] = (config_entry, compiled)
+
+        # Then apply the updates together (without yielding in between).
+        store.async_set_many(
+            {
+                entry_id: schedule.to_list()
+                for entry_id, (_, schedule) in updates.items()
+            }
+        )
+        for config_entry, schedule in updates.values():
+            if config_entry.runtime_data:
+                config_entry.runtime_data.entity.config_update(schedule)
+        if any(
+            not config_entry.options.get(CONF_DELAYED_SAVE, True)
+            for config_entry, _ in updates.values()
+        ):
+            # Some of the entities are saved immediately (in a single save).
+            await store.async_save()
+        return {ATTR_RESULTS: results}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_MANY,
+        async_set_many,
+        schema=SERVICE_SET_MANY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_query(call: ServiceCall) -> ServiceResponse:
+        """Evaluate the schedules of the entities at the times, or over the window."""
+        index = async_get_entity_index(hass)
+        dates: list[datetime.datetime] = call.data.get(CONF_TIMES, [])
+        # The times are converted once, and evaluated together per entity.
+        timestamps = [date.timestamp() for date in dates]
+        vectorized = find_spec("numpy") is not None
+        results: dict[str, Any] = {}
+        for entity_id in call.data[ATTR_ENTITY_ID]:
+            try:
+                entity = _entity(index, entity_id)
+                if CONF_TIMES in call.data:
+                    result = {
+                        ATTR_STATES: entity.is_on_array(timestamps).tolist()
+                        if vectorized
+                        else [entity.is_on_at(date) for date in dates]
+                    }
+                else:
+                    result = {
+                        ATTR_INTERVALS: [
+                            {CONF_FROM: start.isoformat(), CONF_TO: end.isoformat()}
+                            for start, end in entity.on_intervals(
+                                call.data[CONF_START], call.data[CONF_END]
+                            )
+                        ]
+                    }
+            except IntegrationError as err:
+                results[entity_id] = {ATTR_SUCCESS: False, ATTR_ERROR: str(err)}
+                continue
+            results[entity_id] = {ATTR_SUCCESS: True, **result}
+        return {ATTR_RESULTS: results}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY,
+        async_query,
+        schema=SERVICE_QUERY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _config_entry(
+    hass: HomeAssistant, registry: er.EntityRegistry, entity_id: str
+) -> DailyScheduleConfigEntry:
+    """Return the loaded config entry of the entity."""
+    if (
+        (entry := registry.async_get(entity_id)) is None
+        or entry.platform != DOMAIN
+        or entry.config_entry_id is None
+        or (config_entry := hass.config_entries.async_get_entry(entry.config_entry_id))
+        is None
+        or config_entry.state is not ConfigEntryState.LOADED
+    ):
+        error_message = f"{entity_id} is not a loaded daily schedule entity."
+        raise IntegrationError(error_message)
+    return config_entry
+
+
+def _entity(index: EntityIndex, entity_id: str) -> DailyScheduleSensor:
+    """Return the loaded entity."""
+    if (entity := index.entity(entity_id)) is None:
+        error_message = f"{entity_id} is not a loaded daily schedule entity."
+        raise IntegrationError(error_message)
+    return entity
@@ -0,0 +1,71 @@
+"""Instrumentation of the entities' hot paths."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+@dataclass(slots=True)
+class EntityStats:
+    """Counters and timings (in seconds) of an entity."""
+
+    updates: int = 0
+    update_time: float = 0.0
+    max_update_time: float = 0.0
+    compilations: int = 0
+    compile_time: float = 0.0
+    sun_resolutions: int = 0
+    timer_reschedules: int = 0
+    # The time between the scheduled toggle and the state write.
+    last_toggle_latency: float | None = None
+
+    def add_update(self, duration: float) -> None:
+        """Record a state update."""
+        self.updates += 1
+        self.update_time += duration
+        self.max_update_time = max(self.max_update_time, duration)
+
+    def add_compilation(self, duration: float) -> None:
+        """Record a schedule compilation (or a sunrise/sunset resolution)."""
+        self.compilations += 1
+        self.compile_time += duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters (times are in milliseconds)."""
+        return {
+            "updates": self.updates,
+            "update_time_ms": self.update_time * 1e3,
+            "max_update_time_ms": self.max_update_time * 1e3,
+            "compilations": self.compilations,
+            "compile_time_ms": self.compile_time * 1e3,
+            "sun_resolutions": self.sun_resolutions,
+            "timer_reschedules": self.timer_reschedules,
+            "last_toggle_latency_ms": None
+            if self.last_toggle_latency is None
+            else self.last_toggle_latency * 1e3,
+        }
+
+
+def aggregate(stats: Iterable[EntityStats]) -> dict[str, Any]:
+    """Return the counters of all the entities."""
+    total = EntityStats()
+    entities = 0
+    for entity_stats in stats:
+        entities += 1
+        total.updates += entity_stats.updates
+        total.update_time += entity_stats.update_time
+        total.max_update_time = max(total.max_update_time, entity_stats.max_update_time)
+        total.compilations += entity_stats.compilations
+        total.compile_time += entity_stats.compile_time
+        total.sun_resolutions += entity_stats.sun_resolutions
+        total.timer_reschedules += entity_stats.timer_reschedules
+        if entity_stats.last_toggle_latency is not None:
+            total.last_toggle_latency = max(
+                total.last_toggle_latency or 0.0, entity_stats.last_toggle_latency
+            )
+    # The aggregated latency is the maximum of the entities' last ones.
+    return {"entities": entities, **total.as_dict()}
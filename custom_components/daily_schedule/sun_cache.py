@@ -0,0 +1,79 @@
+"""Per-day cache of sunrise and sunset times, shared by all the schedules."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import homeassistant.util.dt as dt_util
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import sun
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    import datetime
+
+DATA_SUN_CACHE: HassKey[SunCache] = HassKey(f"{DOMAIN}_sun_cache")
+
+type SunCacheKey = tuple[datetime.date, float, float, float, str]
+
+
+class SunCache:
+    """Compute each astral event once per day and location."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the object."""
+        self._hass = hass
+        self._events: dict[SunCacheKey, datetime.datetime | None] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._async_invalidate)
+
+    def get_event(self, event: str, date: datetime.date) -> datetime.datetime | None:
+        """Return the time of the astral event (sunrise or sunset) in the date."""
+        key = (
+            date,
+            self._hass.config.latitude,
+            self._hass.config.longitude,
+            self._hass.config.elevation,
+            event,
+        )
+        if key in self._events:
+            self._hits += 1
+            return self._events[key]
+        self._misses += 1
+        # Entries of previous days are not needed anymore.
+        today = dt_util.now().date()
+        self._events = {
+            cached_key: value
+            for cached_key, value in self._events.items()
+            if cached_key[0] >= today
+        }
+        self._events[key] = sun.get_astral_event_date(self._hass, event, date)
+        return self._events[key]
+
+    @callback
+    def _async_invalidate(self, _: Event) -> None:
+        """Drop the cached times, since the location might have been changed."""
+        self._events.clear()
+        self._invalidations += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters."""
+        return {
+            "size": len(self._events),
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+        }
+
+
+@callback
+@singleton(DATA_SUN_CACHE)
+def async_get_sun_cache(hass: HomeAssistant) -> SunCache:
+    """Get the sunrise and sunset cache shared by all the schedules."""
+    return SunCache(hass)
@@ -2,17 +2,62 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import datetime
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING, cast
 
+import homeassistant.helpers.config_validation as cv
+import homeassistant.util.dt as dt_util
+import voluptuous as vol
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    CONF_OFFSET,
+    CONF_OPTIONS,
+    CONF_TARGET,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.automation import DomainSpec
-from homeassistant.helpers.trigger import EntityTargetStateTriggerBase, Trigger
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.target import TargetEntityChangeTracker, TargetSelection
+from homeassistant.helpers.trigger import (
+    EntityTargetStateTriggerBase,
+    Trigger,
+    TriggerActionRunner,
+    TriggerConfig,
+)
 
+from .const import (
+    ATTR_OFFSET,
+    ATTR_TOGGLE,
+    MAX_TRIGGER_OFFSET,
+    SIGNAL_TOGGLE,
+    SIGNAL_UPDATE,
+)
 from .entity_filter import DailyScheduleEntityFilter
+from .entity_index import async_get_entity_index
+from .scheduler import async_get_scheduler
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from collections.abc import Callable
+
+    from homeassistant.helpers.typing import ConfigType
+
+SCHEDULE_TRIGGER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TARGET): cv.TARGET_FIELDS,
+        vol.Optional(CONF_OPTIONS): {
+            # Negative offsets are before the toggle.
+            vol.Optional(CONF_OFFSET): vol.All(
+                cv.time_period,
+                vol.Range(min=-MAX_TRIGGER_OFFSET, max=MAX_TRIGGER_OFFSET),
+            ),
+        },
+    }
+)
 
 
 def _make_trigger(to_state: str) -> type[EntityTargetStateTriggerBase]:
@@ -27,9 +72,200 @@ def _make_trigger(to_state: str) -> type[EntityTargetStateTriggerBase]:
     return DailyScheduleTrigger
 
 
+class _ToggleTracker(TargetEntityChangeTracker):
+    """Track the toggles of the targeted daily schedules (via the dispatcher)."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        target_selection: TargetSelection,
+        action: Callable[[str, str, datetime.datetime], None],
+        entity_filter: Callable[[set[str]], set[str]],
+    ) -> None:
+        """Initialize the object."""
+        super().__init__(hass, target_selection, entity_filter)
+        self._action = action
+        self._unsub_signals: list[CALLBACK_TYPE] = []
+
+    @callback
+    def _handle_entities_update(self, tracked_entities: set[str]) -> None:
+        """Connect to the signals of the tracked entities."""
+        self._disconnect()
+        self._unsub_signals = [
+            async_dispatcher_connect(
+                self._hass,
+                SIGNAL_TOGGLE.format(entity_id),
+                partial(self._action, entity_id),
+            )
+            for entity_id in tracked_entities
+        ]
+
+    @callback
+    def _disconnect(self) -> None:
+        """Disconnect from the signals."""
+        for unsub in self._unsub_signals:
+            unsub()
+        self._unsub_signals = []
+
+    def _unsubscribe(self) -> None:
+        """Unsubscribe from all events and signals."""
+        super()._unsubscribe()
+        self._disconnect()
+
+
+class _OffsetTracker(TargetEntityChangeTracker):
+    """Schedule the offset toggles of the targeted daily schedules."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        target_selection: TargetSelection,
+        action: Callable[[str, str, datetime.datetime], None],
+        entity_filter: Callable[[set[str]], set[str]],
+        *,
+        to_state: str,
+        offset: datetime.timedelta,
+    ) -> None:
+        """Initialize the object."""
+        super().__init__(hass, target_selection, entity_filter)
+        self._action = action
+        self._to_state = to_state
+        self._offset = offset
+        self._unsub_signals: dict[str, CALLBACK_TYPE] = {}
+        # The pending instant of each entity, and its cancel function.
+        self._timers: dict[str, tuple[datetime.datetime, CALLBACK_TYPE]] = {}
+
+    @callback
+    def _handle_entities_update(self, tracked_entities: set[str]) -> None:
+        """Track the added entities, and stop tracking the removed ones."""
+        for entity_id in self._unsub_signals.keys() - tracked_entities:
+            self._unsub_signals.pop(entity_id)()
+            self._cancel(entity_id)
+        for entity_id in tracked_entities - self._unsub_signals.keys():
+            self._unsub_signals[entity_id] = async_dispatcher_connect(
+                self._hass,
+                SIGNAL_UPDATE.format(entity_id),
+                partial(self._async_update, entity_id),
+            )
+            self._async_update(entity_id)
+
+    @callback
+    def _cancel(self, entity_id: str) -> None:
+        """Cancel the pending instant of the entity."""
+        if (timer := self._timers.pop(entity_id, None)) is not None:
+            timer[1]()
+
+    @callback
+    def _async_update(self, entity_id: str) -> None:
+        """Reschedule after the entity's schedule was changed."""
+        if (timer := self._timers.get(entity_id)) is not None and (
+            timer[0] <= dt_util.utcnow()
+        ):
+            return  # It's due in the current tick, and reschedules itself.
+        self._cancel(entity_id)
+        self._schedule(entity_id, dt_util.utcnow() - self._offset)
+
+    @callback
+    def _schedule(self, entity_id: str, start: datetime.datetime) -> None:
+        """Schedule the first offset toggle (to the state) after the start."""
+        if (entity := async_get_entity_index(self._hass).entity(entity_id)) is None:
+            return
+        for toggle, is_on in islice(entity.iter_toggles(start), 2):
+            # Toggles alternate, so one of the next two switches to the state.
+            if (STATE_ON if is_on else STATE_OFF) == self._to_state:
+                instant = dt_util.as_utc(toggle) + self._offset
+                self._timers[entity_id] = (
+                    instant,
+                    async_get_scheduler(self._hass).async_schedule(
+                        instant, partial(self._async_fire, entity_id, toggle)
+                    ),
+                )
+                return
+
+    @callback
+    def _async_fire(
+        self, entity_id: str, toggle: datetime.datetime, _: datetime.datetime
+    ) -> None:
+        """Run the action, and schedule the next offset toggle."""
+        del self._timers[entity_id]
+        self._action(entity_id, self._to_state, toggle)
+        self._schedule(entity_id, toggle)
+
+    def _unsubscribe(self) -> None:
+        """Unsubscribe from all events and signals, and cancel the timers."""
+        super()._unsubscribe()
+        for unsub in self._unsub_signals.values():
+            unsub()
+        self._unsub_signals.clear()
+        for entity_id in list(self._timers):
+            self._cancel(entity_id)
+
+
+def _make_schedule_trigger(to_state: str) -> type[Trigger]:
+    """Create a trigger fired by the schedule itself when reaching the state."""
+
+    class DailyScheduleToggleTrigger(DailyScheduleEntityFilter, Trigger):
+        """Trigger at (or an offset from) a daily schedule toggling to a state."""
+
+        @classmethod
+        async def async_validate_config(
+            cls, _hass: HomeAssistant, config: ConfigType
+        ) -> ConfigType:
+            """Validate config."""
+            return cast("ConfigType", SCHEDULE_TRIGGER_SCHEMA(config))
+
+        def __init__(self, hass: HomeAssistant, config: TriggerConfig) -> None:
+            """Initialize the trigger."""
+            super().__init__(hass, config)
+            self._target = config.target or {}
+            self._offset: datetime.timedelta = (config.options or {}).get(
+                CONF_OFFSET, datetime.timedelta()
+            )
+
+        async def async_attach_runner(
+            self, run_action: TriggerActionRunner
+        ) -> CALLBACK_TYPE:
+            """Run the action when a targeted schedule toggles to the state."""
+
+            @callback
+            def toggled(entity_id: str, state: str, toggle: datetime.datetime) -> None:
+                """Handle a toggle of a targeted entity."""
+                if state == to_state:
+                    run_action(
+                        {
+                            ATTR_ENTITY_ID: entity_id,
+                            ATTR_TOGGLE: toggle,
+                            ATTR_OFFSET: self._offset,
+                        },
+                        f"schedule of {entity_id}",
+                    )
+
+            target_selection = TargetSelection(self._target)
+            # The index is created first, so it handles the registry events before
+            # the tracker (which filters by it).
+            async_get_entity_index(self._hass)
+            if not self._offset:
+                # At the toggle itself, as sent by the entity.
+                return _ToggleTracker(
+                    self._hass, target_selection, toggled, self.entity_filter
+                ).async_setup()
+            return _OffsetTracker(
+                self._hass,
+                target_selection,
+                toggled,
+                self.entity_filter,
+                to_state=to_state,
+                offset=self._offset,
+            ).async_setup()
+
+    return DailyScheduleToggleTrigger
+
+
 TRIGGERS: dict[str, type[Trigger]] = {
     "turned_on": _make_trigger(STATE_ON),
     "turned_off": _make_trigger(STATE_OFF),
+    "scheduled_on": _make_schedule_trigger(STATE_ON),
+    "scheduled_off": _make_schedule_trigger(STATE_OFF),
 }
 
 
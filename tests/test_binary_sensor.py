@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 import datetime
+from itertools import islice
 from typing import TYPE_CHECKING, Any
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import Mock, patch
 
+import homeassistant.util.dt as dt_util
 import pytest
 import pytz
 import voluptuous as vol
-from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF, STATE_ON, Platform
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    STATE_OFF,
+    STATE_ON,
+    Platform,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
     async_fire_time_changed,
@@ -19,28 +29,36 @@ from custom_components.daily_schedule.const import (
     ATTR_EFFECTIVE_SCHEDULE,
     ATTR_NEXT_TOGGLE,
     ATTR_NEXT_TOGGLES,
+    CONF_DELAYED_SAVE,
+    CONF_DISABLED,
     CONF_FROM,
     CONF_SCHEDULE,
     CONF_SKIP_REVERSED,
     CONF_TO,
     CONF_UTC,
     DOMAIN,
+    SAVE_DELAY,
     SERVICE_SET,
+    SIGNAL_TOGGLE,
+    SIGNAL_UPDATE,
     SUNRISE_SYMBOL,
     SUNSET_SYMBOL,
 )
+from custom_components.daily_schedule.schedule import Schedule
 
 if TYPE_CHECKING:
     from freezegun.api import FrozenDateTimeFactory
     from homeassistant.core import Event, HomeAssistant
 
 
-async def setup_entity(
+async def setup_entity(  # noqa: PLR0913
     hass: HomeAssistant,
     name: str,
     schedule: list[dict[str, Any]],
     utc: bool = False,  # noqa: FBT001, FBT002
     skip_reversed: bool = False,  # noqa: FBT001, FBT002
+    *,
+    delayed_save: bool = False,
 ) -> None:
     """Create a new entity by adding a config entry."""
     config_entry = MockConfigEntry(
@@ -48,6 +66,7 @@ async def setup_entity(
             CONF_SCHEDULE: schedule,
             CONF_UTC: utc,
             CONF_SKIP_REVERSED: skip_reversed,
+            CONF_DELAYED_SAVE: delayed_save,
         },
         domain=DOMAIN,
         title=name,
@@ -198,9 +217,9 @@ async def test_entire_day(hass: HomeAssistant, schedule: list[dict[str, Any]]) -
 
 
 @patch("homeassistant.util.dt.now")
-@patch("homeassistant.helpers.event.async_track_point_in_time")
+@patch("custom_components.daily_schedule.scheduler.ToggleScheduler.async_schedule")
 async def test_next_update(
-    async_track_point_in_time: AsyncMock, mock_now: Mock, hass: HomeAssistant
+    async_schedule: Mock, mock_now: Mock, hass: HomeAssistant
 ) -> None:
     """Test next update time."""
     mock_now.return_value = datetime.datetime.fromisoformat("2000-01-01")
@@ -211,7 +230,7 @@ async def test_next_update(
     previous_10_minutes = mock_now.return_value + datetime.timedelta(minutes=-10)
 
     # No schedule => no updates.
-    assert async_track_point_in_time.call_count == 0
+    assert async_schedule.call_count == 0
 
     # Inside a time range.
     await setup_entity(
@@ -227,7 +246,7 @@ async def test_next_update(
     state = hass.states.get(f"{Platform.BINARY_SENSOR}.test1")
     assert state
     assert state.state == STATE_ON
-    next_update = async_track_point_in_time.call_args[0][2]
+    next_update = async_schedule.call_args[0][0]
     assert next_update == in_5_minutes
     state = hass.states.get(f"{Platform.BINARY_SENSOR}.test1")
     assert state
@@ -254,7 +273,7 @@ async def test_next_update(
     assert state
     assert state.state == STATE_OFF
     expected_next_update = previous_10_minutes + datetime.timedelta(days=1)
-    next_update = async_track_point_in_time.call_args[0][2]
+    next_update = async_schedule.call_args[0][0]
     assert next_update == expected_next_update
     state = hass.states.get(f"{Platform.BINARY_SENSOR}.test2")
     assert state
@@ -280,7 +299,7 @@ async def test_next_update(
     state = hass.states.get(f"{Platform.BINARY_SENSOR}.test3")
     assert state
     assert state.state == STATE_OFF
-    next_update = async_track_point_in_time.call_args[0][2]
+    next_update = async_schedule.call_args[0][0]
     assert next_update == in_5_minutes
     assert state.attributes[ATTR_NEXT_TOGGLE] == in_5_minutes
     assert state.attributes[ATTR_NEXT_TOGGLES] == [
@@ -360,6 +379,255 @@ async def test_set_preserves_options(hass: HomeAssistant) -> None:
     await async_cleanup(hass)
 
 
+async def test_is_on_cached(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the state is calculated once until the next toggle (or midnight)."""
+    freezer.move_to("2025-03-12T09:00:00+02:00")
+    await setup_entity(hass, "My Test", [{CONF_FROM: "10:00", CONF_TO: "11:00"}])
+    entity = hass.config_entries.async_entries(DOMAIN)[0].runtime_data.entity
+    with patch.object(
+        Schedule, "containing_at", autospec=True, side_effect=Schedule.containing_at
+    ) as containing_at:
+        assert not any(entity.is_on for _ in range(10))
+        freezer.move_to("2025-03-12T09:59:59+02:00")
+        assert not entity.is_on
+        assert containing_at.call_count == 0
+
+        # The toggle is due (before its timer fires), and the state is cached
+        # until the following one.
+        freezer.move_to("2025-03-12T10:00:00+02:00")
+        assert all(entity.is_on for _ in range(10))
+        assert containing_at.call_count == 1
+        freezer.move_to("2025-03-12T11:00:00+02:00")
+        assert not any(entity.is_on for _ in range(10))
+        assert containing_at.call_count == 2
+
+        # The next toggle is tomorrow, but the state is calculated again at
+        # midnight (the plan of the day may be different).
+        freezer.move_to("2025-03-12T23:59:59+02:00")
+        assert not entity.is_on
+        assert containing_at.call_count == 2
+        freezer.move_to("2025-03-13T00:00:00+02:00")
+        assert not entity.is_on
+        assert containing_at.call_count == 3
+    await async_cleanup(hass)
+
+
+async def test_toggle_signal(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the toggles of the schedule are sent to the dispatcher."""
+    freezer.move_to("2025-03-12T09:00:00+02:00")
+    entity_id = f"{Platform.BINARY_SENSOR}.my_test"
+    await setup_entity(hass, "My Test", [{CONF_FROM: "10:00", CONF_TO: "11:00"}])
+    toggles: list[tuple[str, datetime.datetime]] = []
+
+    @callback
+    def toggled(state: str, toggle: datetime.datetime) -> None:
+        toggles.append((state, toggle))
+
+    async_dispatcher_connect(hass, SIGNAL_TOGGLE.format(entity_id), toggled)
+    on = dt_util.parse_datetime("2025-03-12T10:00:00+02:00")
+    off = dt_util.parse_datetime("2025-03-12T11:00:00+02:00")
+    for when in (on, off):
+        freezer.move_to(when)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    assert toggles == [(STATE_ON, on), (STATE_OFF, off)]
+
+    # Changing the schedule is not a toggle.
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET,
+        {CONF_SCHEDULE: [{CONF_FROM: "00:00", CONF_TO: "00:00"}]},
+        target={ATTR_ENTITY_ID: entity_id},
+    )
+    await hass.async_block_till_done()
+    assert hass.states.is_state(entity_id, STATE_ON)
+    assert len(toggles) == 2
+    await async_cleanup(hass)
+
+
+async def test_update_signal(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test changes of the schedule (not the toggles) are sent to the dispatcher."""
+    freezer.move_to("2025-03-12T09:00:00+02:00")
+    entity_id = f"{Platform.BINARY_SENSOR}.my_test"
+    await setup_entity(hass, "My Test", [{CONF_FROM: "10:00", CONF_TO: "11:00"}])
+    updates = Mock()
+    async_dispatcher_connect(hass, SIGNAL_UPDATE.format(entity_id), updates)
+
+    freezer.move_to("2025-03-12T10:00:00+02:00")
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert updates.call_count == 0
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET,
+        {CONF_SCHEDULE: [{CONF_FROM: "12:00", CONF_TO: "13:00"}]},
+        target={ATTR_ENTITY_ID: entity_id},
+    )
+    await hass.async_block_till_done()
+    assert updates.call_count == 1
+    await async_cleanup(hass)
+
+
+@pytest.mark.parametrize("utc", [False, True], ids=["local", "utc"])
+async def test_iter_toggles(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    utc: bool,  # noqa: FBT001
+) -> None:
+    """Test iterating over the toggles and the states they switch to."""
+    freezer.move_to("2025-03-12T09:00:00+02:00")
+    await setup_entity(hass, "My Test", [{CONF_FROM: "10:00", CONF_TO: "11:00"}], utc)
+    entity = hass.config_entries.async_entries(DOMAIN)[0].runtime_data.entity
+    toggles = list(islice(entity.iter_toggles(dt_util.utcnow()), 3))
+    timezone = "+00:00" if utc else "+02:00"
+    assert toggles == [
+        (dt_util.parse_datetime(f"2025-03-12T10:00:00{timezone}"), True),
+        (dt_util.parse_datetime(f"2025-03-12T11:00:00{timezone}"), False),
+        (dt_util.parse_datetime(f"2025-03-13T10:00:00{timezone}"), True),
+    ]
+    assert toggles[0][0].utcoffset() == datetime.timedelta(hours=0 if utc else 2)
+    await async_cleanup(hass)
+
+
+@pytest.mark.parametrize(
+    ("utc", "on_hours"),
+    [(False, {1, 25}), (True, {3, 27})],
+    ids=["local", "utc"],
+)
+async def test_is_on_at(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    utc: bool,  # noqa: FBT001
+    on_hours: set[int],
+) -> None:
+    """Test checking the schedule at other times, in the entity's time zone."""
+    freezer.move_to("2025-03-12T09:00:00+02:00")
+    await setup_entity(hass, "My Test", [{CONF_FROM: "10:00", CONF_TO: "11:00"}], utc)
+    entity = hass.config_entries.async_entries(DOMAIN)[0].runtime_data.entity
+    now = dt_util.utcnow()
+    assert {
+        hour
+        for hour in range(-24, 48)
+        if entity.is_on_at(now + datetime.timedelta(hours=hour))
+    } == on_hours | {hour - 24 for hour in on_hours}
+    await async_cleanup(hass)
+
+
+async def test_set_compiles_once(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that set service compiles once, and skips an unchanged schedule."""
+    entity_id = f"{Platform.BINARY_SENSOR}.my_test"
+    await setup_entity(hass, "My Test", [])
+    config_entry = hass.config_entries.async_entries(DOMAIN)[0]
+    stats = config_entry.runtime_data.entity.stats
+    compilations = stats.compilations
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET,
+        {CONF_SCHEDULE: [{CONF_FROM: "01:00", CONF_TO: "02:00"}]},
+        target={ATTR_ENTITY_ID: entity_id},
+        blocking=True,
+    )
+    assert stats.compilations == compilations + 1
+    state = hass.states.get(entity_id)
+    assert state
+    updates = stats.updates
+
+    hass_storage.pop(DOMAIN)
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET,
+        {CONF_SCHEDULE: [{CONF_FROM: "01:00:00", CONF_TO: "02:00:00"}]},
+        target={ATTR_ENTITY_ID: entity_id},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert stats.compilations == compilations + 2
+    assert stats.updates == updates
+    assert DOMAIN not in hass_storage
+    assert hass.states.get(entity_id) == state
+    await async_cleanup(hass)
+
+
+async def test_set_saves(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test that set service saves the schedule immediately."""
+    schedule = [{CONF_FROM: "01:00:00", CONF_TO: "02:00:00"}]
+    await setup_entity(hass, "My Test", [])
+    config_entry = hass.config_entries.async_entries(DOMAIN)[0]
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET,
+        {CONF_SCHEDULE: schedule},
+        target={ATTR_ENTITY_ID: f"{Platform.BINARY_SENSOR}.my_test"},
+    )
+    assert hass_storage[DOMAIN]["data"]["schedules"][config_entry.entry_id] == schedule
+    assert CONF_SCHEDULE not in config_entry.options
+    await async_cleanup(hass)
+
+
+async def test_delayed_save(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test that the delayed save applies immediately and saves later."""
+    schedule1 = [{CONF_FROM: "01:00:00", CONF_TO: "02:00:00"}]
+    schedule2 = [{CONF_FROM: "03:00:00", CONF_TO: "04:00:00"}]
+    entity_id = f"{Platform.BINARY_SENSOR}.my_test"
+    await setup_entity(hass, "My Test", [], delayed_save=True)
+    entry_id = hass.config_entries.async_entries(DOMAIN)[0].entry_id
+
+    for schedule in (schedule1, schedule2):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET,
+            {CONF_SCHEDULE: schedule},
+            target={ATTR_ENTITY_ID: entity_id},
+        )
+        await hass.async_block_till_done()
+        state = hass.states.get(entity_id)
+        assert state
+        assert state.attributes[CONF_SCHEDULE] == schedule
+        assert hass_storage[DOMAIN]["data"]["schedules"][entry_id] == []
+
+    freezer.tick(datetime.timedelta(seconds=SAVE_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[DOMAIN]["data"]["schedules"][entry_id] == schedule2
+    await async_cleanup(hass)
+
+
+async def test_delayed_save_final_write(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that a pending schedule is saved on shutdown."""
+    schedule = [{CONF_FROM: "01:00:00", CONF_TO: "02:00:00"}]
+    await setup_entity(hass, "My Test", [], delayed_save=True)
+    entry_id = hass.config_entries.async_entries(DOMAIN)[0].entry_id
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET,
+        {CONF_SCHEDULE: schedule},
+        target={ATTR_ENTITY_ID: f"{Platform.BINARY_SENSOR}.my_test"},
+    )
+    await hass.async_block_till_done()
+    assert hass_storage[DOMAIN]["data"]["schedules"][entry_id] == []
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert hass_storage[DOMAIN]["data"]["schedules"][entry_id] == schedule
+    await async_cleanup(hass)
+
+
 async def test_set_dynamic(hass: HomeAssistant) -> None:
     """Test set service with dynamic ranges."""
     entity_id = f"{Platform.BINARY_SENSOR}.my_test"
@@ -524,6 +792,60 @@ async def test_dynamic_update(
     await async_cleanup(hass)
 
 
+async def test_dynamic_update_unchanged(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the midnight refresh doesn't write an unchanged state."""
+    freezer.move_to("2025-03-12T12:00:00+02:00")
+    entity_id = f"{Platform.BINARY_SENSOR}.my_test"
+    await setup_entity(
+        hass,
+        "My Test",
+        [
+            {CONF_FROM: "10:00", CONF_TO: "11:00"},
+            {CONF_FROM: SUNRISE_SYMBOL, CONF_TO: SUNSET_SYMBOL, CONF_DISABLED: True},
+        ],
+    )
+    stats = hass.config_entries.async_entries(DOMAIN)[0].runtime_data.entity.stats
+    state = hass.states.get(entity_id)
+    assert state
+    last_reported = state.last_reported
+
+    freezer.move_to("2025-03-13T00:00:00+02:00")
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert stats.sun_resolutions == 2
+    new_state = hass.states.get(entity_id)
+    assert new_state
+    assert new_state.last_reported == last_reported
+    await async_cleanup(hass)
+
+
+async def test_config_update_unchanged(hass: HomeAssistant) -> None:
+    """Test a config update which doesn't change the entity."""
+    entity_id = f"{Platform.BINARY_SENSOR}.my_test"
+    await setup_entity(hass, "My Test", [{CONF_FROM: "10:00", CONF_TO: "11:00"}])
+    config_entry = hass.config_entries.async_entries(DOMAIN)[0]
+    stats = config_entry.runtime_data.entity.stats
+    timer_reschedules = stats.timer_reschedules
+    state = hass.states.get(entity_id)
+    assert state
+    last_reported = state.last_reported
+
+    hass.config_entries.async_update_entry(
+        config_entry, options={**config_entry.options, CONF_DELAYED_SAVE: True}
+    )
+    await hass.async_block_till_done()
+
+    assert stats.timer_reschedules == timer_reschedules
+    new_state = hass.states.get(entity_id)
+    assert new_state
+    assert new_state.last_reported == last_reported
+    await async_cleanup(hass)
+
+
 async def test_dynamic_update_entire_day(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
@@ -7,6 +7,9 @@ from typing import TYPE_CHECKING
 from unittest.mock import Mock, patch
 
 from homeassistant.const import Platform
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import target
 from homeassistant.setup import async_setup_component
 from pytest_homeassistant_custom_component.common import (
     async_fire_time_changed,
@@ -18,6 +21,7 @@ from custom_components.daily_schedule.const import CONF_FROM, CONF_TO, DOMAIN
 from tests.helpers import ENTITY_ID, setup_entity
 
 if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
     from homeassistant.core import HomeAssistant
 
 
@@ -121,3 +125,134 @@ async def test_ignores_foreign_entities(hass: HomeAssistant) -> None:
     hass.bus.async_fire("test_event")
     await hass.async_block_till_done()
     assert len(calls) == 0
+
+
+async def test_scheduled_on_and_off(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the conditions evaluate the schedule at the shifted time."""
+    freezer.move_to("2000-01-01T06:30:00+02:00")
+    await setup_entity(hass, [{CONF_FROM: "06:00:00", CONF_TO: "07:00:00"}])
+
+    calls = async_mock_service(hass, "test", "automation")
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": [
+                {
+                    "trigger": [{"platform": "event", "event_type": "test_event"}],
+                    "condition": [
+                        {
+                            "condition": f"{DOMAIN}.scheduled_{state}",
+                            "target": {"entity_id": ENTITY_ID},
+                            "options": options,
+                        }
+                    ],
+                    "action": [{"service": "test.automation", "data": {"name": name}}],
+                }
+                for name, state, options in (
+                    ("now", "on", {}),
+                    ("in 30 minutes", "off", {"offset": "00:30:00"}),
+                    ("40 minutes ago", "off", {"offset": "-00:40:00"}),
+                    ("at 06:00", "on", {"at": "06:00:00"}),
+                    ("before 06:00", "on", {"at": "06:00:00", "offset": "-00:01"}),
+                )
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert sorted(call.data["name"] for call in calls) == [
+        "40 minutes ago",
+        "at 06:00",
+        "in 30 minutes",
+        "now",
+    ]
+
+
+async def test_scheduled_without_entities(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the conditions don't pass when there is no entity to evaluate."""
+    freezer.move_to("2000-01-01T06:30:00+02:00")
+    await setup_entity(hass, [{CONF_FROM: "06:00:00", CONF_TO: "07:00:00"}])
+
+    calls = async_mock_service(hass, "test", "automation")
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": [
+                {
+                    "trigger": [{"platform": "event", "event_type": "test_event"}],
+                    "condition": [
+                        {
+                            "condition": f"{DOMAIN}.scheduled_on",
+                            "target": {"entity_id": entity_id},
+                            "options": {"behavior": "all"},
+                        }
+                    ],
+                    "action": [
+                        {"service": "test.automation", "data": {"name": entity_id}}
+                    ],
+                }
+                for entity_id in (ENTITY_ID, f"{Platform.BINARY_SENSOR}.unknown")
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert [call.data["name"] for call in calls] == [ENTITY_ID]
+
+
+async def test_scheduled_targets_tracked(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the targets are resolved once, and again after registry changes."""
+    freezer.move_to("2000-01-01T06:30:00+02:00")
+    await setup_entity(hass, [{CONF_FROM: "06:00:00", CONF_TO: "07:00:00"}])
+    area = ar.async_get(hass).async_create("Kitchen")
+
+    calls = async_mock_service(hass, "test", "automation")
+    with patch.object(
+        target,
+        "async_extract_referenced_entity_ids",
+        side_effect=target.async_extract_referenced_entity_ids,
+    ) as extract:
+        assert await async_setup_component(
+            hass,
+            "automation",
+            {
+                "automation": {
+                    "trigger": [{"platform": "event", "event_type": "test_event"}],
+                    "condition": [
+                        {
+                            "condition": f"{DOMAIN}.scheduled_on",
+                            "target": {"area_id": area.id},
+                        }
+                    ],
+                    "action": [{"service": "test.automation"}],
+                }
+            },
+        )
+        await hass.async_block_till_done()
+        resolved = extract.call_count
+
+        hass.bus.async_fire("test_event")
+        hass.bus.async_fire("test_event")
+        await hass.async_block_till_done()
+        assert len(calls) == 0
+        assert extract.call_count == resolved
+
+        # The entity is moved into the area.
+        er.async_get(hass).async_update_entity(ENTITY_ID, area_id=area.id)
+        await hass.async_block_till_done()
+        hass.bus.async_fire("test_event")
+        await hass.async_block_till_done()
+        assert len(calls) == 1
+        assert extract.call_count == resolved + 1
@@ -5,12 +5,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import SOURCE_USER
-from homeassistant.const import CONF_NAME
+from homeassistant.const import CONF_NAME, Platform
 from homeassistant.data_entry_flow import FlowResultType
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.daily_schedule.const import (
+    CONF_DELAYED_SAVE,
     CONF_FROM,
+    CONF_REFRESH_WINDOW,
     CONF_SCHEDULE,
     CONF_SKIP_REVERSED,
     CONF_TO,
@@ -40,7 +42,7 @@ async def test_config_flow_no_schedule(hass: HomeAssistant) -> None:
 
     assert result2.get("type") == FlowResultType.CREATE_ENTRY
     assert result2.get("title") == "test"
-    assert result2.get("options") == {CONF_SCHEDULE: []}
+    assert result2.get("options") == {}
 
 
 async def test_config_flow_duplicated(hass: HomeAssistant) -> None:
@@ -83,18 +85,26 @@ async def test_options_flow(hass: HomeAssistant) -> None:
 
     result2 = await hass.config_entries.options.async_configure(
         result["flow_id"],
-        user_input={CONF_UTC: True, CONF_SKIP_REVERSED: True},
+        user_input={
+            CONF_UTC: True,
+            CONF_SKIP_REVERSED: True,
+            CONF_DELAYED_SAVE: True,
+            CONF_REFRESH_WINDOW: 600,
+        },
     )
     assert result2.get("type") == FlowResultType.CREATE_ENTRY
     assert result2.get("data") == {
-        CONF_SCHEDULE: [{CONF_FROM: "05:00:00", CONF_TO: "10:00:00"}],
         CONF_UTC: True,
         CONF_SKIP_REVERSED: True,
+        CONF_DELAYED_SAVE: True,
+        CONF_REFRESH_WINDOW: 600,
     }
 
     config_entry = hass.config_entries.async_entries(DOMAIN)[0]
     assert config_entry.options[CONF_UTC] is True
-    assert config_entry.options[CONF_SCHEDULE] == [
+    state = hass.states.get(f"{Platform.BINARY_SENSOR}.my_test")
+    assert state
+    assert state.attributes[CONF_SCHEDULE] == [
         {CONF_FROM: "05:00:00", CONF_TO: "10:00:00"}
     ]
 
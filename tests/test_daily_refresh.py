@@ -0,0 +1,116 @@
+"""The tests for the daily refresh of the dynamic schedules."""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+import homeassistant.util.dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.daily_schedule.daily_refresh import async_get_daily_refresh
+from custom_components.daily_schedule.scheduler import async_get_scheduler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+WINDOW = 600
+
+
+def recorder(calls: list[str], name: str) -> Callable[[], None]:
+    """Return a refresh which records its name when called."""
+
+    def refresh() -> None:
+        calls.append(name)
+
+    return refresh
+
+
+async def fire(hass: HomeAssistant, freezer: FrozenDateTimeFactory, when: str) -> None:
+    """Move the time and fire the timers."""
+    freezer.move_to(when)
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+
+
+async def test_refresh(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Test all the schedules are refreshed at midnight by a single timer."""
+    freezer.move_to("2025-03-12T12:00:00+02:00")
+    daily_refresh = async_get_daily_refresh(hass)
+    calls: list[str] = []
+    unregisters = [
+        daily_refresh.async_register(name, 0, recorder(calls, name), lambda: None)
+        for name in ("a", "b")
+    ]
+    assert async_get_scheduler(hass).as_dict()["pending"] == 1
+
+    await fire(hass, freezer, "2025-03-12T23:59:59+02:00")
+    assert calls == []
+    await fire(hass, freezer, "2025-03-13T00:00:00+02:00")
+    assert calls == ["a", "b"]
+    await fire(hass, freezer, "2025-03-14T00:00:00+02:00")
+    assert calls == ["a", "b", "a", "b"]
+    assert daily_refresh.as_dict() == {
+        "registered": 2,
+        "runs": 2,
+        "refreshes": 4,
+        "staggered": 0,
+    }
+    for unregister in unregisters:
+        unregister()
+
+
+async def test_window(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Test the refreshes are spread in the window, unless a toggle is due."""
+    freezer.move_to("2025-03-12T12:00:00+02:00")
+    daily_refresh = async_get_daily_refresh(hass)
+    calls: list[str] = []
+    due = dt_util.parse_datetime("2025-03-13T00:05:00+02:00")
+    later = dt_util.parse_datetime("2025-03-13T06:00:00+02:00")
+    unregisters = [
+        daily_refresh.async_register(name, WINDOW, recorder(calls, name), next_update)
+        for name, next_update in (
+            ("due", lambda: due),
+            ("later", lambda: later),
+            ("none", lambda: None),
+        )
+    ]
+
+    await fire(hass, freezer, "2025-03-13T00:00:00+02:00")
+    assert calls == ["due"]
+    assert daily_refresh.as_dict()["staggered"] == 2
+    await fire(hass, freezer, f"2025-03-13T00:{WINDOW // 60:02}:00+02:00")
+    assert sorted(calls) == ["due", "later", "none"]
+    assert daily_refresh.as_dict()["refreshes"] == 3
+    for unregister in unregisters:
+        unregister()
+
+
+async def test_unregister(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Test unregistering cancels the pending refreshes and the timer."""
+    freezer.move_to("2025-03-12T12:00:00+02:00")
+    daily_refresh = async_get_daily_refresh(hass)
+    scheduler = async_get_scheduler(hass)
+    calls: list[str] = []
+    unregister_a = daily_refresh.async_register(
+        "a", WINDOW, recorder(calls, "a"), lambda: None
+    )
+    unregister_b = daily_refresh.async_register(
+        "b", WINDOW, recorder(calls, "b"), lambda: None
+    )
+    await fire(hass, freezer, "2025-03-13T00:00:00+02:00")
+    assert scheduler.as_dict()["pending"] == 3  # Two refreshes and the next day.
+
+    unregister_a()
+    unregister_a()
+    assert scheduler.as_dict()["pending"] == 2
+    unregister_b()
+    assert scheduler.as_dict()["pending"] == 0
+    freezer.tick(datetime.timedelta(days=1))
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+    assert calls == []
+    assert daily_refresh.as_dict()["registered"] == 0
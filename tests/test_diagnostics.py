@@ -29,18 +29,18 @@ async def test_diagnostics(
     hass_client: ClientSessionGenerator,
 ) -> None:
     """Test diagnostics."""
-    config = {
-        CONF_SCHEDULE: [
-            {
-                CONF_FROM: "01:02:03",
-                CONF_TO: "04:05:06",
-            },
-        ],
+    schedule = [
+        {
+            CONF_FROM: "01:02:03",
+            CONF_TO: "04:05:06",
+        },
+    ]
+    options = {
         CONF_UTC: True,
         CONF_SKIP_REVERSED: True,
     }
     config_entry = MockConfigEntry(
-        options=config,
+        options={CONF_SCHEDULE: schedule, **options},
         domain=DOMAIN,
         title="test",
     )
@@ -54,7 +54,15 @@ async def test_diagnostics(
         f"/api/diagnostics/config_entry/{config_entry.entry_id}"
     )
     assert diagnostics.status == HTTPStatus.OK
-    assert config == (await diagnostics.json())["data"]
+    data = (await diagnostics.json())["data"]
+    assert data["options"] == options
+    assert data["schedule"] == schedule
+    assert data["scheduler"]["pending"] == 1
+    assert data["daily_refresh"]["registered"] == 0
+    assert data["entity_index"]["size"] == 1
+    assert data["schedule_registry"]["users"] == 1
+    assert data["schedule_store"]["schedules"] == 1
+    assert data["sun_cache"]["misses"] == 0
 
     assert await hass.config_entries.async_unload(config_entry.entry_id)
     await hass.async_block_till_done()
@@ -0,0 +1,108 @@
+"""Test DST transitions."""
+
+from __future__ import annotations
+
+import datetime
+
+import homeassistant.util.dt as dt_util
+import pytest
+
+from custom_components.daily_schedule.dst import (
+    DstTransition,
+    dst_transitions,
+    gap_end,
+    next_transition,
+)
+
+HOUR = datetime.timedelta(hours=1)
+
+
+@pytest.mark.parametrize(
+    ("time_zone", "year", "expected"),
+    [
+        ("UTC", 2025, ()),
+        ("Asia/Tokyo", 2025, ()),
+        (
+            "Asia/Jerusalem",
+            2025,
+            (
+                DstTransition(
+                    datetime.datetime.fromisoformat("2025-03-28T00:00"),
+                    2 * HOUR,
+                    3 * HOUR,
+                ),
+                DstTransition(
+                    datetime.datetime.fromisoformat("2025-10-25T23:00"),
+                    3 * HOUR,
+                    2 * HOUR,
+                ),
+            ),
+        ),
+        (
+            "Australia/Sydney",
+            2024,
+            (
+                DstTransition(
+                    datetime.datetime.fromisoformat("2024-04-06T16:00"),
+                    11 * HOUR,
+                    10 * HOUR,
+                ),
+                DstTransition(
+                    datetime.datetime.fromisoformat("2024-10-05T16:00"),
+                    10 * HOUR,
+                    11 * HOUR,
+                ),
+            ),
+        ),
+        (
+            "Australia/Lord_Howe",
+            2024,
+            (
+                DstTransition(
+                    datetime.datetime.fromisoformat("2024-04-06T15:00"),
+                    11 * HOUR,
+                    10.5 * HOUR,
+                ),
+                DstTransition(
+                    datetime.datetime.fromisoformat("2024-10-05T15:30"),
+                    10.5 * HOUR,
+                    11 * HOUR,
+                ),
+            ),
+        ),
+    ],
+)
+def test_dst_transitions(
+    time_zone: str, year: int, expected: tuple[DstTransition, ...]
+) -> None:
+    """Test the transitions table."""
+    tzinfo = dt_util.get_time_zone(time_zone)
+    assert tzinfo is not None
+    assert dst_transitions(tzinfo, year) == expected
+    assert dst_transitions(tzinfo, year) is dst_transitions(tzinfo, year)
+
+
+def test_lookups() -> None:
+    """Test gap and next transition lookups."""
+    tzinfo = dt_util.get_time_zone("America/New_York")
+    assert gap_end(datetime.datetime(2025, 3, 9, 2, 30, tzinfo=tzinfo)) == (
+        datetime.datetime(2025, 3, 9, 3, 0, tzinfo=tzinfo)
+    )
+    assert gap_end(datetime.datetime(2025, 3, 9, 3, 0, tzinfo=tzinfo)) is None
+    assert gap_end(datetime.datetime(2025, 11, 2, 1, 30, tzinfo=tzinfo)) is None
+    assert next_transition(
+        datetime.datetime(2025, 11, 2, 1, 30, tzinfo=tzinfo)
+    ) == DstTransition(
+        datetime.datetime.fromisoformat("2025-11-02T06:00"), -4 * HOUR, -5 * HOUR
+    )
+    assert next_transition(
+        datetime.datetime(2025, 11, 2, 1, 30, tzinfo=tzinfo, fold=1)
+    ) == DstTransition(
+        datetime.datetime.fromisoformat("2026-03-08T07:00"), -5 * HOUR, -4 * HOUR
+    )
+    assert (
+        next_transition(
+            datetime.datetime(2025, 1, 1, tzinfo=dt_util.get_time_zone("Asia/Tokyo"))
+        )
+        is None
+    )
@@ -0,0 +1,70 @@
+"""The tests for the index of the daily schedule entities."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from custom_components.daily_schedule.const import DOMAIN, SIGNAL_UPDATE
+from custom_components.daily_schedule.entity_index import async_get_entity_index
+from tests.helpers import ENTITY_ID, setup_entity
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.daily_schedule.binary_sensor import DailyScheduleSensor
+
+
+async def test_index(hass: HomeAssistant) -> None:
+    """Test the index follows the entity registry."""
+    registry = er.async_get(hass)
+    existing = registry.async_get_or_create("binary_sensor", DOMAIN, "existing")
+    registry.async_get_or_create("sensor", DOMAIN, "sensor")
+    other = registry.async_get_or_create("binary_sensor", "other", "other")
+    index = async_get_entity_index(hass)
+    assert index is async_get_entity_index(hass)
+    assert index.as_dict() == {"size": 1, "updates": 0}
+
+    created = registry.async_get_or_create("binary_sensor", DOMAIN, "created")
+    candidates = {existing.entity_id, created.entity_id, other.entity_id, "light.x"}
+    assert index.filter(candidates) == {existing.entity_id, created.entity_id}
+
+    registry.async_update_entity(existing.entity_id, new_entity_id="binary_sensor.new")
+    registry.async_update_entity(created.entity_id, name="name")
+    registry.async_remove(created.entity_id)
+    assert index.filter(candidates | {"binary_sensor.new"}) == {"binary_sensor.new"}
+    assert index.as_dict() == {"size": 1, "updates": 4}
+
+
+async def test_entity(hass: HomeAssistant) -> None:
+    """Test looking up the loaded entity objects."""
+    await setup_entity(hass, [])
+    index = async_get_entity_index(hass)
+    entity = index.entity(ENTITY_ID)
+    assert entity is not None
+    assert entity.entity_id == ENTITY_ID
+    assert index.entity("binary_sensor.unknown") is None
+    registry = er.async_get(hass)
+    orphan = registry.async_get_or_create("binary_sensor", DOMAIN, "orphan")
+    assert index.entity(orphan.entity_id) is None
+
+    config_entry = hass.config_entries.async_entries(DOMAIN)[0]
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert index.entity(ENTITY_ID) is None
+
+
+async def test_entity_during_setup(hass: HomeAssistant) -> None:
+    """Test the entity is returned once it's added, before its entry is loaded."""
+    index = async_get_entity_index(hass)
+    entities: list[DailyScheduleSensor | None] = []
+    async_dispatcher_connect(
+        hass,
+        SIGNAL_UPDATE.format(ENTITY_ID),
+        lambda: entities.append(index.entity(ENTITY_ID)),
+    )
+    await setup_entity(hass, [])
+    assert entities
+    assert entities[0] is index.entity(ENTITY_ID)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 
-from homeassistant.const import Platform
+from homeassistant.const import ATTR_ENTITY_ID, Platform
 from homeassistant.helpers import entity_registry as er
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -12,17 +13,24 @@ from custom_components.daily_schedule.const import (
     CONF_FROM,
     CONF_SCHEDULE,
     CONF_TO,
+    CONF_UTC,
     DOMAIN,
+    SERVICE_SET,
 )
 
 if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
 
-async def test_setup_change_remove_config_entry(hass: HomeAssistant) -> None:
+async def test_setup_change_remove_config_entry(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
     """Test setting up and removing a config entry."""
     entity_id = f"{Platform.BINARY_SENSOR}.my_test"
-    config_entry = MockConfigEntry(domain=DOMAIN, title="My Test", unique_id="1234")
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, title="My Test", unique_id="1234", version=2
+    )
 
     # Add the config entry.
     config_entry.add_to_hass(hass)
@@ -37,10 +45,13 @@ async def test_setup_change_remove_config_entry(hass: HomeAssistant) -> None:
     assert state.state == "off"
     assert state.attributes[CONF_SCHEDULE] == []
 
-    # Update the config entry.
-    hass.config_entries.async_update_entry(
-        config_entry,
-        options={CONF_SCHEDULE: [{CONF_FROM: "00:00:00", CONF_TO: "00:00:00"}]},
+    # Update the schedule.
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET,
+        {CONF_SCHEDULE: [{CONF_FROM: "00:00:00", CONF_TO: "00:00:00"}]},
+        target={ATTR_ENTITY_ID: entity_id},
+        blocking=True,
     )
     await hass.async_block_till_done()
 
@@ -56,6 +67,85 @@ async def test_setup_change_remove_config_entry(hass: HomeAssistant) -> None:
     assert await hass.config_entries.async_remove(config_entry.entry_id)
     await hass.async_block_till_done()
 
-    # Check the state and entity registry entry are removed.
+    # Check the state, entity registry entry and schedule are removed.
     assert hass.states.get(entity_id) is None
     assert registry.async_get(entity_id) is None
+    await hass.async_stop(force=True)
+    assert hass_storage[DOMAIN]["data"]["schedules"] == {}
+
+
+async def test_migrate_schedule_to_store(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test moving the schedule of an old config entry to the store."""
+    schedule = [{CONF_FROM: "01:00:00", CONF_TO: "02:00:00"}]
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My Test",
+        options={CONF_SCHEDULE: schedule, CONF_UTC: True},
+        version=1,
+    )
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.version == 2
+    assert config_entry.options == {CONF_UTC: True}
+    assert hass_storage[DOMAIN]["data"]["schedules"] == {
+        config_entry.entry_id: schedule
+    }
+    state = hass.states.get(f"{Platform.BINARY_SENSOR}.my_test")
+    assert state
+    assert state.attributes[CONF_SCHEDULE] == schedule
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_migrate_saves_first(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the schedule is saved before it's removed from the options."""
+    schedules = [
+        [{CONF_FROM: f"0{index}:00:00", CONF_TO: "09:00:00"}] for index in (1, 2)
+    ]
+    config_entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            title=f"My Test {index}",
+            options={CONF_SCHEDULE: schedule},
+            version=1,
+        )
+        for index, schedule in enumerate(schedules)
+    ]
+    for config_entry in config_entries:
+        config_entry.add_to_hass(hass)
+
+    stored: list[dict[str, Any]] = []
+    async_update_entry = hass.config_entries.async_update_entry
+
+    def update_entry(entry: ConfigEntry, **kwargs: Any) -> bool:
+        stored.append(dict(hass_storage[DOMAIN]["data"]["schedules"]))
+        return async_update_entry(entry, **kwargs)
+
+    with patch.object(hass.config_entries, "async_update_entry", update_entry):
+        # Setting up the integration sets up both config entries.
+        assert await hass.config_entries.async_setup(config_entries[0].entry_id)
+        await hass.async_block_till_done()
+
+    assert stored == [
+        {
+            config_entry.entry_id: schedule
+            for config_entry, schedule in zip(
+                config_entries[:count], schedules[:count], strict=True
+            )
+        }
+        for count in (1, 2)
+    ]
+    for config_entry in config_entries:
+        assert config_entry.version == 2
+        assert CONF_SCHEDULE not in config_entry.options
+
+    for config_entry in config_entries:
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import datetime
+import random
+import sys
 from typing import TYPE_CHECKING, Any
 from unittest.mock import Mock, patch
 
 import homeassistant.util.dt as dt_util
+import numpy as np
 import pytest
 from homeassistant.exceptions import IntegrationError
 
@@ -14,10 +17,13 @@ from custom_components.daily_schedule.const import (
     CONF_DISABLED,
     CONF_FROM,
     CONF_TO,
+    PLAN_DAYS,
     SUNRISE_SYMBOL,
     SUNSET_SYMBOL,
 )
 from custom_components.daily_schedule.schedule import (
+    DAY_SECONDS,
+    MIDNIGHT,
     Schedule,
     TimeRange,
     TimeRangeConfig,
@@ -227,6 +233,24 @@ def test_time_range_to_dict(hass: HomeAssistant, param: dict[str, Any]) -> None:
             "23:00",
             True,
         ),
+        (
+            [
+                {CONF_FROM: "00:00", CONF_TO: "01:00"},
+                {CONF_FROM: "05:00", CONF_TO: "10:00"},
+            ],
+            False,
+            "00:00",
+            True,
+        ),
+        (
+            [
+                {CONF_FROM: "00:00", CONF_TO: "01:00"},
+                {CONF_FROM: "05:00", CONF_TO: "10:00"},
+            ],
+            False,
+            "01:00",
+            False,
+        ),
         (
             [{CONF_FROM: "00:00", CONF_TO: "00:00", CONF_DISABLED: True}],
             False,
@@ -251,6 +275,8 @@ def test_time_range_to_dict(hass: HomeAssistant, param: dict[str, Any]) -> None:
         "contained",
         "not contained",
         "2 ranges contained",
+        "from midnight contained",
+        "from midnight not contained",
         "disabled range",
         "skip reversed",
         "skip reversed absolute (not skipped)",
@@ -446,8 +472,33 @@ def test_to_list(hass: HomeAssistant, schedule: list[dict[str, Any]]) -> None:
             [{CONF_FROM: "12:00:00", CONF_TO: "12:00:00"}],
             [{CONF_FROM: "12:00:00", CONF_TO: "12:00:00"}],
         ),
+        (
+            [
+                {CONF_FROM: "22:00:00", CONF_TO: "22:00:00"},
+                {CONF_FROM: "01:00:00", CONF_TO: "02:00:00"},
+            ],
+            [{CONF_FROM: "00:00:00", CONF_TO: "00:00:00"}],
+        ),
+        (
+            [
+                {CONF_FROM: "23:00:00", CONF_TO: "02:00:00"},
+                {CONF_FROM: "22:00:00", CONF_TO: "01:00:00"},
+                {CONF_FROM: "05:00:00", CONF_TO: "06:00:00"},
+            ],
+            [
+                {CONF_FROM: "05:00:00", CONF_TO: "06:00:00"},
+                {CONF_FROM: "22:00:00", CONF_TO: "02:00:00"},
+            ],
+        ),
+    ],
+    ids=[
+        "empty",
+        "adjusting",
+        "whole day",
+        "single range",
+        "whole day and another range",
+        "multiple reversed",
     ],
-    ids=["empty", "adjusting", "whole day", "single range"],
 )
 def test_merge(
     hass: HomeAssistant, schedule: list[dict[str, Any]], expected: list[dict[str, Any]]
@@ -456,6 +507,152 @@ def test_merge(
     assert Schedule(hass, schedule, skip_reversed=False).to_list_absolute() == expected
 
 
+def reference_normalize(
+    hass: HomeAssistant,
+    schedule: list[dict[str, Any]],
+    skip_reversed: bool,  # noqa: FBT001
+) -> list[TimeRange]:
+    """Normalize the schedule using the previous implementation (with "pop(0)")."""
+    config = sorted(
+        TimeRangeConfig(
+            hass, time_range[CONF_FROM], time_range[CONF_TO], time_range[CONF_DISABLED]
+        )
+        for time_range in schedule
+    )
+    result: list[TimeRange] = []
+
+    # There is nothing to do for a single time range.
+    if len(config) == 1:
+        if not config[0].disabled and (
+            not skip_reversed or not config[0].reversed or not config[0].is_dynamic()
+        ):
+            result.append(TimeRange(config[0].from_, config[0].to))
+        return result
+
+    # Break reversed time ranges into two separate time ranges.
+    ranges = []
+    for time_range in config:
+        if time_range.disabled or (
+            skip_reversed and time_range.reversed and time_range.is_dynamic()
+        ):
+            continue
+        if not time_range.reversed or time_range.to == MIDNIGHT:
+            ranges.append(TimeRange(time_range.from_, time_range.to))
+        else:
+            ranges.append(TimeRange(time_range.from_, MIDNIGHT))
+            ranges.append(TimeRange(MIDNIGHT, time_range.to))
+    ranges.sort()
+
+    # Merge overlapping time ranges.
+    while ranges:
+        from_range = ranges.pop(0)
+        to_range = from_range
+        while ranges and (ranges[0].from_ <= to_range.to or to_range.to == MIDNIGHT):
+            if (
+                ranges[0].to > to_range.to or ranges[0].to == MIDNIGHT
+            ) and to_range.to != MIDNIGHT:
+                to_range = ranges[0]
+            ranges.pop(0)
+        result.append(TimeRange(from_range.from_, to_range.to))
+
+    # Merge the first and last time ranges if they are adjusting.
+    if len(result) > 1 and result[0].from_ == MIDNIGHT and result[-1].to == MIDNIGHT:
+        result[-1] = TimeRange(result[-1].from_, result[0].to)
+        result.pop(0)
+
+    return result
+
+
+def reference_transitions(schedule: list[TimeRange]) -> list[datetime.time]:
+    """Return the on and off transitions, using the previous implementation."""
+    to_on = [time_range.from_ for time_range in schedule]
+    to_off = [time_range.to for time_range in schedule]
+    if schedule and to_on[0] == to_off[-1]:
+        to_on.pop(0)
+        to_off.pop(-1)
+    return sorted(to_on + to_off)
+
+
+def random_schedule(
+    generator: random.Random,
+    count: int,
+    max_length: int,
+    dynamic: float = 0,
+) -> list[dict[str, Any]]:
+    """Create random ranges, including reversed, midnight crossing and dynamic ones."""
+    midnight = datetime.datetime(2000, 1, 1)  # noqa: DTZ001
+
+    def time(seconds: int) -> str:
+        if dynamic and generator.random() < dynamic:
+            symbol = generator.choice([SUNRISE_SYMBOL, SUNSET_SYMBOL])
+            return f"{symbol}{generator.randrange(-720, 721):+}"
+        return (midnight + datetime.timedelta(seconds=seconds)).time().isoformat()
+
+    schedule = []
+    for _ in range(count):
+        from_ = generator.randrange(DAY_SECONDS)
+        to = (from_ + generator.randrange(max_length)) % DAY_SECONDS
+        if generator.random() < 0.05:
+            to = generator.choice([0, from_])
+        schedule.append(
+            {
+                CONF_FROM: time(from_),
+                CONF_TO: time(to),
+                CONF_DISABLED: generator.random() < 0.1,
+            }
+        )
+    return schedule
+
+
+@pytest.mark.parametrize("skip_reversed", [False, True], ids=["all", "skip reversed"])
+@pytest.mark.parametrize("max_length", [60, 3600, DAY_SECONDS])
+def test_normalize_differential(
+    hass: HomeAssistant,
+    max_length: int,
+    skip_reversed: bool,  # noqa: FBT001
+) -> None:
+    """Compare the sweep with the previous implementation on random schedules."""
+    generator = random.Random(max_length)  # noqa: S311
+    start = datetime.datetime(2000, 1, 1)  # noqa: DTZ001
+    for _ in range(300):
+        schedule = random_schedule(
+            generator, generator.choice([1, 2, 3, 5, 10, 50]), max_length, dynamic=0.2
+        )
+        compiled = Schedule(hass, schedule, skip_reversed)
+        expected = reference_normalize(hass, schedule, skip_reversed)
+        assert compiled.to_list_absolute() == [
+            time_range.to_dict() for time_range in expected
+        ]
+
+        transitions = reference_transitions(expected)
+        assert (
+            compiled.next_updates(start, len(transitions))
+            == sorted(
+                update
+                for update in (
+                    datetime.datetime.combine(
+                        start.date() + datetime.timedelta(days=day), time
+                    )
+                    for day in (0, 1)
+                    for time in transitions
+                )
+                if update > start
+            )[: len(transitions)]
+        )
+        for time in (
+            *transitions,
+            *(
+                (
+                    start + datetime.timedelta(seconds=generator.randrange(DAY_SECONDS))
+                ).time()
+                for _ in range(10)
+            ),
+        ):
+            assert compiled.containing(time) == any(
+                time_range.containing(time) for time_range in expected
+            )
+
+
 @pytest.mark.parametrize(
     ("schedule", "expected"),
     [
@@ -820,3 +1017,273 @@ def test_sort_off_timestamps(
         ],
         skip_reversed=False,
     ).next_update(now) == now + datetime.timedelta(hours=13)
+
+
+@pytest.mark.parametrize(
+    ("schedule", "skip_reversed"),
+    [
+        ([{CONF_FROM: SUNRISE_SYMBOL, CONF_TO: "08:00:00"}], False),
+        (
+            [
+                {CONF_FROM: "22:00:00", CONF_TO: "02:00:00"},
+                {CONF_FROM: "05:00:00", CONF_TO: "06:00:00"},
+                {CONF_FROM: "↑-30", CONF_TO: "07:00:00"},
+                {CONF_FROM: "18:00:00", CONF_TO: SUNSET_SYMBOL},
+                {CONF_FROM: "↓+60", CONF_TO: "↓+90", CONF_DISABLED: True},
+            ],
+            False,
+        ),
+        (
+            [
+                {CONF_FROM: "12:00:00", CONF_TO: "13:00:00"},
+                {CONF_FROM: SUNSET_SYMBOL, CONF_TO: SUNRISE_SYMBOL},
+            ],
+            True,
+        ),
+    ],
+    ids=["single", "static and dynamic", "skip reversed"],
+)
+async def test_resolve(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    schedule: list[dict[str, Any]],
+    skip_reversed: bool,  # noqa: FBT001
+) -> None:
+    """Test re-resolving the dynamic time ranges."""
+    freezer.move_to("2025-03-12T00:00:00")
+    test = Schedule(hass, schedule, skip_reversed)
+    freezer.move_to("2025-06-12T00:00:00")
+    test.resolve(hass)
+    expected = Schedule(hass, schedule, skip_reversed)
+    assert test.to_list() == expected.to_list()
+    assert test.to_list_absolute() == expected.to_list_absolute()
+    assert [test.containing(datetime.time(hour)) for hour in range(24)] == [
+        expected.containing(datetime.time(hour)) for hour in range(24)
+    ]
+
+
+async def test_plan(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Test the updates of the following days use their own sunrise and sunset."""
+    schedule = [{CONF_FROM: SUNRISE_SYMBOL, CONF_TO: SUNSET_SYMBOL}]
+    expected: list[datetime.datetime] = []
+    for day in range(PLAN_DAYS):
+        freezer.move_to(f"2025-03-{12 + day}T00:00:00+02:00")
+        expected.extend(
+            Schedule(hass, schedule, skip_reversed=False).next_updates(dt_util.now(), 2)
+        )
+
+    freezer.move_to("2025-03-12T12:00:00+02:00")
+    test = Schedule(hass, schedule, skip_reversed=False)
+    # Each resolved day resolves the (single) dynamic time range, and so does the
+    # day before the first one (which is continued by it).
+    with patch.object(
+        TimeRangeConfig,
+        "resolve",
+        autospec=True,
+        side_effect=TimeRangeConfig.resolve,
+    ) as day_plan:
+        test.resolve(hass)
+        assert day_plan.call_count == PLAN_DAYS + 1
+        assert test.next_updates(dt_util.now(), len(expected) - 1) == expected[1:]
+
+        # Resolved days are reused.
+        test.resolve(hass)
+        freezer.move_to("2025-03-13T00:00:00+02:00")
+        test.resolve(hass)
+        assert day_plan.call_count == PLAN_DAYS + 2
+        assert test.next_updates(dt_util.now(), 2) == expected[2:4]
+
+        # Unless the location is changed.
+        hass.config.latitude += 1
+        test.resolve(hass)
+        assert day_plan.call_count == 2 * PLAN_DAYS + 3
+
+
+async def test_containing_at(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the state at a date and time uses the plan of its day."""
+    freezer.move_to("2025-03-12T12:00:00+02:00")
+    test = Schedule(
+        hass, [{CONF_FROM: SUNRISE_SYMBOL, CONF_TO: SUNSET_SYMBOL}], skip_reversed=False
+    )
+    test.resolve(hass)
+    updates = test.next_updates(dt_util.now(), 2 * PLAN_DAYS - 1)
+    assert [test.containing_at(update) for update in updates] == [
+        index % 2 == 1 for index in range(len(updates))
+    ]
+    # Sunrise is earlier tomorrow, so today's plan is still "off" at that time.
+    assert not test.containing(updates[1].time())
+
+
+async def test_plan_across_midnight(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test an offset moving the sunset across midnight doesn't toggle at midnight."""
+    freezer.move_to("2025-03-11T12:00:00+02:00")
+    test = Schedule(
+        hass, [{CONF_FROM: "20:00:00", CONF_TO: "↓+374"}], skip_reversed=False
+    )
+    test.resolve(hass)
+    updates = test.next_updates(dt_util.now(), 2 * PLAN_DAYS + 2)
+    # The end is before midnight today, and after midnight in the following days.
+    assert updates[:4] == [
+        datetime.datetime(2025, 3, 11, 20, 0, 0, tzinfo=TZ_IL),
+        datetime.datetime(2025, 3, 11, 23, 59, 26, tzinfo=TZ_IL),
+        datetime.datetime(2025, 3, 12, 20, 0, 0, tzinfo=TZ_IL),
+        datetime.datetime(2025, 3, 13, 0, 0, 53, tzinfo=TZ_IL),
+    ]
+    # The days which aren't planned repeat today's plan.
+    assert updates[-3:] == [
+        datetime.datetime(2025, 3, 18, 0, 0, 0, tzinfo=TZ_IL),
+        datetime.datetime(2025, 3, 18, 20, 0, 0, tzinfo=TZ_IL),
+        datetime.datetime(2025, 3, 18, 23, 59, 26, tzinfo=TZ_IL),
+    ]
+    # Each update toggles the state.
+    assert [test.containing_at(update) for update in updates] == [
+        index % 2 == 0 for index in range(len(updates))
+    ]
+    assert [
+        test.containing_at(update - datetime.timedelta(seconds=1)) for update in updates
+    ] == [index % 2 == 1 for index in range(len(updates))]
+    assert not test.containing_at(
+        datetime.datetime(2025, 3, 12, 0, 0, 30, tzinfo=TZ_IL)
+    )
+
+
+async def test_resolve_static(hass: HomeAssistant) -> None:
+    """Test resolving a static schedule doesn't change it."""
+    test = Schedule(
+        hass, [{CONF_FROM: "08:00:00", CONF_TO: "17:00:00"}], skip_reversed=False
+    )
+    updates = test.next_updates(dt_util.now(), 4)
+    test.resolve(hass)
+    assert test.next_updates(dt_util.now(), 4) == updates
+
+
+@pytest.mark.parametrize(
+    ("now", "until", "count"),
+    [
+        (
+            datetime.datetime.fromisoformat("2000-01-01"),
+            datetime.datetime.fromisoformat("2000-01-02 02:00"),
+            6,
+        ),
+        (
+            datetime.datetime(2024, 10, 26, 12, 0, tzinfo=TZ_IL),
+            datetime.datetime(2024, 10, 27, 1, 0, tzinfo=TZ_IL, fold=1),
+            3,
+        ),
+    ],
+    ids=["naive", "fold1"],
+)
+def test_iter_updates(
+    hass: HomeAssistant,
+    now: datetime.datetime,
+    until: datetime.datetime,
+    count: int,
+) -> None:
+    """Test iterating over the updates up to a horizon."""
+    schedule = Schedule(
+        hass,
+        [
+            {CONF_FROM: "01:00", CONF_TO: "01:30"},
+            {CONF_FROM: "03:00", CONF_TO: "04:00"},
+        ],
+        skip_reversed=False,
+    )
+    updates = list(schedule.iter_updates(now, until))
+    assert updates == schedule.next_updates(now, count)
+    assert len(updates) == count
+
+
+@pytest.mark.parametrize("utc", [False, True], ids=["local", "utc"])
+def test_containing_array(hass: HomeAssistant, utc: bool) -> None:  # noqa: FBT001
+    """Test evaluating the schedule over many times."""
+    schedule = Schedule(
+        hass,
+        [
+            {CONF_FROM: "01:30", CONF_TO: "02:30"},
+            {CONF_FROM: "22:00:30", CONF_TO: "00:15"},
+        ],
+        skip_reversed=False,
+    )
+    time_zone = datetime.UTC if utc else dt_util.get_default_time_zone()
+    seconds = [
+        start + offset
+        for start in (
+            datetime.datetime(2024, 12, 31, tzinfo=datetime.UTC).timestamp(),
+            datetime.datetime(2025, 3, 8, tzinfo=datetime.UTC).timestamp(),
+            datetime.datetime(2025, 11, 1, tzinfo=datetime.UTC).timestamp(),
+        )
+        for offset in range(0, 2 * 86400, 7 * 60 + 1)
+    ]
+    dates = [datetime.datetime.fromtimestamp(value, time_zone) for value in seconds]
+    expected = [schedule.containing(date.time()) for date in dates]
+    assert schedule.containing_array(seconds, utc=utc).tolist() == expected
+    assert schedule.containing_array(dates, utc=utc).tolist() == expected
+    if not utc:
+        # Naive datetimes are in the configured time zone (not the OS one).
+        naive = [date.replace(tzinfo=None) for date in dates]
+        assert schedule.containing_array(naive).tolist() == expected
+    assert (
+        schedule.containing_array(
+            np.array(seconds, dtype=np.int64).astype("datetime64[s]"), utc=utc
+        ).tolist()
+        == expected
+    )
+    assert schedule.containing_array([], utc=utc).tolist() == []
+
+
+async def test_containing_array_plans(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test evaluating the schedule over many times uses the plan of each day."""
+    freezer.move_to("2025-03-12T12:00:00+02:00")
+    schedule = Schedule(
+        hass, [{CONF_FROM: SUNRISE_SYMBOL, CONF_TO: SUNSET_SYMBOL}], skip_reversed=False
+    )
+    schedule.resolve(hass)
+    start = dt_util.now().timestamp()
+    seconds = [start + offset for offset in range(0, PLAN_DAYS * 86400, 60)]
+    assert schedule.containing_array(seconds).tolist() == [
+        schedule.containing_at(datetime.datetime.fromtimestamp(value, TZ_IL))
+        for value in seconds
+    ]
+
+
+async def test_planned(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Test planning days which aren't planned (on a copy of the schedule)."""
+    freezer.move_to("2025-03-12T12:00:00+02:00")
+    schedule = Schedule(
+        hass, [{CONF_FROM: SUNRISE_SYMBOL, CONF_TO: SUNSET_SYMBOL}], skip_reversed=False
+    )
+    schedule.resolve(hass)
+    past = datetime.datetime(2025, 1, 1, 6, 20, tzinfo=TZ_IL)
+    assert schedule.containing_at(past)  # Today's sunrise is 05:54.
+
+    planned = schedule.planned(hass, [past.date(), dt_util.now().date()])
+    assert planned is not schedule
+    assert not planned.containing_at(past)  # The sunrise of the day is later.
+    assert schedule.containing_at(past)
+    assert schedule.planned(hass, [dt_util.now().date()]) is schedule
+
+    # The plans are the same for all days of static schedules.
+    static = Schedule(
+        hass, [{CONF_FROM: "06:00", CONF_TO: "17:00"}], skip_reversed=False
+    )
+    assert static.planned(hass, [past.date()]) is static
+
+    seconds = [past.timestamp()]
+    assert schedule.containing_array(seconds).tolist() == [True]
+    assert schedule.containing_array(seconds, hass=hass).tolist() == [False]
+
+
+def test_containing_array_without_numpy(hass: HomeAssistant) -> None:
+    """Test evaluating the schedule over many times without NumPy."""
+    schedule = Schedule(hass, [], skip_reversed=False)
+    with (
+        patch.dict(sys.modules, {"numpy": None}),
+        pytest.raises(IntegrationError, match="NumPy is required"),
+    ):
+        schedule.containing_array([0])
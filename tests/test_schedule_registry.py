@@ -0,0 +1,136 @@
+"""The tests for the compiled schedules registry."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from homeassistant.const import ATTR_ENTITY_ID, Platform
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.daily_schedule.const import (
+    CONF_FROM,
+    CONF_SCHEDULE,
+    CONF_SKIP_REVERSED,
+    CONF_TO,
+    DOMAIN,
+    SERVICE_SET,
+    SUNRISE_SYMBOL,
+)
+from custom_components.daily_schedule.schedule import Schedule
+from custom_components.daily_schedule.schedule_registry import (
+    async_get_schedule_registry,
+    deep_size,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+OFFICE_HOURS = [{CONF_FROM: "09:00:00", CONF_TO: "17:00:00"}]
+NIGHT_TARIFF = [{CONF_FROM: "23:00:00", CONF_TO: "07:00:00"}]
+
+
+async def test_acquire_release(hass: HomeAssistant) -> None:
+    """Test identical static schedules are shared."""
+    registry = async_get_schedule_registry(hass)
+    first, first_compiled = registry.acquire(OFFICE_HOURS, skip_reversed=False)
+    second, second_compiled = registry.acquire(
+        [{CONF_FROM: "09:00", CONF_TO: "17:00"}], skip_reversed=False
+    )
+    other, _ = registry.acquire(NIGHT_TARIFF, skip_reversed=False)
+    skip_reversed, _ = registry.acquire(OFFICE_HOURS, skip_reversed=True)
+    dynamic, dynamic_compiled = registry.acquire(
+        [{CONF_FROM: SUNRISE_SYMBOL, CONF_TO: "17:00:00"}], skip_reversed=False
+    )
+    assert first is second
+    assert first_compiled
+    assert not second_compiled
+    assert dynamic_compiled
+    assert other is not first
+    assert skip_reversed is not first
+    assert (
+        dynamic
+        is not registry.acquire(
+            [{CONF_FROM: SUNRISE_SYMBOL, CONF_TO: "17:00:00"}], skip_reversed=False
+        )[0]
+    )
+    # A compiled schedule is registered as is.
+    compiled = Schedule(hass, NIGHT_TARIFF, skip_reversed=True)
+    assert registry.acquire(compiled, skip_reversed=True) == (compiled, False)
+    assert registry.as_dict() == {
+        "schedules": 4,
+        "users": 5,
+        "hits": 1,
+        "misses": 4,
+        "memory_saved": deep_size(first),
+    }
+
+    registry.release(dynamic)
+    registry.release(second)
+    registry.release(first)
+    registry.release(other)
+    registry.release(skip_reversed)
+    registry.release(compiled)
+    assert registry.as_dict() == {
+        "schedules": 0,
+        "users": 0,
+        "hits": 1,
+        "misses": 4,
+        "memory_saved": 0,
+    }
+
+
+async def test_compiled_once(hass: HomeAssistant) -> None:
+    """Test an identical schedule is not compiled again."""
+    registry = async_get_schedule_registry(hass)
+    with patch.object(
+        Schedule, "__init__", autospec=True, side_effect=Schedule.__init__
+    ) as compile_schedule:
+        first, _ = registry.acquire(OFFICE_HOURS, skip_reversed=False)
+        second, _ = registry.acquire(
+            [{CONF_FROM: "09:00", CONF_TO: "17:00:00"}], skip_reversed=False
+        )
+    assert first is second
+    assert compile_schedule.call_count == 1
+    registry.release(first)
+    registry.release(second)
+
+
+async def test_entities(hass: HomeAssistant) -> None:
+    """Test entities share the schedule and release it."""
+    config_entries = []
+    for index in range(3):
+        config_entry = MockConfigEntry(
+            options={CONF_SCHEDULE: OFFICE_HOURS, CONF_SKIP_REVERSED: False},
+            domain=DOMAIN,
+            title=f"test {index}",
+        )
+        config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        config_entries.append(config_entry)
+    await hass.async_block_till_done()
+    registry = async_get_schedule_registry(hass)
+    assert registry.as_dict()["schedules"] == 1
+    assert registry.as_dict()["users"] == 3
+    assert registry.as_dict()["memory_saved"] > 0
+    # Only the first entity compiled the schedule.
+    assert [
+        config_entry.runtime_data.entity.stats.compilations
+        for config_entry in config_entries
+    ] == [1, 0, 0]
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET,
+        {CONF_SCHEDULE: NIGHT_TARIFF},
+        target={ATTR_ENTITY_ID: f"{Platform.BINARY_SENSOR}.test_0"},
+    )
+    await hass.async_block_till_done()
+    assert registry.as_dict()["schedules"] == 2
+    assert registry.as_dict()["users"] == 3
+
+    for config_entry in config_entries:
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert registry.as_dict()["schedules"] == 0
+    assert registry.as_dict()["users"] == 0
@@ -0,0 +1,61 @@
+"""The tests for the schedules store."""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Any
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.daily_schedule.const import (
+    CONF_FROM,
+    CONF_TO,
+    DOMAIN,
+    SAVE_DELAY,
+)
+from custom_components.daily_schedule.schedule_store import (
+    STORAGE_VERSION,
+    async_get_schedule_store,
+)
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+SCHEDULE = [{CONF_FROM: "09:00:00", CONF_TO: "17:00:00"}]
+
+
+async def test_load(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test loading the stored schedules."""
+    hass_storage[DOMAIN] = {
+        "version": STORAGE_VERSION,
+        "key": DOMAIN,
+        "data": {"schedules": {"1234": SCHEDULE}},
+    }
+    store = await async_get_schedule_store(hass)
+    assert store is await async_get_schedule_store(hass)
+    assert store.get("1234") == SCHEDULE
+    assert store.get("5678") == []
+    assert store.as_dict() == {"schedules": 1, "saves": 0}
+
+
+async def test_set_remove(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test saving and removing schedules."""
+    store = await async_get_schedule_store(hass)
+    await store.async_set("1234", SCHEDULE, delay=False)
+    assert hass_storage[DOMAIN]["data"]["schedules"] == {"1234": SCHEDULE}
+
+    await store.async_set("5678", SCHEDULE)
+    store.async_remove("1234")
+    store.async_remove("unknown")
+    assert hass_storage[DOMAIN]["data"]["schedules"] == {"1234": SCHEDULE}
+
+    freezer.tick(datetime.timedelta(seconds=SAVE_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[DOMAIN]["data"]["schedules"] == {"5678": SCHEDULE}
+    assert store.as_dict() == {"schedules": 1, "saves": 2}
@@ -0,0 +1,222 @@
+"""The tests for the shared toggle scheduler."""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+import homeassistant.util.dt as dt_util
+import pytest
+from homeassistant.exceptions import IntegrationError
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.daily_schedule.const import CONF_FROM, CONF_TO
+from custom_components.daily_schedule.scheduler import async_get_scheduler
+
+from .helpers import setup_entity
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+MINUTE = datetime.timedelta(minutes=1)
+
+
+def recorder(calls: list[str], name: str) -> Callable[[datetime.datetime], None]:
+    """Return an action which records its name when called."""
+
+    def action(_: datetime.datetime) -> None:
+        calls.append(name)
+
+    return action
+
+
+async def fire(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, delta: datetime.timedelta
+) -> None:
+    """Move the time forward and fire the timers."""
+    freezer.tick(delta)
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+
+
+async def test_shared_timer(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a single timer for actions with the same point in time."""
+    freezer.move_to("2025-03-12T00:00:00+00:00")
+    scheduler = async_get_scheduler(hass)
+    calls: list[str] = []
+    for name in ("a", "b", "c"):
+        scheduler.async_schedule(dt_util.utcnow() + MINUTE, recorder(calls, name))
+    assert scheduler.as_dict() == {
+        "pending": 3,
+        "pending_instants": 1,
+        "scheduled": 3,
+        "timers": 1,
+        "wakeups": 0,
+        "dispatched": 0,
+        "batched_writes": 0,
+        "coalesced_writes": 0,
+        "handles_saved": 2,
+    }
+
+    await fire(hass, freezer, MINUTE)
+    assert calls == ["a", "b", "c"]
+    assert scheduler.as_dict() == {
+        "pending": 0,
+        "pending_instants": 0,
+        "scheduled": 3,
+        "timers": 1,
+        "wakeups": 1,
+        "dispatched": 3,
+        "batched_writes": 0,
+        "coalesced_writes": 0,
+        "handles_saved": 2,
+    }
+
+
+@pytest.mark.allowed_logs(["Error while dispatching a daily schedule toggle"])
+async def test_failing_action(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a failing action doesn't stop the other actions and the timer."""
+    freezer.move_to("2025-03-12T00:00:00+00:00")
+    scheduler = async_get_scheduler(hass)
+    calls: list[str] = []
+
+    def failing(_: datetime.datetime) -> None:
+        error_message = "failure"
+        raise IntegrationError(error_message)
+
+    scheduler.async_schedule(dt_util.utcnow() + MINUTE, recorder(calls, "a"))
+    scheduler.async_schedule(dt_util.utcnow() + MINUTE, failing)
+    scheduler.async_schedule(dt_util.utcnow() + MINUTE, recorder(calls, "b"))
+    scheduler.async_schedule(dt_util.utcnow() + 2 * MINUTE, recorder(calls, "c"))
+    await fire(hass, freezer, MINUTE)
+    assert calls == ["a", "b"]
+    assert "Error while dispatching a daily schedule toggle" in caplog.text
+
+    await fire(hass, freezer, MINUTE)
+    assert calls == ["a", "b", "c"]
+    assert scheduler.as_dict()["wakeups"] == 2
+
+
+async def test_earlier_instant(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the timer is moved to an earlier instant and back."""
+    freezer.move_to("2025-03-12T00:00:00+00:00")
+    scheduler = async_get_scheduler(hass)
+    calls: list[str] = []
+    scheduler.async_schedule(dt_util.utcnow() + 2 * MINUTE, recorder(calls, "later"))
+    cancel = scheduler.async_schedule(
+        dt_util.utcnow() + MINUTE, recorder(calls, "earlier")
+    )
+    assert scheduler.as_dict()["timers"] == 2
+
+    cancel()
+    cancel()
+    assert scheduler.as_dict()["timers"] == 3
+    assert scheduler.as_dict()["pending"] == 1
+
+    await fire(hass, freezer, MINUTE)
+    assert calls == []
+    await fire(hass, freezer, MINUTE)
+    assert calls == ["later"]
+
+
+async def test_cancel(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Test cancelling actions which are not the earliest, and all actions."""
+    freezer.move_to("2025-03-12T00:00:00+00:00")
+    scheduler = async_get_scheduler(hass)
+    calls: list[str] = []
+    scheduler.async_schedule(dt_util.utcnow() + MINUTE, recorder(calls, "a"))
+    cancel_b = scheduler.async_schedule(dt_util.utcnow() + MINUTE, recorder(calls, "b"))
+    cancel_c = scheduler.async_schedule(
+        dt_util.utcnow() + 2 * MINUTE, recorder(calls, "c")
+    )
+    cancel_b()
+    cancel_c()
+    assert scheduler.as_dict()["timers"] == 1
+
+    await fire(hass, freezer, 3 * MINUTE)
+    assert calls == ["a"]
+    assert scheduler.as_dict()["pending"] == 0
+
+    cancel_d = scheduler.async_schedule(dt_util.utcnow() + MINUTE, recorder(calls, "d"))
+    cancel_d()
+    await fire(hass, freezer, MINUTE)
+    assert calls == ["a"]
+
+
+async def test_schedule_while_dispatching(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test an action scheduling the next action."""
+    freezer.move_to("2025-03-12T00:00:00+00:00")
+    scheduler = async_get_scheduler(hass)
+    calls: list[datetime.datetime] = []
+    cancels: list[Callable[[], None]] = []
+
+    def action(now: datetime.datetime) -> None:
+        calls.append(now)
+        cancels.append(scheduler.async_schedule(now + MINUTE, action))
+
+    start = dt_util.utcnow()
+    scheduler.async_schedule(start + MINUTE, action)
+    await fire(hass, freezer, MINUTE)
+    await fire(hass, freezer, MINUTE)
+    assert calls == [start + MINUTE, start + 2 * MINUTE]
+    assert scheduler.as_dict()["wakeups"] == 2
+    assert scheduler.as_dict()["pending"] == 1
+    cancels[-1]()
+
+
+async def test_writes(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Test the writes of actions due at the same tick are flushed together."""
+    freezer.move_to("2025-03-12T00:00:00+00:00")
+    scheduler = async_get_scheduler(hass)
+    calls: list[str] = []
+
+    def action(name: str, writes: int) -> Callable[[datetime.datetime], None]:
+        def compute(_: datetime.datetime) -> None:
+            calls.append(f"compute {name}")
+            for _ in range(writes):
+                scheduler.async_write(write)
+
+        def write() -> None:
+            calls.append(f"write {name}")
+
+        return compute
+
+    scheduler.async_schedule(dt_util.utcnow() + MINUTE, action("a", 2))
+    scheduler.async_schedule(dt_util.utcnow() + MINUTE, action("b", 1))
+    await fire(hass, freezer, MINUTE)
+    # The 2 writes of "a" are coalesced.
+    assert calls == ["compute a", "compute b", "write a", "write b"]
+    assert scheduler.as_dict()["batched_writes"] == 2
+    assert scheduler.as_dict()["coalesced_writes"] == 1
+
+    # Writes outside of a dispatch are immediate.
+    scheduler.async_write(lambda: calls.append("immediate"))
+    assert calls[-1] == "immediate"
+
+
+async def test_entities_share_timer(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test entities toggling at the same time share the timer."""
+    freezer.move_to("2025-03-12T00:00:00+02:00")
+    for _ in range(3):
+        await setup_entity(hass, [{CONF_FROM: "07:00", CONF_TO: "22:00"}])
+    assert async_get_scheduler(hass).as_dict()["pending"] == 3
+    assert async_get_scheduler(hass).as_dict()["pending_instants"] == 1
+    assert async_get_scheduler(hass).as_dict()["timers"] == 1
+    for config_entry in hass.config_entries.async_entries():
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
+    assert async_get_scheduler(hass).as_dict()["pending"] == 0
@@ -0,0 +1,447 @@
+"""The tests for the integration-wide services."""
+
+from __future__ import annotations
+
+import datetime
+import sys
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import homeassistant.util.dt as dt_util
+import pytest
+import voluptuous as vol
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SUN_EVENT_SUNRISE,
+    SUN_EVENT_SUNSET,
+    Platform,
+)
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.sun import get_astral_event_date
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.daily_schedule.binary_sensor import DailyScheduleSensor
+from custom_components.daily_schedule.const import (
+    ATTR_ERROR,
+    ATTR_INTERVALS,
+    ATTR_RESULTS,
+    ATTR_STATES,
+    ATTR_SUCCESS,
+    CONF_DELAYED_SAVE,
+    CONF_END,
+    CONF_FROM,
+    CONF_SCHEDULE,
+    CONF_SCHEDULES,
+    CONF_START,
+    CONF_TIMES,
+    CONF_TO,
+    CONF_UTC,
+    DOMAIN,
+    SAVE_DELAY,
+    SERVICE_QUERY,
+    SERVICE_SET_MANY,
+    SUNRISE_SYMBOL,
+    SUNSET_SYMBOL,
+)
+from custom_components.daily_schedule.schedule_store import async_get_schedule_store
+
+from .helpers import ENTITY_ID, setup_entity
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+LOCAL = f"{Platform.BINARY_SENSOR}.local"
+UTC = f"{Platform.BINARY_SENSOR}.utc"
+UNKNOWN = f"{Platform.BINARY_SENSOR}.unknown"
+
+
+async def setup_query_entities(hass: HomeAssistant) -> None:
+    """Create a local and a UTC entity, both on between 09:00 and 17:00."""
+    for name, utc in (("local", False), ("utc", True)):
+        config_entry = MockConfigEntry(
+            options={
+                CONF_SCHEDULE: [{CONF_FROM: "09:00", CONF_TO: "17:00"}],
+                CONF_UTC: utc,
+            },
+            domain=DOMAIN,
+            title=name,
+        )
+        config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def query(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+    """Call the query action and return its results."""
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_QUERY,
+        {ATTR_ENTITY_ID: [LOCAL, UTC, UNKNOWN], **data},
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    results = response[ATTR_RESULTS]
+    assert results[UNKNOWN][ATTR_SUCCESS] is False
+    assert results[UNKNOWN][ATTR_ERROR]
+    return results
+
+
+async def test_set_many(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test setting the schedules of many entities at once."""
+    config_entries = []
+    for index in range(3):
+        config_entry = MockConfigEntry(
+            options={CONF_SCHEDULE: [], CONF_UTC: True},
+            domain=DOMAIN,
+            title=f"test {index}",
+        )
+        config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        config_entries.append(config_entry)
+    await hass.async_block_till_done()
+    unloaded = config_entries.pop()
+    assert await hass.config_entries.async_unload(unloaded.entry_id)
+    await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_MANY,
+        {
+            CONF_SCHEDULES: {
+                f"{Platform.BINARY_SENSOR}.test_0": [
+                    {CONF_FROM: "09:00", CONF_TO: "17:00"}
+                ],
+                f"{Platform.BINARY_SENSOR}.test_1": {
+                    CONF_FROM: "23:00",
+                    CONF_TO: "07:00",
+                },
+                f"{Platform.BINARY_SENSOR}.test_2": [],
+                f"{Platform.BINARY_SENSOR}.invalid": [{CONF_FROM: "a", CONF_TO: "b"}],
+                f"{Platform.BINARY_SENSOR}.unknown": [],
+            }
+        },
+        blocking=True,
+        return_response=True,
+    )
+    await hass.async_block_till_done()
+    assert response is not None
+    results = response[ATTR_RESULTS]
+    assert results[f"{Platform.BINARY_SENSOR}.test_0"] == {ATTR_SUCCESS: True}
+    assert results[f"{Platform.BINARY_SENSOR}.test_1"] == {ATTR_SUCCESS: True}
+    for entity in ("test_2", "invalid", "unknown"):
+        assert results[f"{Platform.BINARY_SENSOR}.{entity}"][ATTR_SUCCESS] is False
+        assert results[f"{Platform.BINARY_SENSOR}.{entity}"][ATTR_ERROR]
+
+    freezer.tick(datetime.timedelta(seconds=SAVE_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    schedules = hass_storage[DOMAIN]["data"]["schedules"]
+    assert schedules[config_entries[0].entry_id] == [
+        {CONF_FROM: "09:00:00", CONF_TO: "17:00:00"}
+    ]
+    assert schedules[config_entries[1].entry_id] == [
+        {CONF_FROM: "23:00:00", CONF_TO: "07:00:00"}
+    ]
+    assert schedules[unloaded.entry_id] == []
+    assert config_entries[0].options == {CONF_UTC: True}
+    state = hass.states.get(f"{Platform.BINARY_SENSOR}.test_0")
+    assert state
+    assert state.attributes[CONF_SCHEDULE] == [
+        {CONF_FROM: "09:00:00", CONF_TO: "17:00:00"}
+    ]
+
+    for config_entry in config_entries:
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_set_many_batch(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test unchanged schedules are skipped, and the others are saved together."""
+    schedule = [{CONF_FROM: "09:00:00", CONF_TO: "17:00:00"}]
+    config_entries = []
+    for index in range(3):
+        config_entry = MockConfigEntry(
+            # The first entity is saved immediately.
+            options={CONF_SCHEDULE: schedule, CONF_DELAYED_SAVE: index != 0},
+            domain=DOMAIN,
+            title=f"test {index}",
+        )
+        config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        config_entries.append(config_entry)
+    await hass.async_block_till_done()
+    store = await async_get_schedule_store(hass)
+    saves = store.as_dict()["saves"]
+
+    new_schedule = [{CONF_FROM: "08:00:00", CONF_TO: "17:00:00"}]
+    with patch.object(
+        DailyScheduleSensor,
+        "config_update",
+        autospec=True,
+        side_effect=DailyScheduleSensor.config_update,
+    ) as config_update:
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_MANY,
+            {
+                CONF_SCHEDULES: {
+                    f"{Platform.BINARY_SENSOR}.test_0": new_schedule,
+                    f"{Platform.BINARY_SENSOR}.test_1": new_schedule,
+                    f"{Platform.BINARY_SENSOR}.test_2": schedule,
+                }
+            },
+            blocking=True,
+            return_response=True,
+        )
+        await hass.async_block_till_done()
+
+    assert response is not None
+    assert all(
+        result == {ATTR_SUCCESS: True} for result in response[ATTR_RESULTS].values()
+    )
+    # The unchanged schedule is skipped.
+    assert config_update.call_count == 2
+    # Both changes are saved together.
+    assert store.as_dict()["saves"] == saves + 1
+    assert hass_storage[DOMAIN]["data"]["schedules"] == {
+        config_entries[0].entry_id: new_schedule,
+        config_entries[1].entry_id: new_schedule,
+        config_entries[2].entry_id: schedule,
+    }
+
+    for config_entry in config_entries:
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_disabled_entity(hass: HomeAssistant) -> None:
+    """Test the actions and option updates of a disabled (never added) entity."""
+    entity_id = f"{Platform.BINARY_SENSOR}.disabled"
+    config_entry = MockConfigEntry(
+        options={CONF_SCHEDULE: []}, domain=DOMAIN, title="disabled"
+    )
+    config_entry.add_to_hass(hass)
+    er.async_get(hass).async_get_or_create(
+        Platform.BINARY_SENSOR,
+        DOMAIN,
+        config_entry.entry_id,
+        config_entry=config_entry,
+        suggested_object_id="disabled",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id) is None
+
+    # The schedule is stored, and is read when the entity is enabled.
+    schedule = [{CONF_FROM: "09:00:00", CONF_TO: "17:00:00"}]
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_MANY,
+        {CONF_SCHEDULES: {entity_id: schedule}},
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {ATTR_RESULTS: {entity_id: {ATTR_SUCCESS: True}}}
+    assert (await async_get_schedule_store(hass)).get(config_entry.entry_id) == schedule
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_QUERY,
+        {ATTR_ENTITY_ID: entity_id, CONF_TIMES: ["2025-03-12T10:00:00"]},
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    assert response[ATTR_RESULTS][entity_id][ATTR_SUCCESS] is False
+
+    hass.config_entries.async_update_entry(config_entry, options={CONF_UTC: True})
+    await hass.async_block_till_done()
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize("numpy", [True, False], ids=["numpy", "no numpy"])
+async def test_query_times(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    numpy: bool,  # noqa: FBT001
+) -> None:
+    """Test evaluating the schedules at many times (with or without NumPy)."""
+    freezer.move_to("2025-03-12T12:00:00+02:00")
+    await setup_query_entities(hass)
+    with patch.dict(sys.modules, {} if numpy else {"numpy": None}):
+        results = await query(
+            hass,
+            {
+                CONF_TIMES: [
+                    "2025-03-11T09:30:00",  # Local.
+                    "2025-03-11T17:30:00+00:00",
+                    "2025-12-31T10:00:00+02:00",
+                    "2025-12-31T18:00:00+02:00",
+                ]
+            },
+        )
+    assert results[LOCAL] == {
+        ATTR_SUCCESS: True,
+        ATTR_STATES: [True, False, True, False],
+    }
+    assert results[UTC] == {
+        ATTR_SUCCESS: True,
+        ATTR_STATES: [False, False, False, True],
+    }
+
+
+async def test_query_window(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the on intervals of the schedules inside a window."""
+    freezer.move_to("2025-03-12T12:00:00+02:00")
+    await setup_query_entities(hass)
+    results = await query(
+        hass,
+        {CONF_START: "2025-03-12T10:00:00", CONF_END: "2025-03-14T00:00:00+02:00"},
+    )
+    assert results[LOCAL] == {
+        ATTR_SUCCESS: True,
+        ATTR_INTERVALS: [
+            {
+                CONF_FROM: "2025-03-12T10:00:00+02:00",
+                CONF_TO: "2025-03-12T17:00:00+02:00",
+            },
+            {
+                CONF_FROM: "2025-03-13T09:00:00+02:00",
+                CONF_TO: "2025-03-13T17:00:00+02:00",
+            },
+        ],
+    }
+    assert results[UTC] == {
+        ATTR_SUCCESS: True,
+        ATTR_INTERVALS: [
+            {
+                CONF_FROM: "2025-03-12T09:00:00+00:00",
+                CONF_TO: "2025-03-12T17:00:00+00:00",
+            },
+            {
+                CONF_FROM: "2025-03-13T09:00:00+00:00",
+                CONF_TO: "2025-03-13T17:00:00+00:00",
+            },
+        ],
+    }
+
+
+@pytest.mark.parametrize("numpy", [True, False], ids=["numpy", "no numpy"])
+async def test_query_sun(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    numpy: bool,  # noqa: FBT001
+) -> None:
+    """Test the sunrise and sunset times are of each queried day (also past ones)."""
+    freezer.move_to("2025-03-12T12:00:00+02:00")
+    await setup_entity(hass, [{CONF_FROM: SUNRISE_SYMBOL, CONF_TO: SUNSET_SYMBOL}])
+    with patch.dict(sys.modules, {} if numpy else {"numpy": None}):
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_QUERY,
+            {
+                ATTR_ENTITY_ID: ENTITY_ID,
+                CONF_TIMES: [
+                    # Today's sunrise is 05:54 and sunset is 17:46.
+                    "2025-01-01T06:20:00",
+                    "2025-01-01T17:20:00",
+                    "2025-03-13T06:00:00",
+                    "2025-06-21T05:40:00",
+                    "2025-06-21T19:00:00",
+                ],
+            },
+            blocking=True,
+            return_response=True,
+        )
+    assert response is not None
+    assert response[ATTR_RESULTS][ENTITY_ID] == {
+        ATTR_SUCCESS: True,
+        ATTR_STATES: [False, False, True, True, True],
+    }
+
+
+async def test_query_sun_window(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the on intervals of a sunrise to sunset schedule in the past."""
+    freezer.move_to("2025-03-12T12:00:00+02:00")
+    await setup_entity(hass, [{CONF_FROM: SUNRISE_SYMBOL, CONF_TO: SUNSET_SYMBOL}])
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_QUERY,
+        {
+            ATTR_ENTITY_ID: ENTITY_ID,
+            CONF_START: "2025-01-01T00:00:00",
+            CONF_END: "2025-01-03T12:00:00",
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+
+    def sun(event: str, day: int) -> str:
+        date = get_astral_event_date(hass, event, datetime.date(2025, 1, day))
+        assert date is not None
+        return dt_util.as_local(date).replace(microsecond=0).isoformat()
+
+    assert response[ATTR_RESULTS][ENTITY_ID] == {
+        ATTR_SUCCESS: True,
+        ATTR_INTERVALS: [
+            {
+                CONF_FROM: sun(SUN_EVENT_SUNRISE, day),
+                CONF_TO: sun(SUN_EVENT_SUNSET, day),
+            }
+            for day in (1, 2)
+        ]
+        + [
+            # The window ends while it's on.
+            {
+                CONF_FROM: sun(SUN_EVENT_SUNRISE, 3),
+                CONF_TO: "2025-01-03T12:00:00+02:00",
+            }
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {CONF_START: "2025-03-12T00:00:00"},
+        {CONF_START: "2025-03-12T00:00:00", CONF_END: "2025-03-12T00:00:00"},
+        {CONF_START: "2025-03-12T00:00:00", CONF_END: "2026-03-14T00:00:00"},
+        {
+            CONF_TIMES: ["2025-03-12T00:00:00"],
+            CONF_START: "2025-03-12T00:00:00",
+            CONF_END: "2025-03-13T00:00:00",
+        },
+    ],
+    ids=["nothing", "no end", "empty window", "long window", "times and window"],
+)
+async def test_query_invalid(hass: HomeAssistant, data: dict[str, Any]) -> None:
+    """Test the query action rejects invalid times and windows."""
+    await setup_query_entities(hass)
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_QUERY,
+            {ATTR_ENTITY_ID: LOCAL, **data},
+            blocking=True,
+            return_response=True,
+        )
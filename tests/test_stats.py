@@ -0,0 +1,108 @@
+"""The tests for the entities instrumentation."""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+import homeassistant.util.dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.daily_schedule.const import (
+    CONF_FROM,
+    CONF_SCHEDULE,
+    CONF_TO,
+    DOMAIN,
+    SUNRISE_SYMBOL,
+)
+from custom_components.daily_schedule.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.daily_schedule.stats import EntityStats, aggregate
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+
+async def add_entry(
+    hass: HomeAssistant, title: str, schedule: list[dict[str, str]]
+) -> MockConfigEntry:
+    """Add and set up a config entry."""
+    config_entry = MockConfigEntry(
+        options={CONF_SCHEDULE: schedule}, domain=DOMAIN, title=title
+    )
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    return config_entry
+
+
+async def test_entity_stats(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the counters of the entities and their aggregate."""
+    freezer.move_to("2025-03-12T06:59:00+02:00")
+    static = await add_entry(hass, "static", [{CONF_FROM: "07:00", CONF_TO: "22:00"}])
+    dynamic = await add_entry(
+        hass, "dynamic", [{CONF_FROM: SUNRISE_SYMBOL, CONF_TO: "22:00"}]
+    )
+    stats = static.runtime_data.entity.stats
+    assert (stats.updates, stats.compilations, stats.timer_reschedules) == (1, 1, 1)
+    assert stats.sun_resolutions == 0
+    assert stats.last_toggle_latency is None
+    dynamic_stats = dynamic.runtime_data.entity.stats
+    assert dynamic_stats.sun_resolutions == 1
+    assert dynamic_stats.compilations == 2
+
+    # The timer fires 2 seconds late.
+    freezer.tick(datetime.timedelta(minutes=1, seconds=2))
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+    assert stats.updates == 2
+    assert stats.timer_reschedules == 2
+    assert stats.last_toggle_latency == 2.0
+
+    data = await async_get_config_entry_diagnostics(hass, static)
+    assert data["entity"] == stats.as_dict()
+    assert data["entity"]["last_toggle_latency_ms"] == 2000.0
+    assert data["entities"]["entities"] == 2
+    assert data["entities"]["updates"] == 3
+    assert data["entities"]["sun_resolutions"] == 1
+    assert data["entities"]["last_toggle_latency_ms"] == 2000.0
+
+    assert await hass.config_entries.async_unload(static.entry_id)
+    await hass.async_block_till_done()
+    data = await async_get_config_entry_diagnostics(hass, static)
+    assert data["entity"] is None
+    assert data["entities"]["entities"] == 1
+    assert data["entities"]["last_toggle_latency_ms"] is None
+
+    assert await hass.config_entries.async_unload(dynamic.entry_id)
+    await hass.async_block_till_done()
+
+
+def test_aggregate() -> None:
+    """Test aggregating the counters."""
+    first = EntityStats()
+    first.add_update(0.002)
+    first.add_compilation(0.001)
+    first.last_toggle_latency = 0.5
+    second = EntityStats()
+    second.add_update(0.004)
+    second.add_update(0.001)
+    second.last_toggle_latency = 0.25
+    assert aggregate([first, second]) == {
+        "entities": 2,
+        "updates": 3,
+        "update_time_ms": 7.0,
+        "max_update_time_ms": 4.0,
+        "compilations": 1,
+        "compile_time_ms": 1.0,
+        "sun_resolutions": 0,
+        "timer_reschedules": 0,
+        "last_toggle_latency_ms": 500.0,
+    }
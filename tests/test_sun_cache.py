@@ -0,0 +1,70 @@
+"""The tests for the sunrise and sunset cache."""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+from custom_components.daily_schedule.const import (
+    CONF_FROM,
+    CONF_TO,
+    SUNRISE_SYMBOL,
+    SUNSET_SYMBOL,
+)
+from custom_components.daily_schedule.schedule import Schedule
+from custom_components.daily_schedule.sun_cache import async_get_sun_cache
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+
+async def test_shared_events(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test each event is computed once per day."""
+    freezer.move_to("2025-03-12T00:00:00+02:00")
+    schedule = [
+        {CONF_FROM: SUNRISE_SYMBOL, CONF_TO: SUNSET_SYMBOL},
+        {CONF_FROM: "↑+10", CONF_TO: "↓-10"},
+    ]
+    Schedule(hass, schedule, skip_reversed=False)
+    Schedule(hass, schedule, skip_reversed=False)
+    assert async_get_sun_cache(hass).as_dict() == {
+        "size": 2,
+        "hits": 6,
+        "misses": 2,
+        "invalidations": 0,
+    }
+
+    # Entries of previous days are dropped.
+    freezer.tick(datetime.timedelta(days=1))
+    assert Schedule(hass, schedule, skip_reversed=False).to_list_absolute() == [
+        {CONF_FROM: "05:53:21", CONF_TO: "17:46:53"}
+    ]
+    assert async_get_sun_cache(hass).as_dict() == {
+        "size": 2,
+        "hits": 8,
+        "misses": 4,
+        "invalidations": 0,
+    }
+
+
+async def test_location_change(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the cache is invalidated when the location is changed."""
+    freezer.move_to("2025-03-12T00:00:00+02:00")
+    schedule = [{CONF_FROM: SUNRISE_SYMBOL, CONF_TO: SUNSET_SYMBOL}]
+    assert Schedule(hass, schedule, skip_reversed=False).to_list_absolute() == [
+        {CONF_FROM: "05:54:37", CONF_TO: "17:46:10"}
+    ]
+
+    await hass.config.async_update(latitude=31.0, longitude=35.0)
+    await hass.async_block_till_done()
+    assert async_get_sun_cache(hass).as_dict()["size"] == 0
+    assert async_get_sun_cache(hass).as_dict()["invalidations"] == 1
+    assert Schedule(hass, schedule, skip_reversed=False).to_list_absolute() != [
+        {CONF_FROM: "05:54:37", CONF_TO: "17:46:10"}
+    ]
+    assert async_get_sun_cache(hass).as_dict()["misses"] == 4
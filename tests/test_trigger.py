@@ -19,6 +19,7 @@ from custom_components.daily_schedule.trigger import TRIGGERS, async_get_trigger
 from tests.helpers import ENTITY_ID, setup_entity
 
 if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
     from homeassistant.core import HomeAssistant
 
 
@@ -152,3 +153,144 @@ async def test_ignores_unavailable_and_unknown_from_state(
     hass.states.async_set(ENTITY_ID, "on")
     await hass.async_block_till_done()
     assert len(calls) == 0
+
+
+@patch("homeassistant.util.dt.now")
+async def test_scheduled_on_and_off(mock_now: Mock, hass: HomeAssistant) -> None:
+    """Test the schedule-driven triggers fire at the toggles, not on state changes."""
+    mock_now.return_value = datetime.datetime.fromisoformat("2000-01-01 23:45:00")
+    await setup_entity(hass, [{CONF_FROM: "23:50:00", CONF_TO: "23:55:00"}])
+
+    on_calls = async_mock_service(hass, "test", "scheduled_on")
+    off_calls = async_mock_service(hass, "test", "scheduled_off")
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": [
+                {
+                    "trigger": [
+                        {
+                            "platform": f"{DOMAIN}.scheduled_on",
+                            "target": {"entity_id": ENTITY_ID},
+                        }
+                    ],
+                    "action": [
+                        {
+                            "service": "test.scheduled_on",
+                            "data": {"toggle": "{{ trigger.toggle }}"},
+                        }
+                    ],
+                },
+                {
+                    "trigger": [
+                        {
+                            "platform": f"{DOMAIN}.scheduled_off",
+                            "target": {"entity_id": ENTITY_ID},
+                        }
+                    ],
+                    "action": [{"service": "test.scheduled_off"}],
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    # A state change which isn't a toggle of the schedule.
+    hass.states.async_set(ENTITY_ID, "on")
+    await hass.async_block_till_done()
+    assert len(on_calls) == 0
+
+    # 23:50 (on) -> 23:55 (off)
+    for _ in range(2):
+        mock_now.return_value += datetime.timedelta(minutes=5)
+        async_fire_time_changed(hass, mock_now.return_value)
+        await hass.async_block_till_done()
+
+    assert len(on_calls) == 1
+    assert on_calls[0].data["toggle"].startswith("2000-01-01 23:50:00")
+    assert len(off_calls) == 1
+
+
+async def test_scheduled_offsets(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the schedule-driven triggers fire before and after the toggles."""
+    freezer.move_to("2000-01-01T23:40:00+02:00")
+    await setup_entity(hass, [{CONF_FROM: "23:50:00", CONF_TO: "23:55:00"}])
+
+    before_calls = async_mock_service(hass, "test", "before")
+    after_calls = async_mock_service(hass, "test", "after")
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": [
+                {
+                    "trigger": [
+                        {
+                            "platform": f"{DOMAIN}.scheduled_on",
+                            "target": {"entity_id": ENTITY_ID},
+                            "options": {"offset": "-00:05:00"},
+                        }
+                    ],
+                    "action": [{"service": "test.before"}],
+                },
+                {
+                    "trigger": [
+                        {
+                            "platform": f"{DOMAIN}.scheduled_off",
+                            "target": {"entity_id": ENTITY_ID},
+                            "options": {"offset": "00:02:00"},
+                        }
+                    ],
+                    "action": [{"service": "test.after"}],
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    for time, before, after in (
+        ("23:45:00", 1, 0),  # 5 minutes before "on"
+        ("23:50:00", 1, 0),
+        ("23:55:00", 1, 0),
+        ("23:57:00", 1, 1),  # 2 minutes after "off"
+    ):
+        freezer.move_to(f"2000-01-01T{time}+02:00")
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert (len(before_calls), len(after_calls)) == (before, after)
+
+
+async def test_scheduled_offset_before_setup(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test an offset trigger which is attached before the entity is set up."""
+    freezer.move_to("2000-01-01T23:40:00+02:00")
+    calls = async_mock_service(hass, "test", "before")
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": [
+                {
+                    "trigger": [
+                        {
+                            "platform": f"{DOMAIN}.scheduled_on",
+                            "target": {"entity_id": ENTITY_ID},
+                            "options": {"offset": "-00:05:00"},
+                        }
+                    ],
+                    "action": [{"service": "test.before"}],
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+    await setup_entity(hass, [{CONF_FROM: "23:50:00", CONF_TO: "23:55:00"}])
+
+    freezer.move_to("2000-01-01T23:45:00+02:00")
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(calls) == 1